@@ -16,6 +16,7 @@ from aurras.utils.console import console
 from aurras.core.settings import SETTINGS
 from aurras.utils.logger import get_logger
 from aurras.utils.path_manager import _path_manager
+from aurras.utils.db_connection import DatabaseConnectionManager
 
 from aurras.core.backup.storage import LocalStorageBackend
 from aurras.core.backup.utils import create_backup_id, get_readable_size
@@ -267,6 +268,9 @@ class BackupManager:
 
             metadata["items"][item_name] = is_enabled
 
+        # Fold the write-ahead logs into the database files before copying them
+        DatabaseConnectionManager.checkpoint_all()
+
         success = self.storage.save_backup(backup_id, files_to_backup, metadata)
 
         if success:
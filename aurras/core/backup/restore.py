@@ -5,14 +5,14 @@ This module provides the restoration functionality for Aurras backups,
 including both standard restoration and smart media restoration.
 """
 
-import time
 import shutil
-import sqlite3
 from pathlib import Path
 
 from aurras.utils.console import console
 from aurras.utils.logger import get_logger
 from aurras.utils.path_manager import _path_manager
+from aurras.utils.db_connection import DatabaseConnectionManager
+from aurras.core.library import DownloadLibrary
 from aurras.core.backup.manager import (
     BACKUP_SETTINGS,
     BackupItems,
@@ -109,8 +109,9 @@ class RestoreManager:
                     console.print_success("Custom themes restored")
                     restoration_result["restored_items"]["themes"] = True
 
-            # Close any open database connections before restoring
-            time.sleep(0.5)
+            # Close any open database connections before restoring, so their
+            # write-ahead logs are checkpointed and not replayed onto the copies
+            DatabaseConnectionManager.close_all()
 
             # Restore history database
             if items.get(BackupItems.HISTORY.value, False):
@@ -213,37 +214,11 @@ class RestoreManager:
         Returns:
             list: List of missing download items
         """
-        missing_downloads = []
-
         try:
-            # Connect to the downloads database
-            conn = sqlite3.connect(_path_manager.downloads_db)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            # Query for all downloaded items
-            cursor.execute("SELECT * FROM downloads WHERE status='completed'")
-            downloads = cursor.fetchall()
-
-            for download in downloads:
-                local_path = Path(download["local_path"])
-
-                # Check if the file exists
-                if not local_path.exists():
-                    missing_downloads.append(
-                        {
-                            "id": download["id"],
-                            "title": download["title"],
-                            "artist": download["artist"],
-                            "source_url": download["source_url"],
-                            "local_path": download["local_path"],
-                            "playlist_id": download.get("playlist_id"),
-                        }
-                    )
-
-            conn.close()
-
-            return missing_downloads
+            # A rescan only stats the files; unchanged ones aren't read again
+            library = DownloadLibrary()
+            library.scan()
+            return library.get_missing_downloads()
 
         except Exception as e:
             logger.error(f"Error checking missing downloads: {e}")
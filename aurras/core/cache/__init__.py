@@ -18,6 +18,12 @@ logger.debug(f"Cache database connection initialized: {cache_db_connection.conne
 InitializeSearchHistoryDatabase().initialize_cache(cache_db_connection.connection)
 logger.debug(f"Cache database initialized: {cache_db_connection.connection}")
 
+# Bring databases created by older versions up to the current schema
+from aurras.utils.db_migrations import run_migrations  # noqa: E402
+from aurras.core.cache.migrations import CACHE_MIGRATIONS  # noqa: E402
+
+run_migrations(cache_db_connection, CACHE_MIGRATIONS)
+
 __all__ = [
     "cache_db_connection",
 ]
@@ -0,0 +1,148 @@
+"""
+Search Index Module
+
+This module provides an in-memory index over the cached songs, so fuzzy
+lookups don't have to reload the cache table or scan every cached name.
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from aurras.utils.logger import get_logger
+from aurras.utils.handle_fuzzy_search import FuzzySearcher, TrigramIndex
+
+logger = get_logger("aurras.core.cache.index", log_to_console=False)
+
+SongDict = Dict[str, Dict[str, Any]]
+
+
+class SongSearchIndex:
+    """
+    Process-wide index of cached songs keyed by the search query.
+
+    The index is built once from a song dictionary loader and kept up to date
+    incrementally as new songs are saved to the cache.
+    """
+
+    def __init__(self, threshold: float = 0.56, candidate_limit: int = 32) -> None:
+        """
+        Initialize an empty, unbuilt index.
+
+        Args:
+            threshold: Default minimum similarity score for a match
+            candidate_limit: Number of index candidates rescored per lookup
+        """
+        self._songs: SongDict = {}
+        self._index = TrigramIndex(
+            FuzzySearcher(threshold=threshold), candidate_limit=candidate_limit
+        )
+        self._lock = threading.RLock()
+        self._built = False
+        self._version = 0
+
+    def __len__(self) -> int:
+        """Return the number of indexed songs."""
+        return len(self._songs)
+
+    @property
+    def is_built(self) -> bool:
+        """Whether the index has been populated from the database."""
+        return self._built
+
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever the indexed songs change."""
+        return self._version
+
+    def ensure_built(self, loader: Callable[[], SongDict]) -> None:
+        """
+        Build the index from the loader if it hasn't been built yet.
+
+        Args:
+            loader: Callable returning the song dictionary to index
+        """
+        if self._built:
+            return
+
+        with self._lock:
+            if self._built:
+                return
+
+            songs = loader()
+            self._songs = dict(songs)
+            self._index.clear()
+            self._index.update(self._songs.keys())
+            self._built = True
+            self._version += 1
+            logger.debug(f"Built song search index with {len(self._songs)} songs")
+
+    def add(self, key: str, song_info: Dict[str, Any]) -> None:
+        """
+        Add or replace a song in the index.
+
+        Songs saved before the index is built are skipped, since the initial
+        build loads them from the database anyway.
+
+        Args:
+            key: Search query the song is cached under
+            song_info: Song metadata dictionary
+        """
+        if not key or not self._built:
+            return
+
+        with self._lock:
+            self._songs[key] = song_info
+            self._index.add(key)
+            self._version += 1
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the song cached under an exact key.
+
+        Args:
+            key: Search query the song is cached under
+
+        Returns:
+            Song metadata dictionary, or None if not cached
+        """
+        return self._songs.get(key)
+
+    def values(self) -> List[Dict[str, Any]]:
+        """
+        Get a snapshot of every indexed song.
+
+        Returns:
+            List of song metadata dictionaries
+        """
+        with self._lock:
+            return list(self._songs.values())
+
+    def find(
+        self, query: str, threshold: Optional[float] = None
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Find the cached song that best matches a query.
+
+        Args:
+            query: User search query
+            threshold: Minimum similarity score, defaults to the index threshold
+
+        Returns:
+            Tuple of (matched key, song metadata), or None if nothing matched
+        """
+        with self._lock:
+            key = self._index.find_best_match(query, threshold)
+            if key is None:
+                return None
+            return key, self._songs[key]
+
+    def invalidate(self) -> None:
+        """Drop the index so that it's rebuilt from the database on next use."""
+        with self._lock:
+            self._songs = {}
+            self._index.clear()
+            self._built = False
+            self._version += 1
+
+
+song_search_index = SongSearchIndex()
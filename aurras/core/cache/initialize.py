@@ -4,6 +4,9 @@ Cache Initialization Module
 This module provides a class for initializing the search history database.
 """
 
+from aurras.utils.db_connection import ensure_column
+
+
 class InitializeSearchHistoryDatabase:
     """
     Class for initializing the search history database.
@@ -34,6 +37,26 @@ class InitializeSearchHistoryDatabase:
             connection: SQLite database connection
         """
         cursor = connection.cursor()
+
+        # Canonical song identity shared by cache, lyrics, history, downloads
+        # and playlists (keyed by YouTube video ID or local file hash)
+        cursor.execute(
+            """CREATE TABLE IF NOT EXISTS tracks (
+                id TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                track_name TEXT,
+                artist_name TEXT,
+                album_name TEXT,
+                thumbnail_url TEXT,
+                duration INTEGER DEFAULT 0,
+                updated_at INTEGER
+            )"""
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tracks_track_name ON tracks(track_name)"
+        )
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_tracks_url ON tracks(url)")
+
         cursor.execute(
             """CREATE TABLE IF NOT EXISTS cache (
                 id INTEGER PRIMARY KEY,
@@ -44,15 +67,17 @@ class InitializeSearchHistoryDatabase:
                 album_name TEXT,
                 thumbnail_url TEXT,
                 duration INTEGER DEFAULT 0,
-                fetch_time INTEGER
+                fetch_time INTEGER,
+                track_id TEXT REFERENCES tracks(id)
             )"""
         )
+        ensure_column(connection, "cache", "track_id", "TEXT REFERENCES tracks(id)")
 
-        # Create indexes for faster searching
+        # Create indexes for faster searching (lookup indexes on track and
+        # artist names are added by the cache migrations)
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_song_user_searched ON cache(song_user_searched)"
         )
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_track_name ON cache(track_name)")
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_artist_name ON cache(artist_name)"
         )
@@ -65,9 +90,15 @@ class InitializeSearchHistoryDatabase:
                 synced_lyrics TEXT,
                 plain_lyrics TEXT,
                 fetch_time INTEGER,
+                track_id TEXT REFERENCES tracks(id),
                 FOREIGN KEY (cache_id) REFERENCES cache(id)
             )
         """)
+        ensure_column(connection, "lyrics", "track_id", "TEXT REFERENCES tracks(id)")
 
-        # Create index for lyrics lookup
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_cache_id ON lyrics(cache_id)")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_track_id ON cache(track_id)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_lyrics_track_id ON lyrics(track_id)"
+        )
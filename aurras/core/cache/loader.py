@@ -22,7 +22,7 @@ class LoadSongHistoryData:
         Returns:
             list: A list of tuples containing (query, name, url)
         """
-        with cache_db_connection as conn:
+        with cache_db_connection.reader() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT song_user_searched, track_name, url FROM cache")
             return cursor.fetchall()
@@ -34,7 +34,7 @@ class LoadSongHistoryData:
         Returns:
             list: A list of tuples containing complete song metadata
         """
-        with cache_db_connection as conn:
+        with cache_db_connection.reader() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """SELECT 
@@ -44,6 +44,32 @@ class LoadSongHistoryData:
             )
             return cursor.fetchall()
 
+    def load_urls_for_track_names(self, track_names):
+        """
+        Loads the cached URL for each of the given track names in one query.
+
+        Names are matched case-insensitively, so rows keep the cache's casing.
+
+        Args:
+            track_names: Track names to look up
+
+        Returns:
+            list: A list of tuples containing (track_name, url), oldest first
+        """
+        if not track_names:
+            return []
+
+        placeholders = ", ".join("?" for _ in track_names)
+        with cache_db_connection.reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"""SELECT track_name, url FROM cache
+                WHERE track_name COLLATE NOCASE IN ({placeholders}) AND url != ''
+                ORDER BY fetch_time""",
+                list(track_names),
+            )
+            return cursor.fetchall()
+
     def load_song_with_lyrics(self, track_name=None, artist_name=None):
         """
         Loads song data including lyrics from the database.
@@ -55,7 +81,7 @@ class LoadSongHistoryData:
         Returns:
             Dictionary with song metadata and lyrics
         """
-        with cache_db_connection as conn:
+        with cache_db_connection.reader() as conn:
             cursor = conn.cursor()
 
             query = """
@@ -0,0 +1,295 @@
+"""
+Cache Migration Module
+
+This module defines the versioned migrations of the cache database (search
+cache, tracks and lyrics). They are applied by the migration runner when the
+cache package is imported.
+"""
+
+import sqlite3
+from typing import Dict, List
+
+from aurras.utils.logger import get_logger
+from aurras.utils.path_manager import _path_manager
+from aurras.core.cache import cache_db_connection
+from aurras.core.cache.tracks import TrackRegistry, track_id_for_url
+from aurras.utils.db_migrations import Migration
+from aurras.utils.db_connection import DatabaseConnectionManager, ensure_column
+
+logger = get_logger("aurras.core.cache.migrations", log_to_console=False)
+
+
+def _table_exists(connection: sqlite3.Connection, table: str) -> bool:
+    """Check whether a table exists in the database."""
+    row = connection.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone()
+    return row is not None
+
+
+def _link_cache(registry: TrackRegistry) -> None:
+    """Register every cached song as a track and link cache and lyrics rows."""
+    with cache_db_connection as conn:
+        cursor = conn.cursor()
+        rows = cursor.execute(
+            """
+            SELECT id, track_name, url, artist_name, album_name, thumbnail_url,
+                   duration
+            FROM cache WHERE track_id IS NULL AND url != ''
+            ORDER BY fetch_time
+            """
+        ).fetchall()
+
+        tracks = [dict(row) for row in rows]
+        track_ids = registry.register_many(tracks, cursor=cursor)
+
+        cursor.executemany(
+            "UPDATE cache SET track_id = ? WHERE id = ?",
+            [
+                (track_id, track["id"])
+                for track, track_id in zip(tracks, track_ids)
+                if track_id
+            ],
+        )
+        cursor.execute(
+            """
+            UPDATE lyrics SET track_id = (
+                SELECT track_id FROM cache WHERE cache.id = lyrics.cache_id
+            )
+            WHERE track_id IS NULL
+            """
+        )
+
+    logger.info(f"Linked {sum(1 for i in track_ids if i)} cached songs to tracks")
+
+
+def _link_downloads(registry: TrackRegistry) -> None:
+    """Register downloaded files as tracks, keyed by their content hash."""
+    db = DatabaseConnectionManager(_path_manager.downloads_db)
+
+    with db as conn:
+        if not _table_exists(conn, "downloaded_songs"):
+            return
+
+        ensure_column(conn, "downloaded_songs", "track_id", "TEXT")
+        rows = conn.execute(
+            """
+            SELECT id, track_name, artist_name, album_name, duration,
+                   file_path AS url, cover_url AS thumbnail_url
+            FROM downloaded_songs
+            WHERE track_id IS NULL AND file_path != ''
+            """
+        ).fetchall()
+
+        tracks = [dict(row) for row in rows]
+        for track in tracks:
+            track["track_id"] = track_id_for_url(track["url"])
+
+        with cache_db_connection as cache_conn:
+            registry.register_many(tracks, cursor=cache_conn.cursor())
+
+        conn.executemany(
+            "UPDATE downloaded_songs SET track_id = ? WHERE id = ?",
+            [(track["track_id"], track["id"]) for track in tracks if track["track_id"]],
+        )
+
+    logger.info(f"Linked {len(tracks)} downloaded songs to tracks")
+
+
+def _link_by_name(
+    registry: TrackRegistry, db_path, table: str, name_column: str
+) -> None:
+    """Link rows that only store a song name to the track with that name."""
+    db = DatabaseConnectionManager(db_path)
+
+    with db as conn:
+        if not _table_exists(conn, table):
+            return
+
+        ensure_column(conn, table, "track_id", "TEXT")
+        names: List[str] = [
+            row[0]
+            for row in conn.execute(
+                f"SELECT DISTINCT {name_column} FROM {table} WHERE track_id IS NULL"
+            )
+        ]
+        track_ids: Dict[str, str] = registry.get_ids_by_track_names(names)
+
+        conn.executemany(
+            f"UPDATE {table} SET track_id = ? "
+            f"WHERE {name_column} = ? AND track_id IS NULL",
+            [(track_id, name) for name, track_id in track_ids.items()],
+        )
+
+    logger.info(f"Linked {len(track_ids)} of {len(names)} {table} names to tracks")
+
+
+def _migrate_track_identity(connection: sqlite3.Connection) -> None:
+    """
+    Backfill the tracks table and the track_id columns of existing databases.
+
+    Spans every database file, so each step commits on its own; all of them
+    only touch rows that aren't linked yet and are safe to rerun.
+    """
+    registry = TrackRegistry()
+
+    _link_cache(registry)
+    _link_downloads(registry)
+    _link_by_name(registry, _path_manager.history_db, "play_history", "song_name")
+    _link_by_name(registry, _path_manager.playlists_db, "playlist_songs", "track_name")
+
+
+def _add_lookup_indexes(connection: sqlite3.Connection) -> None:
+    """Index the (track_name, artist_name) lookups used by lyrics and search."""
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS idx_cache_track_artist "
+        "ON cache(track_name, artist_name)"
+    )
+    # Covered by the composite index above
+    connection.execute("DROP INDEX IF EXISTS idx_track_name")
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS idx_lyrics_cache_fetch "
+        "ON lyrics(cache_id, fetch_time)"
+    )
+    connection.execute("DROP INDEX IF EXISTS idx_cache_id")
+
+
+def _add_full_text_search(connection: sqlite3.Connection) -> None:
+    """
+    Add a trigram FTS5 index over cached track and artist names.
+
+    Serves the substring lookups that used `LIKE '%name%'` scans. Skipped when
+    the SQLite build lacks FTS5 or the trigram tokenizer; lookups then fall
+    back to LIKE.
+    """
+    try:
+        connection.execute(
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS cache_fts USING fts5(
+                track_name, artist_name,
+                content='cache', content_rowid='id', tokenize='trigram'
+            )
+            """
+        )
+    except sqlite3.OperationalError as e:
+        logger.warning(f"Full-text search unavailable, using LIKE lookups: {e}")
+        return
+
+    # Keep the external-content index in sync with the cache table
+    for trigger in (
+        """
+        CREATE TRIGGER IF NOT EXISTS cache_fts_insert AFTER INSERT ON cache BEGIN
+            INSERT INTO cache_fts(rowid, track_name, artist_name)
+            VALUES (new.id, new.track_name, new.artist_name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS cache_fts_delete AFTER DELETE ON cache BEGIN
+            INSERT INTO cache_fts(cache_fts, rowid, track_name, artist_name)
+            VALUES ('delete', old.id, old.track_name, old.artist_name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS cache_fts_update
+        AFTER UPDATE OF track_name, artist_name ON cache BEGIN
+            INSERT INTO cache_fts(cache_fts, rowid, track_name, artist_name)
+            VALUES ('delete', old.id, old.track_name, old.artist_name);
+            INSERT INTO cache_fts(rowid, track_name, artist_name)
+            VALUES (new.id, new.track_name, new.artist_name);
+        END
+        """,
+    ):
+        connection.execute(trigger)
+
+    connection.execute("INSERT INTO cache_fts(cache_fts) VALUES ('rebuild')")
+
+
+def _add_lyrics_misses(connection: sqlite3.Connection) -> None:
+    """Remember songs no lyrics provider had, so they aren't looked up every play."""
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS lyrics_misses (
+            track_name TEXT NOT NULL,
+            artist_name TEXT NOT NULL,
+            checked_at INTEGER NOT NULL,
+            PRIMARY KEY (track_name, artist_name)
+        ) WITHOUT ROWID
+        """
+    )
+
+
+def _add_unique_urls(connection: sqlite3.Connection) -> None:
+    """
+    Keep one cached row per song URL, so saves can upsert on the URL.
+
+    Duplicates (left by INSERT OR REPLACE on a table without a unique key)
+    collapse into the newest row, and their lyrics are moved onto it. Rows
+    without a URL (lyrics-only entries) are left alone.
+    """
+    connection.execute(
+        """
+        CREATE TEMP TABLE cache_duplicates AS
+        SELECT c.id AS duplicate_id, k.keep_id
+        FROM cache c
+        JOIN (
+            SELECT url, MAX(id) AS keep_id FROM cache
+            WHERE url != '' GROUP BY url HAVING COUNT(*) > 1
+        ) k ON c.url = k.url
+        WHERE c.id != k.keep_id
+        """
+    )
+    connection.execute(
+        """
+        UPDATE lyrics SET cache_id = (
+            SELECT keep_id FROM cache_duplicates WHERE duplicate_id = lyrics.cache_id
+        )
+        WHERE cache_id IN (SELECT duplicate_id FROM cache_duplicates)
+        """
+    )
+    removed = connection.execute(
+        "DELETE FROM cache WHERE id IN (SELECT duplicate_id FROM cache_duplicates)"
+    ).rowcount
+    connection.execute("DROP TABLE cache_duplicates")
+
+    connection.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_cache_url ON cache(url) WHERE url != ''"
+    )
+    logger.info(f"Removed {removed} duplicate cached songs")
+
+
+def _add_audio_cache(connection: sqlite3.Connection) -> None:
+    """Add the index and hit counters of the on-disk audio stream cache."""
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS audio_cache (
+            video_id TEXT PRIMARY KEY,
+            file_name TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            cached_at INTEGER NOT NULL,
+            last_used_at INTEGER NOT NULL,
+            hits INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID
+        """
+    )
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS idx_audio_cache_last_used "
+        "ON audio_cache(last_used_at)"
+    )
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS audio_cache_stats (
+            name TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        ) WITHOUT ROWID
+        """
+    )
+
+
+CACHE_MIGRATIONS = [
+    Migration(1, "Link songs to the tracks table", _migrate_track_identity),
+    Migration(2, "Index track and artist lookups", _add_lookup_indexes),
+    Migration(3, "Add full-text search over cached songs", _add_full_text_search),
+    Migration(4, "Add negative lyrics cache", _add_lyrics_misses),
+    Migration(5, "Make cached songs unique by URL", _add_unique_urls),
+    Migration(6, "Add the audio stream cache index", _add_audio_cache),
+]
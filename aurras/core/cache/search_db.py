@@ -61,6 +61,37 @@ class SearchFromSongDataBase:
 
         return song_dict
 
+    def get_urls_by_track_names(self, track_names: List[str]) -> Dict[str, str]:
+        """
+        Map track names to their cached URLs with a single batched lookup.
+
+        Args:
+            track_names: Track names to look up, in any letter case
+
+        Returns:
+            dict: Dictionary with track name (as given) as key and the most
+            recent URL as value
+        """
+        urls: Dict[str, str] = {}
+        names = list(dict.fromkeys(track_names))
+
+        # Cached names may differ in case from the ones asked for
+        names_by_key: Dict[str, List[str]] = {}
+        for name in names:
+            names_by_key.setdefault(name.lower(), []).append(name)
+
+        # Stay well below SQLite's bound parameter limit
+        for start in range(0, len(names), 500):
+            rows = self.load_song_metadata.load_urls_for_track_names(
+                names[start : start + 500]
+            )
+            # Rows are ordered oldest first, so the latest URL wins
+            for track_name, url in rows:
+                for name in names_by_key.get(track_name.lower(), ()):
+                    urls[name] = url
+
+        return urls
+
     def search_by_name_or_artist(self, query: str) -> List[Dict]:
         """
         Search for songs by name or artist.
@@ -0,0 +1,308 @@
+"""
+Track Identity Module
+
+This module provides the canonical song identity used across the databases.
+Every playable song gets a single row in the `tracks` table, keyed by its
+YouTube video ID (``yt:<id>``) or, for local files, a hash of the file contents
+(``file:<hash>``). History, cache, lyrics, downloads and playlist rows refer to
+that row through their `track_id` column.
+"""
+
+import os
+import re
+import time
+import hashlib
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+from aurras.utils.logger import get_logger
+from aurras.core.cache import cache_db_connection
+
+logger = get_logger("aurras.core.cache.tracks", log_to_console=False)
+
+HASH_CHUNK_SIZE = 16 * 1024
+LOOKUP_CHUNK_SIZE = 500
+
+_YOUTUBE_ID_PATTERN = re.compile(
+    r"(?:[?&]v=|youtu\.be/|/shorts/|/embed/)([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])"
+)
+
+
+def youtube_video_id(url: str) -> Optional[str]:
+    """
+    Extract the video ID from a YouTube or YouTube Music URL.
+
+    Args:
+        url: URL to inspect
+
+    Returns:
+        The 11 character video ID, or None if the URL isn't a YouTube video
+    """
+    if not url:
+        return None
+
+    match = _YOUTUBE_ID_PATTERN.search(url)
+    return match.group(1) if match else None
+
+
+@lru_cache(maxsize=4096)
+def _hash_file(path: str, size: int, mtime_ns: int) -> str:
+    """Hash the size, head and tail of a file (memoized on size and mtime)."""
+    digest = hashlib.sha1(str(size).encode())
+
+    with open(path, "rb") as f:
+        digest.update(f.read(HASH_CHUNK_SIZE))
+        if size > HASH_CHUNK_SIZE * 2:
+            f.seek(-HASH_CHUNK_SIZE, os.SEEK_END)
+            digest.update(f.read(HASH_CHUNK_SIZE))
+
+    return digest.hexdigest()[:24]
+
+
+def partial_file_hash(path: str) -> Optional[str]:
+    """
+    Compute a content hash of a local file without reading all of it.
+
+    Only the file size and the first and last chunks are hashed, which is
+    enough to tell audio files apart while staying cheap on large libraries.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Hex digest of the file, or None if the file can't be read
+    """
+    try:
+        stat = os.stat(path)
+        return _hash_file(str(path), stat.st_size, stat.st_mtime_ns)
+    except (OSError, ValueError):
+        return None
+
+
+def track_id_for_url(url: str) -> Optional[str]:
+    """
+    Get the canonical track ID for a playable URL or local file path.
+
+    Args:
+        url: YouTube URL or path to a local audio file
+
+    Returns:
+        ``yt:<video id>`` for YouTube URLs, ``file:<hash>`` for existing local
+        files, or None if the song can't be identified
+    """
+    if not url or url == "null://":
+        return None
+
+    if video_id := youtube_video_id(url):
+        return f"yt:{video_id}"
+
+    if "://" in url:
+        return None
+
+    if file_hash := partial_file_hash(url):
+        return f"file:{file_hash}"
+
+    return None
+
+
+class TrackRegistry:
+    """
+    Class for reading and writing the canonical `tracks` table.
+    """
+
+    def register(
+        self,
+        url: str,
+        track_name: str = "",
+        artist_name: str = "",
+        album_name: str = "",
+        thumbnail_url: str = "",
+        duration: int = 0,
+        track_id: Optional[str] = None,
+        cursor=None,
+    ) -> Optional[str]:
+        """
+        Insert or update a track and return its ID.
+
+        Empty metadata never overwrites known values, so a bare URL can be
+        registered without losing the names stored by an earlier search.
+
+        Args:
+            url: YouTube URL or local file path of the song
+            track_name: Name of the song
+            artist_name: Artist name
+            album_name: Album name
+            thumbnail_url: URL to the song's thumbnail image
+            duration: Duration of the song in seconds
+            track_id: Precomputed track ID (computed from the URL if omitted)
+            cursor: Cursor of an open cache database transaction to write with
+
+        Returns:
+            The track ID, or None if the URL can't be identified
+        """
+        track_id = track_id or track_id_for_url(url)
+        if not track_id:
+            return None
+
+        row = (
+            track_id,
+            url,
+            track_name or "",
+            artist_name or "",
+            album_name or "",
+            thumbnail_url or "",
+            duration or 0,
+            int(time.time()),
+        )
+
+        if cursor is not None:
+            self._upsert(cursor, [row])
+        else:
+            with cache_db_connection as conn:
+                self._upsert(conn.cursor(), [row])
+
+        return track_id
+
+    def register_many(self, tracks: Iterable[Dict], cursor=None) -> List[Optional[str]]:
+        """
+        Register several tracks in a single transaction.
+
+        Args:
+            tracks: Dictionaries with `url` and optional `track_id`, `track_name`,
+                `artist_name`, `album_name`, `thumbnail_url` and `duration`
+            cursor: Cursor of an open cache database transaction to write with
+
+        Returns:
+            The track ID of each input, in order (None where it can't be identified)
+        """
+        now = int(time.time())
+        track_ids: List[Optional[str]] = []
+        rows = []
+
+        for track in tracks:
+            url = track.get("url", "")
+            track_id = track.get("track_id") or track_id_for_url(url)
+            track_ids.append(track_id)
+            if not track_id:
+                continue
+
+            rows.append(
+                (
+                    track_id,
+                    url,
+                    track.get("track_name") or "",
+                    track.get("artist_name") or "",
+                    track.get("album_name") or "",
+                    track.get("thumbnail_url") or "",
+                    track.get("duration") or 0,
+                    now,
+                )
+            )
+
+        if rows:
+            if cursor is not None:
+                self._upsert(cursor, rows)
+            else:
+                with cache_db_connection as conn:
+                    self._upsert(conn.cursor(), rows)
+
+        return track_ids
+
+    def _upsert(self, cursor, rows: List[tuple]) -> None:
+        """Write track rows, keeping existing metadata where the new value is empty."""
+        cursor.executemany(
+            """
+            INSERT INTO tracks
+            (id, url, track_name, artist_name, album_name, thumbnail_url,
+             duration, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                url = excluded.url,
+                track_name = COALESCE(NULLIF(excluded.track_name, ''), track_name),
+                artist_name = COALESCE(NULLIF(excluded.artist_name, ''), artist_name),
+                album_name = COALESCE(NULLIF(excluded.album_name, ''), album_name),
+                thumbnail_url = COALESCE(
+                    NULLIF(excluded.thumbnail_url, ''), thumbnail_url
+                ),
+                duration = COALESCE(NULLIF(excluded.duration, 0), duration),
+                updated_at = excluded.updated_at
+            """,
+            rows,
+        )
+
+    def get_track(self, track_id: str) -> Optional[Dict]:
+        """
+        Get a single track by ID.
+
+        Args:
+            track_id: Canonical track ID
+
+        Returns:
+            Track metadata dictionary, or None if it isn't registered
+        """
+        return self.get_tracks([track_id]).get(track_id)
+
+    def get_tracks(self, track_ids: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Look up several tracks by primary key.
+
+        Args:
+            track_ids: Canonical track IDs (None and duplicates are ignored)
+
+        Returns:
+            Dictionary with track ID as key and track metadata as value
+        """
+        ids = list(dict.fromkeys(track_id for track_id in track_ids if track_id))
+        tracks: Dict[str, Dict] = {}
+
+        with cache_db_connection.reader() as conn:
+            cursor = conn.cursor()
+
+            for start in range(0, len(ids), LOOKUP_CHUNK_SIZE):
+                chunk = ids[start : start + LOOKUP_CHUNK_SIZE]
+                placeholders = ", ".join("?" for _ in chunk)
+                cursor.execute(
+                    f"""
+                    SELECT id, url, track_name, artist_name, album_name,
+                           thumbnail_url, duration
+                    FROM tracks WHERE id IN ({placeholders})
+                    """,
+                    chunk,
+                )
+                tracks.update({row["id"]: dict(row) for row in cursor.fetchall()})
+
+        return tracks
+
+    def get_ids_by_track_names(self, track_names: Iterable[str]) -> Dict[str, str]:
+        """
+        Map exact track names to track IDs, preferring the most recently updated.
+
+        Used to link rows that only know a song by name (history entries and
+        playlist songs imported before they were played).
+
+        Args:
+            track_names: Exact track names to look up
+
+        Returns:
+            Dictionary with track name as key and track ID as value
+        """
+        names = list(dict.fromkeys(name for name in track_names if name))
+        ids: Dict[str, str] = {}
+
+        with cache_db_connection.reader() as conn:
+            cursor = conn.cursor()
+
+            for start in range(0, len(names), LOOKUP_CHUNK_SIZE):
+                chunk = names[start : start + LOOKUP_CHUNK_SIZE]
+                placeholders = ", ".join("?" for _ in chunk)
+                cursor.execute(
+                    f"""
+                    SELECT track_name, id FROM tracks
+                    WHERE track_name IN ({placeholders})
+                    ORDER BY updated_at
+                    """,
+                    chunk,
+                )
+                ids.update({row[0]: row[1] for row in cursor.fetchall()})
+
+        return ids
@@ -5,8 +5,40 @@ This module provides a class for updating the search history database.
 """
 
 import time
+from typing import Any, Dict, Iterable, List
 
 from aurras.core.cache import cache_db_connection
+from aurras.core.cache.index import song_search_index
+from aurras.core.cache.tracks import TrackRegistry
+
+_CACHE_COLUMNS = """
+    (song_user_searched, track_name, url, artist_name, album_name,
+     thumbnail_url, duration, fetch_time, track_id)
+"""
+
+# Songs are unique by URL (idx_cache_url); rows without one are always added
+_UPSERT_SQL = f"""
+    INSERT INTO cache {_CACHE_COLUMNS}
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(url) WHERE url != '' DO UPDATE SET
+        track_name = COALESCE(NULLIF(excluded.track_name, ''), track_name),
+        artist_name = COALESCE(NULLIF(excluded.artist_name, ''), artist_name),
+        album_name = COALESCE(NULLIF(excluded.album_name, ''), album_name),
+        thumbnail_url = COALESCE(NULLIF(excluded.thumbnail_url, ''), thumbnail_url),
+        duration = COALESCE(NULLIF(excluded.duration, 0), duration),
+        fetch_time = excluded.fetch_time,
+        track_id = COALESCE(excluded.track_id, track_id)
+"""
+
+# Skips songs already cached by URL, or by track and artist name
+_INSERT_NEW_SQL = f"""
+    INSERT INTO cache {_CACHE_COLUMNS}
+    SELECT ?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9
+    WHERE ?2 = '' OR ?4 = '' OR NOT EXISTS (
+        SELECT 1 FROM cache WHERE track_name = ?2 AND artist_name = ?4
+    )
+    ON CONFLICT(url) WHERE url != '' DO NOTHING
+"""
 
 
 class UpdateSearchHistoryDatabase:
@@ -16,6 +48,7 @@ class UpdateSearchHistoryDatabase:
 
     def __init__(self) -> None:
         """Initialize the cache database connection."""
+        self.track_registry = TrackRegistry()
 
     def save_to_cache(
         self,
@@ -39,27 +72,123 @@ class UpdateSearchHistoryDatabase:
             thumbnail_url (str): URL to the song's thumbnail image
             duration (int): Duration of the song in seconds
         """
+        song = {
+            "song_user_searched": song_user_searched,
+            "track_name": track_name,
+            "url": url,
+            "artist_name": artist_name,
+            "album_name": album_name,
+            "thumbnail_url": thumbnail_url,
+            "duration": duration,
+        }
+
         with cache_db_connection as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO cache 
-                (song_user_searched, track_name, url, 
-                 artist_name, album_name, thumbnail_url, duration, fetch_time) 
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    song_user_searched,
-                    track_name,
-                    url,
-                    artist_name,
-                    album_name,
-                    thumbnail_url,
-                    duration,
-                    int(time.time()),
-                ),
+            rows = self._write_songs(cursor, [song], update_existing=True)
+
+            # Songs without a URL are always inserted as a new row
+            if url:
+                cursor.execute("SELECT id FROM cache WHERE url = ?", (url,))
+            else:
+                cursor.execute("SELECT last_insert_rowid()")
+            cache_id = cursor.fetchone()[0]
+
+        self._index_songs(rows)
+        return cache_id
+
+    def save_many_to_cache(
+        self, songs: Iterable[Dict[str, Any]], update_existing: bool = True
+    ) -> int:
+        """
+        Save several songs to the cache in a single transaction.
+
+        Songs are identified by URL: a song that is already cached is updated
+        in place (keeping its row ID, so its lyrics stay linked), and empty
+        metadata never overwrites known values.
+
+        Args:
+            songs: Dictionaries with `song_user_searched`, `track_name` and `url`,
+                and optionally `artist_name`, `album_name`, `thumbnail_url` and
+                `duration`
+            update_existing: Update songs that are already cached; if False,
+                they are left as they are, as are songs cached under another
+                URL with the same track and artist name
+
+        Returns:
+            Number of cache rows inserted or updated
+        """
+        songs = list(songs)
+        if not songs:
+            return 0
+
+        with cache_db_connection as conn:
+            cursor = conn.cursor()
+            rows = self._write_songs(cursor, songs, update_existing)
+
+        self._index_songs(rows, replace=update_existing)
+        return len(rows)
+
+    def _write_songs(
+        self, cursor, songs: List[Dict[str, Any]], update_existing: bool
+    ) -> List[tuple]:
+        """
+        Register the songs' tracks and write their cache rows.
+
+        Returns:
+            The rows that were written; rows skipped because the song is
+            already cached (update_existing=False) are left out
+        """
+        track_ids = self.track_registry.register_many(
+            [{**song, "url": song.get("url") or ""} for song in songs], cursor=cursor
+        )
+        now = int(time.time())
+
+        rows = [
+            (
+                song.get("song_user_searched") or song.get("track_name") or "",
+                song.get("track_name") or "",
+                song.get("url") or "",
+                song.get("artist_name") or "",
+                song.get("album_name") or "",
+                song.get("thumbnail_url") or "",
+                song.get("duration") or 0,
+                now,
+                track_id,
+            )
+            for song, track_id in zip(songs, track_ids)
+        ]
+
+        if update_existing:
+            # Every row is either inserted or updated
+            cursor.executemany(_UPSERT_SQL, rows)
+            return rows
+
+        # Row by row, to tell the inserted rows from the skipped ones
+        written = []
+        for row in rows:
+            cursor.execute(_INSERT_NEW_SQL, row)
+            if cursor.rowcount > 0:
+                written.append(row)
+        return written
+
+    def _index_songs(self, rows: List[tuple], replace: bool = True) -> None:
+        """Add written cache rows to the in-memory search index."""
+        for row in rows:
+            key = row[0]
+            if not replace and song_search_index.get(key) is not None:
+                continue
+
+            song_search_index.add(
+                key,
+                {
+                    "track_name": row[1],
+                    "url": row[2],
+                    "artist_name": row[3],
+                    "album_name": row[4],
+                    "thumbnail_url": row[5],
+                    "duration": row[6],
+                },
             )
-            return cursor.lastrowid
 
     def save_lyrics(self, cache_id, synced_lyrics="", plain_lyrics=""):
         """
@@ -78,10 +207,10 @@ class UpdateSearchHistoryDatabase:
             cursor.execute(
                 """
                 INSERT OR REPLACE INTO lyrics
-                (cache_id, synced_lyrics, plain_lyrics, fetch_time)
-                VALUES (?, ?, ?, ?)
+                (cache_id, synced_lyrics, plain_lyrics, fetch_time, track_id)
+                VALUES (?, ?, ?, ?, (SELECT track_id FROM cache WHERE id = ?))
                 """,
-                (cache_id, synced_lyrics, plain_lyrics, int(time.time())),
+                (cache_id, synced_lyrics, plain_lyrics, int(time.time()), cache_id),
             )
 
     def save_full_song_data(
@@ -0,0 +1,143 @@
+"""
+Download Index Module
+
+This module indexes the files of a download directory so downloaded songs can
+be matched to their spotdl metadata without listing the directory and fuzzy
+matching every file name for each song.
+
+File names are normalized the way spotdl builds them from the
+"{artists} - {title}" output template, so most songs are found with a single
+dictionary lookup; fuzzy matching only runs on the n-gram candidates of the
+songs that aren't. An index is rebuilt when its directory's mtime changes.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from aurras.utils.logger import get_logger
+from aurras.utils.handle_fuzzy_search import FuzzySearcher, TrigramIndex
+
+logger = get_logger("aurras.core.download_index", log_to_console=False)
+
+# Characters spotdl drops from file names, and the ones it replaces
+_DROPPED_CHARS = str.maketrans("", "", "/?\\*|<>")
+_REPLACED_CHARS = str.maketrans({'"': "'", ":": "-"})
+
+# Files in a download directory that are never songs
+_IGNORED_SUFFIXES = {".spotdl", ".part", ".tmp"}
+
+
+def normalize_file_name(name: str) -> str:
+    """
+    Normalize a song name the way spotdl sanitizes it for a file name.
+
+    Args:
+        name: "artists - title" string or a file name without extension
+
+    Returns:
+        Case-folded, sanitized name used as the exact-match key
+    """
+    name = name.translate(_DROPPED_CHARS).translate(_REPLACED_CHARS)
+    return " ".join(name.split()).rstrip(". ").casefold()
+
+
+class DownloadDirectoryIndex:
+    """
+    Index of the song files in one download directory.
+    """
+
+    def __init__(self, directory: Path, threshold: float = 0.5) -> None:
+        """
+        Initialize an index; the directory is scanned on first use.
+
+        Args:
+            directory: Download directory to index
+            threshold: Minimum similarity for a fuzzy match
+        """
+        self.directory = Path(directory)
+        self.threshold = threshold
+
+        self._exact: Dict[str, str] = {}
+        self._fuzzy = TrigramIndex(FuzzySearcher(threshold=threshold))
+        self._mtime_ns: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of indexed files."""
+        return len(self._fuzzy)
+
+    def _refresh(self) -> None:
+        """Rescan the directory if it changed since the last scan."""
+        try:
+            mtime_ns = os.stat(self.directory).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+
+        if mtime_ns == self._mtime_ns and self._mtime_ns is not None:
+            return
+
+        self._exact.clear()
+        self._fuzzy.clear()
+
+        if mtime_ns is not None:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith(".") or not entry.is_file():
+                        continue
+
+                    stem, suffix = os.path.splitext(entry.name)
+                    if suffix.lower() in _IGNORED_SUFFIXES:
+                        continue
+
+                    self._exact.setdefault(normalize_file_name(stem), entry.name)
+                    self._fuzzy.add(entry.name)
+
+        self._mtime_ns = mtime_ns
+        logger.debug(f"Indexed {len(self._fuzzy)} files in {self.directory}")
+
+    def find(self, artists: str, title: str) -> Optional[Path]:
+        """
+        Find the file spotdl wrote for a song.
+
+        Args:
+            artists: Artist names, joined with ", " like spotdl does
+            title: Song title
+
+        Returns:
+            Path to the file, or None if no file matches
+        """
+        query = f"{artists} - {title}"
+
+        with self._lock:
+            self._refresh()
+
+            file_name = self._exact.get(normalize_file_name(query))
+            if file_name is None:
+                file_name = self._fuzzy.find_best_match(query, self.threshold)
+
+        return self.directory / file_name if file_name else None
+
+
+_indexes: Dict[Path, DownloadDirectoryIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_directory_index(directory: Path) -> DownloadDirectoryIndex:
+    """
+    Get the shared index of a download directory.
+
+    Args:
+        directory: Download directory
+
+    Returns:
+        The directory's index, created on first request
+    """
+    directory = Path(directory)
+
+    with _indexes_lock:
+        index = _indexes.get(directory)
+        if index is None:
+            index = _indexes[directory] = DownloadDirectoryIndex(directory)
+        return index
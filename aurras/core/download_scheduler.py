@@ -0,0 +1,385 @@
+"""
+Download Scheduler Module
+
+This module runs spotdl downloads in parallel. The song list is split into
+small shards that a pool of workers downloads with one spotdl process each.
+Per-track results are read from spotdl's output while it runs, and each shard
+is handed to a callback (metadata extraction and database insertion) as soon as
+it finishes, while the other shards keep downloading. A shard that fails is
+retried on its own.
+
+Example:
+    ```python
+    scheduler = DownloadScheduler(songs, output_dir, on_event=print)
+    scheduler.run(on_shard_complete=lambda shard, save_file: ...)
+    print(scheduler.stats.summary())
+    ```
+"""
+
+import os
+import re
+import time
+import threading
+import subprocess
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from aurras.core.settings import SETTINGS
+from aurras.utils.logger import get_logger
+
+logger = get_logger("aurras.core.download_scheduler", log_to_console=False)
+
+DEFAULT_DOWNLOAD_WORKERS = 4
+SHARD_SIZE = 5  # Songs per spotdl process
+SHARD_RETRIES = 2  # Extra attempts for a shard that didn't complete
+OUTPUT_FORMAT = "{artists} - {title}"
+
+# spotdl log lines (with --simple-tui) that mark the end of a track
+_DOWNLOADED_PATTERN = re.compile(r'Downloaded "(?P<name>.+?)": ')
+_SKIPPED_PATTERN = re.compile(r"Skipping (?P<name>.+?) \((?:file already exists|skip)")
+_FAILED_PATTERN = re.compile(r"^(?:INFO\s+)?(?P<name>.+?): Error\s*$")
+
+
+def _configured_workers() -> int:
+    """Get the configured number of download workers, falling back to the default."""
+    try:
+        return max(1, int(SETTINGS.download_workers))
+    except (AttributeError, TypeError, ValueError):
+        return DEFAULT_DOWNLOAD_WORKERS
+
+
+class DownloadShard(NamedTuple):
+    """A slice of the song list downloaded by a single spotdl process."""
+
+    index: int
+    songs: List[str]
+
+
+class DownloadEvent(NamedTuple):
+    """Progress of a single track or shard."""
+
+    status: str  # "downloaded", "skipped", "failed", "shard_done" or "shard_failed"
+    name: str  # Track display name, or the shard's song list for shard events
+    shard: int
+    size: int = 0  # Bytes written, for downloaded tracks
+
+
+class DownloadStats:
+    """
+    Thread-safe download counters, including throughput.
+    """
+
+    def __init__(self, total: int) -> None:
+        """
+        Initialize the counters.
+
+        Args:
+            total: Number of songs requested
+        """
+        self._lock = threading.Lock()
+        self.total = total
+        self.started_at = time.monotonic()
+        self.finished_at: Optional[float] = None
+        self.bytes = 0
+        self._track_status: Dict[str, str] = {}
+
+    def record(self, event: DownloadEvent) -> None:
+        """Record a track event; later events for a track replace earlier ones."""
+        if event.status not in ("downloaded", "skipped", "failed"):
+            return
+
+        with self._lock:
+            previous = self._track_status.get(event.name)
+            # A retried shard reports its finished tracks again as skipped
+            if previous == "downloaded" and event.status != "downloaded":
+                return
+            self._track_status[event.name] = event.status
+            self.bytes += event.size
+
+    def finish(self) -> None:
+        """Stop the clock used for throughput."""
+        self.finished_at = time.monotonic()
+
+    def _count(self, status: str) -> int:
+        return sum(1 for value in self._track_status.values() if value == status)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the download started (until it finished)."""
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def tracks_per_minute(self) -> float:
+        """Downloaded tracks per minute."""
+        with self._lock:
+            downloaded = self._count("downloaded")
+        return downloaded * 60 / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Bytes of audio written per second."""
+        return self.bytes / self.elapsed if self.elapsed > 0 else 0.0
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Get the current counters.
+
+        Returns:
+            Dictionary with total, downloaded, skipped, failed, bytes,
+            elapsed, tracks_per_minute and bytes_per_second
+        """
+        with self._lock:
+            downloaded = self._count("downloaded")
+            skipped = self._count("skipped")
+            failed = self._count("failed")
+
+        return {
+            "total": self.total,
+            "downloaded": downloaded,
+            "skipped": skipped,
+            "failed": failed,
+            "bytes": self.bytes,
+            "elapsed": round(self.elapsed, 2),
+            "tracks_per_minute": round(self.tracks_per_minute, 2),
+            "bytes_per_second": round(self.bytes_per_second, 2),
+        }
+
+    def summary(self) -> str:
+        """Get a one-line, human readable summary of the counters."""
+        stats = self.snapshot()
+        done = stats["downloaded"] + stats["skipped"]
+        return (
+            f"{done}/{stats['total']} songs · "
+            f"{stats['tracks_per_minute']:.1f} tracks/min · "
+            f"{stats['bytes_per_second'] / (1024 * 1024):.2f} MB/s"
+        )
+
+
+class DownloadScheduler:
+    """
+    Downloads a song list with several spotdl processes at once.
+    """
+
+    def __init__(
+        self,
+        songs: List[str],
+        output_dir: Path,
+        format: Optional[str] = None,
+        bitrate: Optional[str] = None,
+        workers: Optional[int] = None,
+        shard_size: int = SHARD_SIZE,
+        max_retries: int = 3,
+        on_event: Optional[Callable[[DownloadEvent, DownloadStats], None]] = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            songs: Song names (or URLs) to download
+            output_dir: Directory the files are written to
+            format: Audio format passed to spotdl
+            bitrate: Bitrate passed to spotdl
+            workers: Number of concurrent spotdl processes (from settings if None)
+            shard_size: Number of songs per spotdl process
+            max_retries: Per-track retries done by spotdl itself
+            on_event: Called with every track and shard event and the stats
+        """
+        self.output_dir = Path(output_dir)
+        self.format = format
+        self.bitrate = bitrate
+        self.workers = workers or _configured_workers()
+        self.max_retries = max_retries
+        self.on_event = on_event
+        self.stats = DownloadStats(len(songs))
+
+        shard_size = max(1, shard_size)
+        self.shards = [
+            DownloadShard(index, songs[start : start + shard_size])
+            for index, start in enumerate(range(0, len(songs), shard_size))
+        ]
+
+        self._processes: Dict[int, subprocess.Popen] = {}
+        self._processes_lock = threading.Lock()
+        self._cancelled = threading.Event()
+
+    def run(
+        self, on_shard_complete: Optional[Callable[[DownloadShard, Path], None]] = None
+    ) -> bool:
+        """
+        Download every shard, handing each one to a callback when it lands.
+
+        Args:
+            on_shard_complete: Called from the worker thread with the shard and
+                its spotdl save file once the shard has finished (even if some
+                of its tracks failed); the save file is deleted afterwards
+
+        Returns:
+            True if every shard completed
+        """
+        if not self.shards:
+            return False
+
+        workers = min(self.workers, len(self.shards))
+        logger.info(
+            f"Downloading {self.stats.total} songs in {len(self.shards)} shards "
+            f"with {workers} workers"
+        )
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="aurras-download"
+            ) as executor:
+                try:
+                    results = list(
+                        executor.map(
+                            lambda shard: self._run_shard(shard, on_shard_complete),
+                            self.shards,
+                        )
+                    )
+                except KeyboardInterrupt:
+                    # Before the executor waits for the running shards, so
+                    # they stop instead of retrying their interrupted spotdl
+                    self.cancel()
+                    raise
+        finally:
+            self.stats.finish()
+
+        logger.info(f"Download finished: {self.stats.summary()}")
+        return all(results)
+
+    def cancel(self) -> None:
+        """Stop all running spotdl processes and skip the remaining shards."""
+        self._cancelled.set()
+        with self._processes_lock:
+            for process in self._processes.values():
+                process.terminate()
+
+    def _run_shard(
+        self,
+        shard: DownloadShard,
+        on_shard_complete: Optional[Callable[[DownloadShard, Path], None]],
+    ) -> bool:
+        """Download a shard, retrying it on failure, then hand it on."""
+        save_file = self.output_dir / f".aurras-shard-{shard.index}.spotdl"
+        completed = False
+
+        for attempt in range(SHARD_RETRIES + 1):
+            if self._cancelled.is_set():
+                break
+            if attempt:
+                logger.warning(f"Retrying shard {shard.index} (attempt {attempt + 1})")
+
+            completed = self._download_shard(shard, save_file)
+            if completed or self._cancelled.is_set():
+                break
+
+        status = "shard_done" if completed else "shard_failed"
+        self._emit(DownloadEvent(status, ", ".join(shard.songs), shard.index))
+
+        try:
+            if on_shard_complete and save_file.exists():
+                on_shard_complete(shard, save_file)
+        except Exception as e:
+            logger.error(f"Error processing shard {shard.index}: {e}", exc_info=True)
+        finally:
+            save_file.unlink(missing_ok=True)
+
+        return completed
+
+    def _build_command(self, shard: DownloadShard, save_file: Path) -> List[str]:
+        """Build the spotdl command line for a shard."""
+        command = ["spotdl", "download", *shard.songs, "--output", OUTPUT_FORMAT]
+
+        if self.format:
+            command += ["--format", self.format]
+        if self.bitrate:
+            command += ["--bitrate", self.bitrate]
+
+        command += [
+            "--max-retries",
+            str(self.max_retries),
+            "--ytm-data",
+            "--preload",
+            "--simple-tui",
+            "--save-file",
+            str(save_file),
+        ]
+        return command
+
+    def _download_shard(self, shard: DownloadShard, save_file: Path) -> bool:
+        """
+        Run one spotdl process for a shard, emitting track events as they happen.
+
+        Returns:
+            True if spotdl exited cleanly and no track failed
+        """
+        command = self._build_command(shard, save_file)
+        logger.debug(f"Shard {shard.index}: {' '.join(command)}")
+
+        # Wide columns keep spotdl's log lines from being wrapped
+        env = {**os.environ, "COLUMNS": "1000"}
+        failed = 0
+
+        process = subprocess.Popen(
+            command,
+            cwd=self.output_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            stdin=subprocess.DEVNULL,
+            text=True,
+            errors="replace",
+            env=env,
+        )
+        with self._processes_lock:
+            self._processes[shard.index] = process
+            # Started while cancel() was stopping the others
+            if self._cancelled.is_set():
+                process.terminate()
+
+        try:
+            for line in process.stdout:
+                event = self._parse_line(line.strip(), shard.index)
+                if event:
+                    failed += event.status == "failed"
+                    self._emit(event)
+            return_code = process.wait()
+        finally:
+            with self._processes_lock:
+                self._processes.pop(shard.index, None)
+
+        if return_code != 0:
+            logger.error(f"spotdl exited with {return_code} for shard {shard.index}")
+        return return_code == 0 and not failed
+
+    def _parse_line(self, line: str, shard: int) -> Optional[DownloadEvent]:
+        """Turn a spotdl output line into a track event, if it is one."""
+        if match := _DOWNLOADED_PATTERN.search(line):
+            name = match.group("name")
+            return DownloadEvent("downloaded", name, shard, self._file_size(name))
+
+        if match := _SKIPPED_PATTERN.search(line):
+            return DownloadEvent("skipped", match.group("name"), shard)
+
+        if match := _FAILED_PATTERN.search(line):
+            return DownloadEvent("failed", match.group("name"), shard)
+
+        return None
+
+    def _file_size(self, name: str) -> int:
+        """Size of the file spotdl wrote for a track, 0 if it can't be found."""
+        extension = self.format or SETTINGS.download_format
+        try:
+            return (self.output_dir / f"{name}.{extension}").stat().st_size
+        except OSError:
+            return 0
+
+    def _emit(self, event: DownloadEvent) -> None:
+        """Record an event and pass it to the listener."""
+        self.stats.record(event)
+
+        if self.on_event:
+            try:
+                self.on_event(event, self.stats)
+            except Exception as e:
+                logger.error(f"Download event listener failed: {e}")
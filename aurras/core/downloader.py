@@ -2,7 +2,9 @@
 Song downloader module
 
 This module provides a class for downloading songs using spotdl's CLI through subprocess
-while extracting rich metadata using the library to store in the database.
+while extracting rich metadata using the library to store in the database. Songs are
+downloaded by several spotdl processes at once (see download_scheduler), and each
+finished batch is saved to the database while the rest keep downloading.
 
 Example:
     ```python
@@ -15,17 +17,27 @@ import os
 import json
 import time
 import sqlite3
-import subprocess
+import threading
 import contextlib
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Iterator, Tuple
+from typing import Callable, Dict, List, Optional, Any, Iterator, Tuple
 
 from aurras.utils.console import console
 from aurras.core.settings import SETTINGS
 from aurras.utils.logger import get_logger
 from aurras.utils.path_manager import _path_manager
-from aurras.utils.handle_fuzzy_search import FuzzySearcher
-from aurras.utils.db_connection import DatabaseConnectionManager
+from aurras.core.cache.index import song_search_index
+from aurras.core.cache.tracks import track_id_for_url
+from aurras.core.download_scheduler import (
+    DownloadEvent,
+    DownloadScheduler,
+    DownloadShard,
+    DownloadStats,
+)
+from aurras.core.download_index import get_directory_index
+from aurras.core.spotdl_metadata import SaveFileStream, append_save_file
+from aurras.utils.db_migrations import Migration, run_migrations
+from aurras.utils.db_connection import DatabaseConnectionManager, ensure_column
 
 METADATA_FILE = "metadata.spotdl"
 DEFAULT_BATCH_SIZE = 25
@@ -33,6 +45,191 @@ MAX_RETRIES = int(SETTINGS.maximum_retries)
 
 logger = get_logger("aurras.core.downloader", log_to_console=False)
 
+# Keys downloads can be sorted by. Each has an index, and SQLite keeps the
+# rowid at the end of every index entry, so (key, id) pages are index scans.
+SORT_KEYS = ("download_date", "track_name", "artist_name", "album_name")
+# Columns matched by substring, through the downloads_fts index
+_TEXT_COLUMNS = ("track_name", "artist_name", "album_name")
+# Other columns that can be filtered on, by equality
+_FILTER_COLUMNS = ("id", "duration", "download_date", "file_path", "track_id")
+# The trigram tokenizer matches nothing for shorter terms
+_MIN_FTS_TERM = 3
+
+
+def _add_download_indexes(connection: sqlite3.Connection) -> None:
+    """Index downloads for newest-first paging and lookups by file path."""
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS idx_downloads_date_id "
+        "ON downloaded_songs(download_date, id)"
+    )
+    # Covered by the composite index above
+    connection.execute("DROP INDEX IF EXISTS idx_download_date")
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS idx_downloads_file_path "
+        "ON downloaded_songs(file_path)"
+    )
+
+
+def _add_library_files(connection: sqlite3.Connection) -> None:
+    """Add the table of scanned audio files kept by the download library."""
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS library_files (
+            path TEXT PRIMARY KEY,
+            playlist TEXT NOT NULL DEFAULT '',
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            track_id TEXT,
+            scanned_at INTEGER
+        )
+        """
+    )
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS idx_library_playlist_path "
+        "ON library_files(playlist, path)"
+    )
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS idx_library_track_id ON library_files(track_id)"
+    )
+
+
+def _add_library_tags(connection: sqlite3.Connection) -> None:
+    """Add the audio tags read by the library scan to its file index."""
+    # NULL title means the tags haven't been read yet; unreadable files get ""
+    ensure_column(connection, "library_files", "title", "TEXT")
+    ensure_column(connection, "library_files", "artist", "TEXT")
+    ensure_column(connection, "library_files", "album", "TEXT")
+    ensure_column(connection, "library_files", "duration", "INTEGER")
+
+
+def _add_downloads_search(connection: sqlite3.Connection) -> None:
+    """
+    Add a trigram FTS5 index over downloaded track, artist and album names.
+
+    Serves the substring filters of get_downloaded_songs, which used
+    `LIKE '%value%'` scans. Skipped when the SQLite build lacks FTS5 or the
+    trigram tokenizer; filters then fall back to LIKE.
+    """
+    try:
+        connection.execute(
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS downloads_fts USING fts5(
+                track_name, artist_name, album_name,
+                content='downloaded_songs', content_rowid='id',
+                tokenize='trigram'
+            )
+            """
+        )
+    except sqlite3.OperationalError as e:
+        logger.warning(f"Full-text search unavailable, using LIKE filters: {e}")
+        return
+
+    # Keep the external-content index in sync with the downloads table
+    for trigger in (
+        """
+        CREATE TRIGGER IF NOT EXISTS downloads_fts_insert
+        AFTER INSERT ON downloaded_songs BEGIN
+            INSERT INTO downloads_fts(rowid, track_name, artist_name, album_name)
+            VALUES (new.id, new.track_name, new.artist_name, new.album_name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS downloads_fts_delete
+        AFTER DELETE ON downloaded_songs BEGIN
+            INSERT INTO downloads_fts(
+                downloads_fts, rowid, track_name, artist_name, album_name
+            )
+            VALUES ('delete', old.id, old.track_name, old.artist_name, old.album_name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS downloads_fts_update
+        AFTER UPDATE OF track_name, artist_name, album_name ON downloaded_songs
+        BEGIN
+            INSERT INTO downloads_fts(
+                downloads_fts, rowid, track_name, artist_name, album_name
+            )
+            VALUES ('delete', old.id, old.track_name, old.artist_name, old.album_name);
+            INSERT INTO downloads_fts(rowid, track_name, artist_name, album_name)
+            VALUES (new.id, new.track_name, new.artist_name, new.album_name);
+        END
+        """,
+    ):
+        connection.execute(trigger)
+
+    connection.execute("INSERT INTO downloads_fts(downloads_fts) VALUES ('rebuild')")
+
+
+# When a library file was added: the date it was last downloaded, or when the
+# scan found it if it wasn't downloaded (evaluated in an UPDATE of the file)
+_LIBRARY_ADDED_SQL = """
+    UPDATE library_files SET added = COALESCE(
+        (
+            SELECT MAX(d.download_date) FROM downloaded_songs d
+            WHERE d.file_path = library_files.path
+        ),
+        scanned_at,
+        0
+    )
+"""
+
+
+def _add_library_sort_key(connection: sqlite3.Connection) -> None:
+    """
+    Store the newest-first sort key of library files, so pages are index scans.
+
+    The key depends on the downloads table, so triggers on both tables keep it
+    up to date as files are scanned and downloads are saved, moved or removed.
+    """
+    ensure_column(connection, "library_files", "added", "INTEGER")
+    connection.execute(_LIBRARY_ADDED_SQL)
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS idx_library_added ON library_files(added, path)"
+    )
+
+    for trigger in (
+        f"""
+        CREATE TRIGGER IF NOT EXISTS library_files_added_insert
+        AFTER INSERT ON library_files BEGIN
+            {_LIBRARY_ADDED_SQL} WHERE path = new.path;
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS library_files_added_update
+        AFTER UPDATE OF scanned_at ON library_files BEGIN
+            {_LIBRARY_ADDED_SQL} WHERE path = new.path;
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS downloads_added_insert
+        AFTER INSERT ON downloaded_songs BEGIN
+            {_LIBRARY_ADDED_SQL} WHERE path = new.file_path;
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS downloads_added_update
+        AFTER UPDATE OF download_date, file_path ON downloaded_songs BEGIN
+            {_LIBRARY_ADDED_SQL} WHERE path IN (old.file_path, new.file_path);
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS downloads_added_delete
+        AFTER DELETE ON downloaded_songs BEGIN
+            {_LIBRARY_ADDED_SQL} WHERE path = old.file_path;
+        END
+        """,
+    ):
+        connection.execute(trigger)
+
+
+DOWNLOADS_MIGRATIONS = [
+    Migration(1, "Index downloads by date and file path", _add_download_indexes),
+    Migration(2, "Add the download library file index", _add_library_files),
+    Migration(3, "Store audio tags of library files", _add_library_tags),
+    Migration(4, "Add full-text search over downloads", _add_downloads_search),
+    Migration(5, "Index library files by date added", _add_library_sort_key),
+]
+
 
 @contextlib.contextmanager
 def change_dir(new_dir: str) -> Iterator[None]:
@@ -56,7 +253,7 @@ class DownloadsDatabase:
 
     def _initialize_database(self):
         """Create the downloads database with proper schema and indexes."""
-        with self.db_conn.get_connection() as conn:
+        with self.db_conn as conn:
             cursor = conn.cursor()
 
             # Create downloads table
@@ -70,9 +267,11 @@ class DownloadsDatabase:
                     download_date INTEGER,
                     file_path TEXT,
                     cover_url TEXT,
+                    track_id TEXT,
                     UNIQUE(track_name, artist_name, album_name)
                 )
             """)
+            ensure_column(conn, "downloaded_songs", "track_id", "TEXT")
 
             # Create indexes for faster searching
             cursor.execute(
@@ -85,11 +284,22 @@ class DownloadsDatabase:
                 "CREATE INDEX IF NOT EXISTS idx_album_name ON downloaded_songs(album_name)"
             )
             cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_download_date ON downloaded_songs(download_date)"
+                "CREATE INDEX IF NOT EXISTS idx_downloads_track_id "
+                "ON downloaded_songs(track_id)"
             )
 
             conn.commit()
 
+        run_migrations(self.db_conn, DOWNLOADS_MIGRATIONS)
+
+        with self.db_conn.reader() as conn:
+            self._has_fts = (
+                conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'downloads_fts'"
+                ).fetchone()
+                is not None
+            )
+
     def _get_playlist_db(self):
         """Lazy initialization of the playlist database connection."""
         if self.playlist_db is None:
@@ -100,24 +310,32 @@ class DownloadsDatabase:
 
     def save_downloaded_song(self, batch_data: List[tuple]) -> int:
         """
-        Save a downloaded song to the database.
+        Save downloaded songs to the database and the search index.
 
         Args:
-            song_data: Dictionary containing song metadata
+            batch_data: Rows built by _flush_data_in_batch
 
         Returns:
-            The ID of the inserted/updated record
+            Number of songs saved, 0 on a database error
         """
         try:
-            with self.db_conn.get_connection() as conn:
+            with self.db_conn as conn:
                 cursor = conn.cursor()
 
+                # An upsert rather than INSERT OR REPLACE, whose implicit
+                # delete wouldn't fire the full-text index trigger
                 cursor.executemany(
                     """
-                    INSERT OR REPLACE INTO downloaded_songs
-                    (track_name, artist_name, album_name, duration, download_date, 
-                     file_path, cover_url)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    INSERT INTO downloaded_songs
+                    (track_name, artist_name, album_name, duration, download_date,
+                     file_path, cover_url, track_id)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(track_name, artist_name, album_name) DO UPDATE SET
+                        duration = excluded.duration,
+                        download_date = excluded.download_date,
+                        file_path = excluded.file_path,
+                        cover_url = excluded.cover_url,
+                        track_id = excluded.track_id
                 """,
                     batch_data,
                 )
@@ -128,6 +346,31 @@ class DownloadsDatabase:
             logger.error(f"Database error when saving song: {e}", exc_info=True)
             return 0
 
+        self._index_downloads(batch_data)
+        return len(batch_data)
+
+    def _index_downloads(self, batch_data: List[tuple]) -> None:
+        """
+        Make saved downloads searchable without rebuilding the search index.
+
+        Like the index build, which merges downloads into the cached songs,
+        the download's details take precedence over those already indexed
+        under the track name.
+        """
+        for row in batch_data:
+            song = {
+                "track_name": row[0],
+                "url": row[5],
+                "artist_name": row[1],
+                "album_name": row[2],
+                "thumbnail_url": row[6],
+                "duration": row[3],
+            }
+            existing = song_search_index.get(row[0]) or {}
+            song_search_index.add(
+                row[0], {**existing, **{k: v for k, v in song.items() if v}}
+            )
+
     def _flush_data_in_batch(self, songs_data: List[Dict[str, Any]]) -> List[tuple]:
         """
         Convert a list of dictionaries to a list of tuples for batch insertion.
@@ -149,6 +392,7 @@ class DownloadsDatabase:
                 download_time,
                 data.get("file_path", ""),
                 data.get("cover_url", ""),
+                track_id_for_url(data.get("file_path", "")),
             )
             for data in songs_data
         ]
@@ -178,17 +422,132 @@ class DownloadsDatabase:
             download_time = int(time.time())
             playlist_songs_metadata = [
                 (
-                    data.get("name", ""),  # track_name
-                    data.get("artists", ""),  # artist_name
-                    "",  # placeholder for field 2
+                    data[0],  # track_name
+                    data[1],  # artist_name
+                    data[7],  # track_id
                     "",  # placeholder for field 3
                     download_time,  # added_at
                 )
-                for data in songs_data
+                for data in songs_metadata_batch
             ]
 
             playlist_db.batch_save_songs_to_playlist(playlist, playlist_songs_metadata)
 
+    def _text_condition(
+        self, columns: Tuple[str, ...], value: str
+    ) -> Tuple[Optional[str], Optional[str], List[str]]:
+        """
+        Build the condition for a substring match on some text columns.
+
+        Returns:
+            Tuple of (FTS5 query, LIKE clause, LIKE parameters); only one of
+            the query and the clause is set
+        """
+        if self._has_fts and len(value) >= _MIN_FTS_TERM:
+            phrase = '"' + value.replace('"', '""') + '"'
+            return f"{{{' '.join(columns)}}} : {phrase}", None, []
+
+        clause = " OR ".join(f"{column} LIKE ?" for column in columns)
+        return None, f"({clause})", [f"%{value}%"] * len(columns)
+
+    def _build_downloads_query(
+        self,
+        order_by: str,
+        descending: bool,
+        filters: Optional[Dict[str, Any]],
+        search: Optional[str],
+        after: Optional[Tuple[Any, int]] = None,
+    ) -> Tuple[str, List[Any]]:
+        """
+        Build the query of a page of downloads, without its LIMIT.
+
+        Args:
+            order_by: Sort key, one of SORT_KEYS
+            descending: Whether to sort in descending order
+            filters: Dictionary of column:value pairs to filter results
+            search: Text to find in the track, artist or album name
+            after: (sort key, id) of the last song of the previous page
+
+        Returns:
+            Tuple of (SQL, parameters)
+
+        Raises:
+            ValueError: If the sort key or a filter column isn't supported
+        """
+        if order_by not in SORT_KEYS:
+            raise ValueError(f"Can't sort downloads by {order_by!r}")
+
+        where: List[str] = []
+        params: List[Any] = []
+        matches: List[str] = []
+        text_conditions: List[Tuple[Tuple[str, ...], str]] = []
+
+        for column, value in (filters or {}).items():
+            if column in _TEXT_COLUMNS:
+                text_conditions.append(((column,), str(value)))
+            elif column in _FILTER_COLUMNS:
+                where.append(f"{column} = ?")
+                params.append(value)
+            else:
+                raise ValueError(f"Can't filter downloads by {column!r}")
+
+        if search:
+            text_conditions.append((_TEXT_COLUMNS, search))
+
+        for columns, value in text_conditions:
+            match, clause, clause_params = self._text_condition(columns, value)
+            if match:
+                matches.append(match)
+            else:
+                where.append(clause)
+                params.extend(clause_params)
+
+        if matches:
+            where.append(
+                "id IN (SELECT rowid FROM downloads_fts WHERE downloads_fts MATCH ?)"
+            )
+            params.append(" AND ".join(matches))
+
+        if after is not None:
+            # NULLs sort first, so they end descending pages and start ascending ones
+            key, last_id = after
+            if key is None and descending:
+                where.append(f"({order_by} IS NULL AND id < ?)")
+                params.append(last_id)
+            elif key is None:
+                where.append(
+                    f"(({order_by} IS NULL AND id > ?) OR {order_by} IS NOT NULL)"
+                )
+                params.append(last_id)
+            elif descending:
+                where.append(f"(({order_by}, id) < (?, ?) OR {order_by} IS NULL)")
+                params.extend(after)
+            else:
+                where.append(f"({order_by}, id) > (?, ?)")
+                params.extend(after)
+
+        direction = "DESC" if descending else "ASC"
+        query = f"""
+            SELECT id, track_name, artist_name, album_name, duration,
+                   download_date, file_path, cover_url
+            FROM downloaded_songs
+            {"WHERE " + " AND ".join(where) if where else ""}
+            ORDER BY {order_by} {direction}, id {direction}
+        """
+        return query, params
+
+    @staticmethod
+    def _song_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+        """Format a downloads row as song metadata."""
+        return {
+            "track_name": row["track_name"],
+            "url": row["file_path"],
+            "artist_name": row["artist_name"],
+            "album_name": row["album_name"],
+            "thumbnail_url": row["cover_url"],
+            "duration": row["duration"],
+        }
+
     def get_downloaded_songs(
         self,
         limit: int = 50,
@@ -200,76 +559,137 @@ class DownloadsDatabase:
         """
         Get a list of downloaded songs formatted as a dictionary with song names as keys.
 
+        Deep offsets still read and discard the rows before them; use
+        iter_downloaded_songs to page through many songs.
+
         Args:
             limit: Maximum number of songs to return
             offset: Number of songs to skip (for pagination)
-            order_by: Column to order results by
+            order_by: Column to order results by, one of SORT_KEYS
             descending: Whether to sort in descending order
             filters: Dictionary of column:value pairs to filter results
 
         Returns:
             Dictionary where keys are song names and values are song metadata dictionaries
         """
-        try:
-            with self.db_conn.get_connection() as conn:
-                cursor = conn.cursor()
+        query, params = self._build_downloads_query(
+            order_by, descending, filters, search=None
+        )
 
-                query = """
-                    SELECT id, track_name, artist_name, album_name, duration, 
-                           download_date, file_path, cover_url 
-                    FROM downloaded_songs
-                """
-
-                params = []
-
-                # Add WHERE clauses for any filters
-                if filters:
-                    where_clauses = []
-                    for column, value in filters.items():
-                        if column in ["track_name", "artist_name", "album_name"]:
-                            where_clauses.append(f"{column} LIKE ?")
-                            params.append(f"%{value}%")
-                        else:
-                            where_clauses.append(f"{column} = ?")
-                            params.append(value)
-
-                    if where_clauses:
-                        query += " WHERE " + " AND ".join(where_clauses)
-
-                # Add ORDER BY clause
-                direction = "DESC" if descending else "ASC"
-                query += f" ORDER BY {order_by} {direction}"
-
-                # Add LIMIT and OFFSET
-                query += " LIMIT ? OFFSET ?"
-                params.extend([limit, offset])
-
-                cursor.execute(query, params)
-
-                # Convert the results to the requested format
-                result = {}
-                for row in cursor.fetchall():
-                    song_dict = dict(row)
-                    track_name: str = song_dict.get("track_name", "")
-
-                    # Format the song data according to the requested format
-                    song_data = {
-                        "track_name": track_name,
-                        "url": song_dict.get("file_path", ""),
-                        "artist_name": song_dict.get("artist_name", ""),
-                        "album_name": song_dict.get("album_name", ""),
-                        "thumbnail_url": song_dict.get("cover_url", ""),
-                        "duration": song_dict.get("duration", 0),
-                    }
-
-                    result[track_name] = song_data.copy()
-
-                return result
+        try:
+            with self.db_conn.reader() as conn:
+                rows = conn.execute(
+                    query + " LIMIT ? OFFSET ?", [*params, limit, offset]
+                ).fetchall()
 
         except sqlite3.Error as e:
             logger.error(f"Database error when fetching songs: {e}", exc_info=True)
             return {}
 
+        return {row["track_name"]: self._song_from_row(row) for row in rows}
+
+    def iter_downloaded_songs(
+        self,
+        page_size: int = 50,
+        order_by: str = "download_date",
+        descending: bool = True,
+        filters: Optional[Dict[str, Any]] = None,
+        search: Optional[str] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Page through downloaded songs.
+
+        Each page continues after the (sort key, id) of the previous one, so
+        every page costs the same no matter how deep it is, and nothing is
+        held open between pages.
+
+        Args:
+            page_size: Number of songs per page
+            order_by: Column to order results by, one of SORT_KEYS
+            descending: Whether to sort in descending order
+            filters: Dictionary of column:value pairs to filter results
+            search: Text to find in the track, artist or album name
+
+        Yields:
+            Lists of song metadata dictionaries, in the format of
+            get_downloaded_songs values
+
+        Raises:
+            ValueError: If the sort key or a filter column isn't supported
+        """
+        # Build the first query eagerly, so bad arguments fail at the call
+        query, params = self._build_downloads_query(
+            order_by, descending, filters, search
+        )
+        return self._iter_download_pages(
+            query, params, page_size, order_by, descending, filters, search
+        )
+
+    def _iter_download_pages(
+        self,
+        query: str,
+        params: List[Any],
+        page_size: int,
+        order_by: str,
+        descending: bool,
+        filters: Optional[Dict[str, Any]],
+        search: Optional[str],
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield the pages of iter_downloaded_songs."""
+        while True:
+            try:
+                with self.db_conn.reader() as conn:
+                    rows = conn.execute(query + " LIMIT ?", [*params, page_size])
+                    rows = rows.fetchall()
+            except sqlite3.Error as e:
+                logger.error(f"Database error when paging songs: {e}", exc_info=True)
+                return
+
+            if rows:
+                yield [self._song_from_row(row) for row in rows]
+            if len(rows) < page_size:
+                return
+
+            after = (rows[-1][order_by], rows[-1]["id"])
+            query, params = self._build_downloads_query(
+                order_by, descending, filters, search, after
+            )
+
+    def get_file_paths_by_track_names(self, track_names: List[str]) -> Dict[str, str]:
+        """
+        Map track names to downloaded file paths with a single indexed lookup.
+
+        Args:
+            track_names: Exact track names to look up
+
+        Returns:
+            Dictionary with track name as key and the latest file path as value
+        """
+        paths: Dict[str, str] = {}
+        names = list(dict.fromkeys(track_names))
+
+        try:
+            with self.db_conn.reader() as conn:
+                cursor = conn.cursor()
+
+                for start in range(0, len(names), 500):
+                    chunk = names[start : start + 500]
+                    placeholders = ", ".join("?" for _ in chunk)
+                    cursor.execute(
+                        f"""
+                        SELECT track_name, file_path FROM downloaded_songs
+                        WHERE track_name IN ({placeholders}) AND file_path != ''
+                        ORDER BY download_date
+                        """,
+                        chunk,
+                    )
+                    paths.update({row[0]: row[1] for row in cursor.fetchall()})
+
+        except sqlite3.Error as e:
+            logger.error(f"Database error when looking up files: {e}", exc_info=True)
+
+        return paths
+
 
 class ExtractMetadata:
     def __init__(
@@ -286,64 +706,78 @@ class ExtractMetadata:
         """
         self.database = database or DownloadsDatabase()
         self.output_dir = output_dir
-        self._file_path_cache: Dict[Tuple[str, str], Optional[Path]] = {}
+        self._metadata_streams: Dict[Path, SaveFileStream] = {}
         self.playlist = playlist
 
-    def extract_metadata_from_spotdl_saved(self, batch_size: int = DEFAULT_BATCH_SIZE):
+    def extract_metadata_from_spotdl_saved(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        metadata_file: str | Path = METADATA_FILE,
+    ):
         """
         Extract metadata from the saved metadata.spotdl file and update the database.
 
+        The file is read incrementally; calling this again for the same file
+        only processes the records appended since the previous call.
+
         Args:
             batch_size: Number of songs to process in a batch
+            metadata_file: spotdl save file to read
         """
+        stream = self._metadata_streams.get(Path(metadata_file))
+        if stream is None:
+            stream = self._metadata_streams[Path(metadata_file)] = SaveFileStream(
+                metadata_file
+            )
+        first_pass = stream.offset == 0
+
         try:
-            with open(METADATA_FILE, "r") as file:
-                try:
-                    songs_data = json.loads(file.read())
-
-                    if not songs_data:
-                        console.print_warning("No songs found in metadata file")
-                        return
-
-                    # Process songs in batches
-                    songs_to_update = []
-                    for song_data in songs_data:
-                        song_name = song_data.get("name", "")
-                        artists = song_data.get("artists", [])
-                        artist_str = (
-                            ", ".join(artists) if isinstance(artists, list) else artists
-                        )
-
-                        song_data = self._replace_artists_in_extracted_metadata(
-                            data=song_data, artists=artist_str
-                        )
-
-                        file_path = self._find_downloaded_file(
-                            artist_str, song_name, self.output_dir
-                        )
-                        if file_path:
-                            song_data = self._add_filepath_to_extracted_metadata(
-                                data=song_data, file_path=str(file_path)
-                            )
-                            if song_data:  # Skip empty metadata
-                                songs_to_update.append(song_data)
-
-                                # Process in batches
-                                if len(songs_to_update) >= batch_size:
-                                    self._update_database_batch(songs_to_update)
-                                    songs_to_update = []
-
-                    # Process any remaining songs
-                    if songs_to_update:
-                        self._update_database_batch(songs_to_update)
-
-                except json.JSONDecodeError:
-                    console.print_error(f"Invalid JSON in {METADATA_FILE} file")
-                    logger.error("Invalid JSON in metadata.spotdl file")
+            songs_to_update = []
+            found = 0
+
+            # Records are parsed one at a time, so memory stays bounded by the
+            # batch size rather than the size of the file
+            for song_data in stream.records():
+                found += 1
+                song_name = song_data.get("name", "")
+                artists = song_data.get("artists", [])
+                artist_str = (
+                    ", ".join(artists) if isinstance(artists, list) else artists
+                )
+
+                song_data = self._replace_artists_in_extracted_metadata(
+                    data=song_data, artists=artist_str
+                )
+
+                file_path = self._find_downloaded_file(
+                    artist_str, song_name, self.output_dir
+                )
+                if file_path:
+                    song_data = self._add_filepath_to_extracted_metadata(
+                        data=song_data, file_path=str(file_path)
+                    )
+                    if song_data:  # Skip empty metadata
+                        songs_to_update.append(song_data)
+
+                        # Process in batches
+                        if len(songs_to_update) >= batch_size:
+                            self._update_database_batch(songs_to_update)
+                            songs_to_update = []
+
+            # Process any remaining songs
+            if songs_to_update:
+                self._update_database_batch(songs_to_update)
+
+            if not found and first_pass:
+                console.print_warning("No songs found in metadata file")
+
+        except json.JSONDecodeError:
+            console.print_error(f"Invalid JSON in {METADATA_FILE} file")
+            logger.error(f"Invalid JSON in {metadata_file}", exc_info=True)
 
         except FileNotFoundError:
             console.print_error(f"Error: {METADATA_FILE} file not found")
-            logger.error(f"{METADATA_FILE} file not found")
+            logger.error(f"{metadata_file} file not found")
 
         except Exception as e:
             console.print_error(f"Failed to extract metadata: {str(e)}")
@@ -398,12 +832,13 @@ class ExtractMetadata:
             data_batch: List of metadata records to update
         """
         if data_batch:
+            # Update search cache database for consistency, before the
+            # downloads, whose details take precedence in the search index
+            self._update_search_cache_database(data_batch)
+
             # Update downloads database and playlist database
             self.database.batch_save_songs(data_batch, self.playlist)
 
-            # Also update search cache database for consistency
-            self._update_search_cache_database(data_batch)
-
         else:
             console.print_warning("No metadata to update in batch")
 
@@ -421,22 +856,8 @@ class ExtractMetadata:
         Returns:
             Path to the downloaded file, or None if not found
         """
-        # Check cache first
-        cache_key = (artist.lower(), title.lower())
-        if cache_key in self._file_path_cache:
-            return self._file_path_cache[cache_key]
-
-        all_files = os.listdir(output_dir)
-        file_name = FuzzySearcher(threshold=0.5).find_best_match(
-            f"{artist} - {title}", all_files
-        )
-
-        file_path = output_dir / file_name if file_name else None
-
-        if file_path and file_path.exists():
-            self._file_path_cache[cache_key] = file_path
-
-        return file_path if file_path and file_path.exists() else None
+        # The index scans the directory once and rescans only when it changes
+        return get_directory_index(output_dir).find(artist, title)
 
     def _update_search_cache_database(self, data_batch: List[Dict[str, Any]]):
         """
@@ -449,28 +870,23 @@ class ExtractMetadata:
         try:
             from aurras.core.cache.updater import UpdateSearchHistoryDatabase
 
-            search_updater = UpdateSearchHistoryDatabase()
-
-            for song_data in data_batch:
-                # Extract relevant fields for search cache
-                track_name = song_data.get("name", "")
-                artist_name = song_data.get("artists", "")
-                album_name = song_data.get("album_name", "")
-                file_path = song_data.get("file_path", "")
-
-                if track_name and file_path:
-                    # Use track name as the search query (what user would search for)
-                    search_updater.save_to_cache(
-                        song_user_searched=track_name,
-                        track_name=track_name,
-                        url=file_path,  # Local file path as URL for downloaded songs
-                        artist_name=artist_name,
-                        album_name=album_name,
-                        thumbnail_url="",  # No thumbnail for local files
-                        duration=song_data.get("duration", 0),
-                    )
+            # Use track name as the search query (what user would search for),
+            # and the local file path as URL for downloaded songs
+            saved = UpdateSearchHistoryDatabase().save_many_to_cache(
+                {
+                    "song_user_searched": song_data.get("name", ""),
+                    "track_name": song_data.get("name", ""),
+                    "url": song_data.get("file_path", ""),
+                    "artist_name": song_data.get("artists", ""),
+                    "album_name": song_data.get("album_name", ""),
+                    "thumbnail_url": "",  # No thumbnail for local files
+                    "duration": song_data.get("duration", 0),
+                }
+                for song_data in data_batch
+                if song_data.get("name") and song_data.get("file_path")
+            )
 
-            logger.info(f"Updated search cache database with {len(data_batch)} songs")
+            logger.info(f"Updated search cache database with {saved} songs")
 
         except Exception as e:
             logger.warning(f"Failed to update search cache database: {str(e)}")
@@ -487,6 +903,8 @@ class SongDownloader:
         download_path: str = None,
         format: str = None,
         bitrate: str = None,
+        workers: Optional[int] = None,
+        on_event: Optional[Callable[[DownloadEvent, DownloadStats], None]] = None,
     ):
         """
         Initialize the SongDownloader.
@@ -496,7 +914,8 @@ class SongDownloader:
             downlaod_path: Path to directory for song[s] to download in
             format: Format of the song[s] to download
             bitrate: Quality of the song[s] to download
-            path_manager: Optional path manager for dependency injection
+            workers: Number of parallel spotdl processes (from settings if None)
+            on_event: Called with each track/shard event and the running stats
         """
         self._path_manager = _path_manager
         self.song_list_to_download = song_list_to_download
@@ -504,9 +923,14 @@ class SongDownloader:
         self.format = format if format is not None else SETTINGS.download_format
         self.bitrate = bitrate if bitrate is not None else SETTINGS.download_bitrate
 
+        self.workers = workers
+        self.on_event = on_event
+        self.stats: Optional[DownloadStats] = None
+
         self.metadata_extractor = ExtractMetadata(
             output_dir=self.download_path, playlist=playlist_path
         )
+        self._metadata_lock = threading.Lock()
 
     def _get_playlist_path(self, playlist_path: str = None) -> Optional[Path | None]:
         """
@@ -552,19 +976,13 @@ class SongDownloader:
                 text_style="bold",
                 print_it=True,
             )
-            if self._download_with_subprocess():
-                # This way if download fails, we dont extract metadata
-                with change_dir(self.download_path):
-                    self.metadata_extractor.extract_metadata_from_spotdl_saved()
-                return True
-            else:
-                return False
+            return self._download_with_scheduler()
 
         except KeyboardInterrupt:
             console.print_error("Download cancelled by user")
             return False
 
-        except subprocess.CalledProcessError as e:
+        except OSError as e:
             logger.error(f"Subprocess error: {e}", exc_info=True)
             console.print_error(f"Error running spotdl: {str(e)}")
             return False
@@ -573,61 +991,78 @@ class SongDownloader:
             logger.error(f"Failed to download songs: {e}", exc_info=True)
             console.print_error(f"Error during download: {str(e)}")
             return False
-            console.print_error(f"Error during download: {str(e)}")
 
-    def _download_with_subprocess(self):
+    def _download_with_scheduler(self) -> bool:
         """
-        Download songs using spotdl via subprocess.
-        Uses a consistent output format to make filenames predictable.
-        Leverages spotdl's built-in retry mechanism.
-        """
-        # Format: {artist} - {title}.{output-ext}
-        output_format = "{artists} - {title}"
-
-        cmd_parts = [
-            f"spotdl download {' '.join(f'"{item}"' for item in self.song_list_to_download)}",
-            f'--output "{output_format}"',
-        ]
-
-        if self.format:
-            cmd_parts.append(f'--format "{self.format}"')
-
-        if self.bitrate:
-            cmd_parts.append(f'--bitrate "{self.bitrate}"')
-
-        cmd_parts.append(f"--max-retries {MAX_RETRIES}")
+        Download songs with parallel spotdl workers.
 
-        cmd_parts.append("--ytm-data --preload --save-file metadata.spotdl")
+        Uses a consistent output format to make filenames predictable and
+        leverages spotdl's built-in retry mechanism per track; shards that
+        still fail are retried by the scheduler.
+        """
+        self.download_path.mkdir(parents=True, exist_ok=True)
+        # Like spotdl's --save-file, each download starts a fresh metadata.spotdl
+        (self.download_path / METADATA_FILE).unlink(missing_ok=True)
+
+        scheduler = DownloadScheduler(
+            self.song_list_to_download,
+            self.download_path,
+            format=self.format,
+            bitrate=self.bitrate,
+            workers=self.workers,
+            max_retries=MAX_RETRIES,
+            on_event=self._on_download_event,
+        )
+        self.stats = scheduler.stats
+
+        logger.info(f"Downloading songs using spotdl with max retries: {MAX_RETRIES}")
+        console.style_text(
+            text=f"Download: {len(self.song_list_to_download)} songs "
+            f"({min(scheduler.workers, len(scheduler.shards))} workers)",
+            style_key="accent",
+            text_style="bold",
+            print_it=True,
+        )
 
-        cmd = " ".join(cmd_parts)
+        success = scheduler.run(on_shard_complete=self._save_shard_metadata)
+        summary = scheduler.stats.summary()
 
-        try:
-            with change_dir(self.download_path):
-                logger.info(
-                    f"Downloading songs using spotdl with max retries: {MAX_RETRIES}"
-                )
-                logger.debug(f"Running command: {cmd}")
-
-                console.style_text(
-                    text=f"Download: {len(self.song_list_to_download)} songs",
-                    style_key="accent",
-                    text_style="bold",
-                    print_it=True,
-                )
+        if success:
+            console.print_success(f"Complete: {summary}")
+        else:
+            console.print_error(
+                f"Error: Some songs failed after {MAX_RETRIES} retries ({summary}). "
+                "Please check your internet connection or the song names."
+            )
+        return success
 
-                subprocess.run(
-                    cmd,
-                    check=True,
-                    shell=True,
-                )
+    def _save_shard_metadata(self, shard: DownloadShard, save_file: Path) -> None:
+        """
+        Add a finished shard's records to metadata.spotdl and ingest them.
 
-            console.print_success(
-                f"Complete: Successfully downloaded {len(self.song_list_to_download)} songs"
+        Shards append to the same save file; the metadata extractor resumes
+        where it left off, so each record is only processed once.
+        """
+        with self._metadata_lock:
+            metadata_file = self.download_path / METADATA_FILE
+            append_save_file(metadata_file, save_file)
+            self.metadata_extractor.extract_metadata_from_spotdl_saved(
+                metadata_file=metadata_file
             )
-            return True
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Download failed: {e}")
-            console.print_error(
-                f"Error: Download failed after {MAX_RETRIES} retries. Please check your internet connection or the song names."
+
+    def _on_download_event(self, event: DownloadEvent, stats: DownloadStats) -> None:
+        """Show per-track progress and pass events on to the listener."""
+        if event.status == "downloaded":
+            snapshot = stats.snapshot()
+            done = snapshot["downloaded"] + snapshot["skipped"]
+            console.style_text(
+                text=f"[{done}/{snapshot['total']}] {event.name} · "
+                f"{snapshot['tracks_per_minute']:.1f} tracks/min",
+                style_key="text_muted",
+                print_it=True,
             )
-            raise
+        elif event.status == "failed":
+            console.print_warning(f"Failed: {event.name}")
+
+        if self.on_event:
+            self.on_event(event, stats)
@@ -0,0 +1,491 @@
+"""
+Download Library Module
+
+This module keeps an index of the audio files in the download directories, so
+the TUI, the offline player and smart restore query the downloads database
+instead of listing directories and checking every file themselves.
+
+A scan walks the songs and playlists directories with os.scandir and records
+each file's size, mtime and partial content hash in the `library_files` table.
+Rescans only hash files whose size or mtime changed. Files that were moved or
+renamed are recognized by their hash, and the downloads (and search cache)
+rows that pointed at the old path are updated.
+
+The scan also reads the audio tags (title, artist, album, duration) of new and
+changed files, so songs added by hand, or whose spotdl metadata is missing,
+still get their details without anyone opening the file later.
+
+Example:
+    ```python
+    library = DownloadLibrary()
+    library.scan()
+    songs = library.get_available_songs()
+    ```
+"""
+
+import os
+import time
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from aurras.core.settings import SETTINGS
+from aurras.utils.logger import get_logger
+from aurras.utils.path_manager import _path_manager
+from aurras.core.tags import AudioTags, read_tags_many
+from aurras.core.cache.tracks import partial_file_hash
+
+logger = get_logger("aurras.core.library", log_to_console=False)
+
+AUDIO_EXTENSIONS = {".mp3", ".flac", ".ogg", ".opus", ".m4a", ".wav"}
+DEFAULT_PAGE_SIZE = 100
+
+# Library songs, newest first. Details recorded by the downloader take
+# precedence; the file's own tags fill in what it left empty, and cover songs
+# that were added by hand. The sort key is stored with each file (see the
+# downloads migrations), so a page is a range scan of idx_library_added that
+# continues after the key of the last row, and only the page's rows are
+# joined with their download.
+_SONGS_SQL = """
+    SELECT l.added,
+           l.path,
+           COALESCE(NULLIF(d.track_name, ''), l.title) AS track_name,
+           COALESCE(NULLIF(d.artist_name, ''), l.artist) AS artist_name,
+           COALESCE(NULLIF(d.album_name, ''), l.album) AS album_name,
+           d.cover_url,
+           COALESCE(NULLIF(d.duration, 0), l.duration) AS duration
+    FROM library_files l
+    LEFT JOIN downloaded_songs d ON d.id = (
+        SELECT id FROM downloaded_songs
+        WHERE file_path = l.path
+        ORDER BY download_date DESC, id DESC
+        LIMIT 1
+    )
+    {where}
+    ORDER BY l.added DESC, l.path DESC
+    LIMIT ?
+"""
+
+
+class LibraryFile(NamedTuple):
+    """An audio file found in the download directories."""
+
+    path: str
+    playlist: str  # Playlist directory name, "" for single songs
+    size: int
+    mtime_ns: int
+    track_id: Optional[str]  # "file:<partial hash>", as in the tracks table
+    title: str = ""
+    artist: str = ""
+    album: str = ""
+    duration: int = 0
+
+    @property
+    def name(self) -> str:
+        """File name of the song."""
+        return os.path.basename(self.path)
+
+
+class ScanResult(NamedTuple):
+    """What a library scan changed."""
+
+    added: int
+    changed: int
+    removed: int  # Files no longer on disk under their indexed path
+    moved: int  # Downloads relinked to a file with the same content hash
+    unchanged: int
+
+
+class DownloadLibrary:
+    """
+    Index of downloaded audio files, stored in the downloads database.
+    """
+
+    def __init__(
+        self,
+        songs_dir: Optional[Path] = None,
+        playlists_dir: Optional[Path] = None,
+    ):
+        """
+        Initialize the library.
+
+        Args:
+            songs_dir: Directory of single downloads (from settings if None)
+            playlists_dir: Directory with one subdirectory per playlist
+        """
+        # Same (unresolved) paths the downloader stores in downloaded_songs
+        self.songs_dir = Path(songs_dir or SETTINGS.download_path).expanduser()
+        self.playlists_dir = Path(playlists_dir or _path_manager.playlists_dir)
+
+        # Creates downloaded_songs and library_files through the migrations
+        from aurras.core.downloader import DownloadsDatabase
+
+        self.db_conn = DownloadsDatabase().db_conn
+
+    def _walk(self) -> List[Tuple[str, str, os.stat_result]]:
+        """List every audio file under the library directories."""
+        found = []
+        roots = [(self.songs_dir, "")]
+
+        try:
+            with os.scandir(self.playlists_dir) as entries:
+                roots += [
+                    (Path(entry.path), entry.name)
+                    for entry in entries
+                    if entry.is_dir() and not entry.name.startswith(".")
+                ]
+        except OSError:
+            pass
+
+        for root, playlist in roots:
+            stack = [str(root)]
+            while stack:
+                try:
+                    with os.scandir(stack.pop()) as entries:
+                        for entry in entries:
+                            if entry.name.startswith("."):
+                                continue
+                            if entry.is_dir(follow_symlinks=False):
+                                # Playlists live in their own root, not in songs
+                                if Path(entry.path) != self.playlists_dir:
+                                    stack.append(entry.path)
+                            elif (
+                                os.path.splitext(entry.name)[1].lower()
+                                in AUDIO_EXTENSIONS
+                            ):
+                                found.append((entry.path, playlist, entry.stat()))
+                except OSError as e:
+                    logger.debug(f"Skipping unreadable directory: {e}")
+
+        return found
+
+    def scan(self) -> ScanResult:
+        """
+        Bring the index up to date with the files on disk.
+
+        Returns:
+            Counts of added, changed, removed, moved and unchanged files
+        """
+        start = time.perf_counter()
+
+        with self.db_conn.reader() as conn:
+            known = {
+                row[0]: ((row[1], row[2], row[3]), row[4])
+                for row in conn.execute(
+                    "SELECT path, size, mtime_ns, playlist, title IS NOT NULL "
+                    "FROM library_files"
+                )
+            }
+
+        now = int(time.time())
+        upserts = []
+        untagged = []  # Unchanged files indexed before tags were stored
+        added = changed = unchanged = 0
+
+        for path, playlist, stat in self._walk():
+            previous, tagged = known.pop(path, (None, False))
+            if previous == (stat.st_size, stat.st_mtime_ns, playlist):
+                unchanged += 1
+                if not tagged:
+                    untagged.append(path)
+                continue
+
+            file_hash = partial_file_hash(path)
+            upserts.append(
+                (
+                    path,
+                    playlist,
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                    f"file:{file_hash}" if file_hash else None,
+                    now,
+                )
+            )
+            if previous is None:
+                added += 1
+            else:
+                changed += 1
+
+        # Whatever wasn't seen on disk is gone (or moved, see below). Files
+        # under other roots belong to libraries with other directories.
+        roots = tuple(
+            os.path.join(str(directory), "")
+            for directory in (self.songs_dir, self.playlists_dir)
+        )
+        removed_paths = [path for path in known if path.startswith(roots)]
+
+        # Unreadable files are stored with empty tags so they aren't retried
+        tags = read_tags_many([row[0] for row in upserts] + untagged)
+        empty = AudioTags()
+        upserts = [row + tuple(tags.get(row[0], empty)) for row in upserts]
+
+        with self.db_conn as conn:
+            conn.executemany(
+                "DELETE FROM library_files WHERE path = ?",
+                [(path,) for path in removed_paths],
+            )
+            conn.executemany(
+                """
+                INSERT INTO library_files
+                (path, playlist, size, mtime_ns, track_id, scanned_at,
+                 title, artist, album, duration)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(path) DO UPDATE SET
+                    playlist = excluded.playlist,
+                    size = excluded.size,
+                    mtime_ns = excluded.mtime_ns,
+                    track_id = excluded.track_id,
+                    scanned_at = excluded.scanned_at,
+                    title = excluded.title,
+                    artist = excluded.artist,
+                    album = excluded.album,
+                    duration = excluded.duration
+                """,
+                upserts,
+            )
+            conn.executemany(
+                """
+                UPDATE library_files SET title = ?, artist = ?, album = ?, duration = ?
+                WHERE path = ?
+                """,
+                [(*tags.get(path, empty), path) for path in untagged],
+            )
+            moves = self._reconcile_moves(conn)
+
+        # Only after the downloads are committed, so a cache failure can't
+        # leave the relinks half done
+        self._relink_cached(moves)
+
+        result = ScanResult(added, changed, len(removed_paths), len(moves), unchanged)
+        logger.info(f"Scanned library in {time.perf_counter() - start:.2f}s: {result}")
+        return result
+
+    def _reconcile_moves(self, conn: sqlite3.Connection) -> List[Tuple[str, str]]:
+        """
+        Point downloads whose file is gone at an indexed file with the same hash.
+
+        Files that already belong to a download (e.g. the playlist copy of a
+        deleted single) aren't taken over, so the gone download stays missing.
+
+        Returns:
+            (old path, new path) of each download that was moved
+        """
+        rows = conn.execute(
+            """
+            SELECT d.id, d.file_path, (
+                SELECT l.path FROM library_files l
+                WHERE l.track_id = d.track_id
+                  AND NOT EXISTS (
+                      SELECT 1 FROM downloaded_songs o WHERE o.file_path = l.path
+                  )
+                ORDER BY l.path LIMIT 1
+            )
+            FROM downloaded_songs d
+            WHERE d.track_id LIKE 'file:%'
+              AND NOT EXISTS (
+                  SELECT 1 FROM library_files l WHERE l.path = d.file_path
+              )
+            ORDER BY d.id
+            """
+        ).fetchall()
+
+        # Two gone downloads of the same content can't both take one file
+        moves = []
+        taken = set()
+        for download_id, old_path, new_path in rows:
+            if new_path and new_path not in taken:
+                taken.add(new_path)
+                moves.append((download_id, old_path, new_path))
+        if not moves:
+            return []
+
+        conn.executemany(
+            "UPDATE downloaded_songs SET file_path = ? WHERE id = ?",
+            [(new_path, download_id) for download_id, _, new_path in moves],
+        )
+        moved = [(old_path, new_path) for _, old_path, new_path in moves]
+
+        logger.info(f"Reconciled {len(moved)} moved downloads")
+        return moved
+
+    def _relink_cached(self, moved: List[Tuple[str, str]]) -> None:
+        """
+        Update the search cache rows of moved downloads to their new path.
+
+        Downloaded songs are cached for search under their file path. A cached
+        row for the old path is dropped when the new path is already cached,
+        with its lyrics moved onto the row that is kept.
+        """
+        if not moved:
+            return
+
+        from aurras.core.cache import cache_db_connection
+
+        try:
+            with cache_db_connection as cache_conn:
+                for old_path, new_path in moved:
+                    cache_conn.execute(
+                        "UPDATE tracks SET url = ? WHERE url = ?", (new_path, old_path)
+                    )
+                    cache_conn.execute(
+                        "UPDATE OR IGNORE cache SET url = ? WHERE url = ?",
+                        (new_path, old_path),
+                    )
+                    # Rows still on the old path collided with a cached new path
+                    cache_conn.execute(
+                        """
+                        UPDATE lyrics SET cache_id = (
+                            SELECT id FROM cache WHERE url = ?
+                        )
+                        WHERE cache_id IN (SELECT id FROM cache WHERE url = ?)
+                        """,
+                        (new_path, old_path),
+                    )
+                    cache_conn.execute("DELETE FROM cache WHERE url = ?", (old_path,))
+        except sqlite3.Error as e:
+            logger.error(f"Failed to relink cached songs of moved downloads: {e}")
+
+    def get_files(self, playlist: str = "") -> List[LibraryFile]:
+        """
+        Get the indexed files of a playlist, or the single songs.
+
+        Args:
+            playlist: Playlist directory name, "" for single songs
+
+        Returns:
+            Files ordered by path
+        """
+        with self.db_conn.reader() as conn:
+            rows = conn.execute(
+                """
+                SELECT path, playlist, size, mtime_ns, track_id,
+                       COALESCE(title, ''), COALESCE(artist, ''),
+                       COALESCE(album, ''), COALESCE(duration, 0)
+                FROM library_files
+                WHERE playlist = ? ORDER BY path
+                """,
+                (playlist,),
+            ).fetchall()
+
+        return [LibraryFile(*row) for row in rows]
+
+    def get_playlists(self) -> List[str]:
+        """Get the names of the playlists that have downloaded files."""
+        with self.db_conn.reader() as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT playlist FROM library_files "
+                "WHERE playlist != '' ORDER BY playlist"
+            ).fetchall()
+
+        return [row[0] for row in rows]
+
+    def _song_rows(
+        self, after: Optional[Tuple[int, str]], limit: int
+    ) -> List[sqlite3.Row]:
+        """Fetch one page of library songs, after the given sort key."""
+        if after is None:
+            sql, params = _SONGS_SQL.format(where=""), (limit,)
+        else:
+            sql = _SONGS_SQL.format(where="WHERE (l.added, l.path) < (?, ?)")
+            params = (*after, limit)
+
+        with self.db_conn.reader() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    @staticmethod
+    def _song_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+        """Build the song metadata dictionary of a library song."""
+        # Untagged files are named after the file, as spotdl names them
+        track_name = row["track_name"] or Path(row["path"]).stem
+        return {
+            "track_name": track_name,
+            "url": row["path"],
+            "artist_name": row["artist_name"] or "",
+            "album_name": row["album_name"] or "",
+            "thumbnail_url": row["cover_url"],
+            "duration": row["duration"] or 0,
+        }
+
+    def get_available_songs(
+        self, limit: Optional[int] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the songs in the library, newest first.
+
+        Args:
+            limit: Maximum number of songs to return (all if None)
+
+        Returns:
+            Dictionary with track name as key and song metadata as value, in
+            the format of DownloadsDatabase.get_downloaded_songs
+        """
+        songs = {}
+        for row in self._song_rows(None, -1 if limit is None else limit):
+            song = self._song_from_row(row)
+            songs[song["track_name"]] = song
+
+        return songs
+
+    def iter_available_songs(
+        self, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Page through the songs in the library, newest first.
+
+        Each page is a separate short query that continues after the last song
+        of the previous one, so no read transaction is held open between pages
+        and only one page is in memory at a time.
+
+        Args:
+            page_size: Number of songs per page
+
+        Yields:
+            Lists of song metadata, in the format of get_available_songs values
+        """
+        after = None
+        while True:
+            rows = self._song_rows(after, page_size)
+            if rows:
+                yield [self._song_from_row(row) for row in rows]
+            if len(rows) < page_size:
+                return
+
+            last = rows[-1]
+            after = (last["added"], last["path"])
+
+    def get_missing_downloads(self) -> List[Dict[str, Any]]:
+        """
+        Get downloaded songs whose file isn't in the library.
+
+        Returns:
+            List of dictionaries with id, title, artist, source_url, local_path
+            and playlist_id (the playlist directory name, None for single songs)
+        """
+        with self.db_conn.reader() as conn:
+            rows = conn.execute(
+                """
+                SELECT d.id, d.track_name, d.artist_name, d.file_path
+                FROM downloaded_songs d
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM library_files l WHERE l.path = d.file_path
+                )
+                ORDER BY d.id
+                """
+            ).fetchall()
+
+        missing = []
+        for row in rows:
+            local_path = Path(row["file_path"] or "")
+            in_playlist = local_path.parent.parent == self.playlists_dir
+            missing.append(
+                {
+                    "id": row["id"],
+                    "title": row["track_name"],
+                    "artist": row["artist_name"],
+                    "source_url": "",
+                    "local_path": row["file_path"],
+                    "playlist_id": local_path.parent.name if in_playlist else None,
+                }
+            )
+
+        return missing
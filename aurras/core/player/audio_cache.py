@@ -0,0 +1,288 @@
+"""
+Audio Cache Module
+
+This module keeps the songs streamed from YouTube on disk, so playing a song
+again is served from a local file instead of being downloaded again.
+
+mpv records each streamed song with its stream-record option while it plays.
+A recording that played to the end without seeking is complete and is moved
+into the cache; any other recording is thrown away. The cache is bounded in
+size, evicting the least recently played songs, and is indexed (with its hit
+counters) in the cache database.
+
+Example:
+    ```python
+    audio_cache = AudioCache()
+    path = audio_cache.lookup("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+    ```
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from aurras.core.settings import SETTINGS
+from aurras.utils.logger import get_logger
+from aurras.utils.path_manager import _path_manager
+from aurras.core.cache import cache_db_connection
+from aurras.core.cache.tracks import youtube_video_id
+
+logger = get_logger("aurras.core.player.audio_cache", log_to_console=False)
+
+DEFAULT_SIZE_MB = 1024
+# Matroska holds any audio codec YouTube serves, so recordings need no remux
+CACHE_SUFFIX = ".mka"
+PART_SUFFIX = ".part" + CACHE_SUFFIX
+# Recordings left behind for this long (e.g. by a crash) are deleted
+STALE_PART_AGE = 24 * 60 * 60
+
+
+def _configured_size() -> int:
+    """Get the configured cache size in bytes, falling back to the default."""
+    try:
+        return max(0, int(SETTINGS.audio_cache_size_mb)) * 1024 * 1024
+    except (AttributeError, TypeError, ValueError):
+        return DEFAULT_SIZE_MB * 1024 * 1024
+
+
+class AudioCacheStats(NamedTuple):
+    """Size and hit counters of the audio cache."""
+
+    songs: int
+    size: int  # Bytes
+    max_size: int  # Bytes, 0 if the cache is disabled
+    hits: int  # Plays served from the cache
+    misses: int  # Plays streamed from YouTube
+    evictions: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of online plays served from the cache."""
+        plays = self.hits + self.misses
+        return self.hits / plays if plays else 0.0
+
+
+class AudioCache:
+    """
+    Size-bounded, least-recently-played cache of streamed songs.
+
+    Attributes:
+        directory: Directory holding the cached files
+        max_size: Maximum total size in bytes (0 disables the cache)
+    """
+
+    def __init__(
+        self, directory: Optional[Path] = None, max_size: Optional[int] = None
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Cache directory (from the path manager if None)
+            max_size: Maximum size in bytes (from settings if None)
+        """
+        self.directory = Path(directory or _path_manager.audio_cache_dir)
+        self.max_size = _configured_size() if max_size is None else max_size
+        self.db_conn = cache_db_connection
+
+        if self.enabled:
+            self._remove_stale_parts()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether songs are cached at all."""
+        return self.max_size > 0
+
+    def _remove_stale_parts(self) -> None:
+        """Delete recordings abandoned by earlier sessions."""
+        cutoff = time.time() - STALE_PART_AGE
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(PART_SUFFIX):
+                        if entry.stat().st_mtime < cutoff:
+                            os.unlink(entry.path)
+        except OSError:
+            pass
+
+    def _count(self, conn, name: str, amount: int = 1) -> None:
+        """Add to one of the persistent counters."""
+        conn.execute(
+            """
+            INSERT INTO audio_cache_stats (name, value) VALUES (?, ?)
+            ON CONFLICT(name) DO UPDATE SET value = value + excluded.value
+            """,
+            (name, amount),
+        )
+
+    def lookup(self, url: str) -> Optional[str]:
+        """
+        Get the cached file of a YouTube URL.
+
+        Args:
+            url: URL about to be queued
+
+        Returns:
+            Path to the cached file, or None if the song isn't cached (or the
+            URL isn't a YouTube video)
+        """
+        video_id = youtube_video_id(url)
+        if not video_id or not self.enabled:
+            return None
+
+        with self.db_conn.reader() as conn:
+            row = conn.execute(
+                "SELECT file_name FROM audio_cache WHERE video_id = ?", (video_id,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        path = self.directory / row[0]
+        if not path.exists():
+            with self.db_conn as conn:
+                conn.execute("DELETE FROM audio_cache WHERE video_id = ?", (video_id,))
+            return None
+
+        return str(path)
+
+    def is_cache_file(self, path: str) -> bool:
+        """Check whether a playing file is a cached song or a recording of one."""
+        return Path(path).parent == self.directory and path.endswith(CACHE_SUFFIX)
+
+    def record_play(self, path: str) -> None:
+        """
+        Count a play of a cached song (a hit) or a recorded stream (a miss).
+
+        Args:
+            path: Cached file, or recording path, of the song that started
+        """
+        hit = not path.endswith(PART_SUFFIX)
+        video_id = Path(path).name.split(".", 1)[0]
+
+        with self.db_conn as conn:
+            if hit:
+                conn.execute(
+                    """
+                    UPDATE audio_cache SET last_used_at = ?, hits = hits + 1
+                    WHERE video_id = ?
+                    """,
+                    (int(time.time()), video_id),
+                )
+            self._count(conn, "hits" if hit else "misses")
+
+    def recording_path(self, url: str) -> Optional[str]:
+        """
+        Get the file mpv should record a YouTube URL to while it plays.
+
+        Args:
+            url: YouTube URL about to be streamed
+
+        Returns:
+            Path of the partial recording, or None if it shouldn't be recorded
+        """
+        video_id = youtube_video_id(url)
+        if not video_id or not self.enabled:
+            return None
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"Audio cache directory unavailable: {e}")
+            return None
+
+        # The process ID keeps two running players from sharing a recording
+        return str(self.directory / f"{video_id}.{os.getpid()}{PART_SUFFIX}")
+
+    def store(self, part_path: str) -> bool:
+        """
+        Move a finished recording into the cache, evicting old songs if needed.
+
+        Args:
+            part_path: Path returned by recording_path
+
+        Returns:
+            True if the song was cached
+        """
+        part = Path(part_path)
+        video_id = part.name.split(".", 1)[0]
+        file_name = video_id + CACHE_SUFFIX
+
+        try:
+            size = part.stat().st_size
+            if not size or size > self.max_size:
+                part.unlink()
+                return False
+            os.replace(part, self.directory / file_name)
+        except OSError as e:
+            logger.warning(f"Could not cache the recording of {video_id}: {e}")
+            return False
+
+        now = int(time.time())
+        with self.db_conn as conn:
+            conn.execute(
+                """
+                INSERT INTO audio_cache
+                (video_id, file_name, size, cached_at, last_used_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(video_id) DO UPDATE SET
+                    file_name = excluded.file_name,
+                    size = excluded.size,
+                    cached_at = excluded.cached_at
+                """,
+                (video_id, file_name, size, now, now),
+            )
+            self._evict(conn)
+
+        logger.debug(f"Cached {video_id} ({size / 1024:.0f} KB)")
+        return True
+
+    def discard(self, part_path: str) -> None:
+        """Delete an incomplete recording."""
+        try:
+            os.unlink(part_path)
+        except OSError:
+            pass
+
+    def _evict(self, conn) -> None:
+        """Delete the least recently played songs until the cache fits."""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM audio_cache")
+        excess = total.fetchone()[0] - self.max_size
+        if excess <= 0:
+            return
+
+        evicted = []
+        for video_id, file_name, size in conn.execute(
+            "SELECT video_id, file_name, size FROM audio_cache ORDER BY last_used_at"
+        ):
+            if excess <= 0:
+                break
+            evicted.append((video_id,))
+            excess -= size
+            try:
+                os.unlink(self.directory / file_name)
+            except OSError:
+                pass
+
+        conn.executemany("DELETE FROM audio_cache WHERE video_id = ?", evicted)
+        self._count(conn, "evictions", len(evicted))
+        logger.info(f"Evicted {len(evicted)} songs from the audio cache")
+
+    def stats(self) -> AudioCacheStats:
+        """Get the size and hit counters of the cache."""
+        with self.db_conn.reader() as conn:
+            songs, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM audio_cache"
+            ).fetchone()
+            counters = dict(
+                conn.execute("SELECT name, value FROM audio_cache_stats").fetchall()
+            )
+
+        return AudioCacheStats(
+            songs,
+            size,
+            self.max_size,
+            counters.get("hits", 0),
+            counters.get("misses", 0),
+            counters.get("evictions", 0),
+        )
@@ -5,16 +5,66 @@ This module provides functionality for tracking and replaying recently played so
 """
 
 import time
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from aurras.utils.console import console
 from aurras.utils.logger import get_logger
 from aurras.utils.path_manager import _path_manager
-from aurras.utils.db_connection import DatabaseConnectionManager
+from aurras.utils.db_migrations import Migration, run_migrations
+from aurras.utils.db_connection import DatabaseConnectionManager, ensure_column
 
 logger = get_logger("aurras.core.player.history", log_to_console=False)
 
 
+def _add_history_indexes(connection) -> None:
+    """Index play history by time, and by song for per-song lookups."""
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS idx_play_history_played_at "
+        "ON play_history(played_at)"
+    )
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS idx_play_history_song_name "
+        "ON play_history(song_name, played_at)"
+    )
+
+
+def _add_play_stats(connection) -> None:
+    """
+    Add per-song play statistics, backfilled from the existing history.
+
+    One row per song name, so the player and history views read a song's play
+    count with a single primary key lookup instead of scanning history.
+    """
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS play_stats (
+            song_id TEXT PRIMARY KEY,
+            track_id TEXT,
+            total_plays INTEGER NOT NULL DEFAULT 0,
+            last_played INTEGER,
+            last_source TEXT,
+            total_listen_seconds REAL NOT NULL DEFAULT 0,
+            skips INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID
+    """)
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS idx_play_stats_last_played "
+        "ON play_stats(last_played)"
+    )
+    # SQLite takes the bare columns from the row holding MAX(played_at)
+    connection.execute("""
+        INSERT OR IGNORE INTO play_stats
+        (song_id, track_id, total_plays, last_played, last_source)
+        SELECT song_name, track_id, SUM(play_count), MAX(played_at), source
+        FROM play_history GROUP BY song_name
+    """)
+
+
+HISTORY_MIGRATIONS = [
+    Migration(1, "Index play history by time and song", _add_history_indexes),
+    Migration(2, "Add per-song play statistics", _add_play_stats),
+]
+
+
 class RecentlyPlayedManager:
     """
     A class for managing the history of recently played songs.
@@ -28,6 +78,7 @@ class RecentlyPlayedManager:
     _instance = None  # Singleton instance
     MAX_HISTORY = 500  # Maximum number of songs to keep in history
     DUPLICATE_TIMEFRAME = 30 * 60  # 30 minutes in seconds
+    SKIP_RATIO = 0.5  # Leaving a song before this share of it counts as a skip
 
     def __new__(cls):
         """Ensure singleton pattern - only one instance of history manager exists."""
@@ -74,17 +125,28 @@ class RecentlyPlayedManager:
                     song_name TEXT NOT NULL,
                     played_at INTEGER NOT NULL,
                     source TEXT,
-                    play_count INTEGER DEFAULT 1
+                    play_count INTEGER DEFAULT 1,
+                    track_id TEXT
                 )
             """)
+            ensure_column(conn, "play_history", "track_id", "TEXT")
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_play_history_track_id "
+                "ON play_history(track_id)"
+            )
+
+        run_migrations(self._db_manager, HISTORY_MIGRATIONS)
 
-    def add_to_history(self, song_name: str, source: str = "search") -> None:
+    def add_to_history(
+        self, song_name: str, source: str = "search", track_id: Optional[str] = None
+    ) -> None:
         """
         Add a song to the play history.
 
         Args:
             song_name: Name of the song
             source: Source of the song (e.g., 'search', 'playlist', 'offline')
+            track_id: Canonical ID of the song in the tracks table, if known
         """
         current_time = int(time.time())
 
@@ -112,8 +174,13 @@ class RecentlyPlayedManager:
                         and time_diff <= self.DUPLICATE_TIMEFRAME
                     ):
                         cursor.execute(
-                            "UPDATE play_history SET played_at = ?, play_count = play_count + 1 WHERE id = ?",
-                            (current_time, song_id),
+                            "UPDATE play_history SET played_at = ?, "
+                            "play_count = play_count + 1, "
+                            "track_id = COALESCE(?, track_id) WHERE id = ?",
+                            (current_time, track_id, song_id),
+                        )
+                        self._update_play_stats(
+                            cursor, song_name, source, track_id, current_time
                         )
                         # Explicit commit needed here because we're returning early
                         conn.commit()
@@ -122,8 +189,13 @@ class RecentlyPlayedManager:
 
                 # Add the new song to history
                 cursor.execute(
-                    "INSERT INTO play_history (song_name, played_at, source, play_count) VALUES (?, ?, ?, ?)",
-                    (song_name, current_time, source, 1),
+                    "INSERT INTO play_history "
+                    "(song_name, played_at, source, play_count, track_id) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (song_name, current_time, source, 1, track_id),
+                )
+                self._update_play_stats(
+                    cursor, song_name, source, track_id, current_time
                 )
 
                 # Update the instance variable for navigation
@@ -151,9 +223,104 @@ class RecentlyPlayedManager:
                 logger.error(f"Error adding song to history: {e}")
                 raise
 
+    def _update_play_stats(
+        self,
+        cursor,
+        song_name: str,
+        source: str,
+        track_id: Optional[str],
+        played_at: int,
+    ) -> None:
+        """Count a play in the song's stats row, in the caller's transaction."""
+        cursor.execute(
+            """
+            INSERT INTO play_stats
+            (song_id, track_id, total_plays, last_played, last_source)
+            VALUES (?, ?, 1, ?, ?)
+            ON CONFLICT(song_id) DO UPDATE SET
+                track_id = COALESCE(excluded.track_id, track_id),
+                total_plays = total_plays + 1,
+                last_played = excluded.last_played,
+                last_source = excluded.last_source
+            """,
+            (song_name, track_id, played_at, source),
+        )
+
+    def record_listen(self, song_name: str, seconds: float, duration: float) -> None:
+        """
+        Add listening time to a song's stats, counting a skip if it was cut short.
+
+        Args:
+            song_name: Name of the song
+            seconds: How far into the song playback got
+            duration: Duration of the song in seconds (0 if unknown)
+        """
+        if not song_name or seconds <= 0:
+            return
+
+        skipped = 1 if duration > 0 and seconds < duration * self.SKIP_RATIO else 0
+
+        with self._db_manager as conn:
+            conn.execute(
+                """
+                INSERT INTO play_stats (song_id, total_listen_seconds, skips)
+                VALUES (?, ?, ?)
+                ON CONFLICT(song_id) DO UPDATE SET
+                    total_listen_seconds = total_listen_seconds
+                        + excluded.total_listen_seconds,
+                    skips = skips + excluded.skips
+                """,
+                (song_name, seconds, skipped),
+            )
+
+    def get_play_stats(self, song_name: str) -> Optional[Dict]:
+        """
+        Get the play statistics of a single song.
+
+        Args:
+            song_name: Name of the song
+
+        Returns:
+            Dictionary with song_id, track_id, total_plays, last_played,
+            last_source, total_listen_seconds and skips, or None if the song
+            was never played
+        """
+        with self._db_manager.reader() as conn:
+            row = conn.execute(
+                "SELECT * FROM play_stats WHERE song_id = ?", (song_name,)
+            ).fetchone()
+            return dict(row) if row else None
+
+    def get_recently_played(self, limit: int = 30) -> List[Dict]:
+        """
+        Get the play statistics of the most recently played songs.
+
+        Unlike `get_recent_songs`, each song appears once.
+
+        Args:
+            limit: Maximum number of songs to return
+
+        Returns:
+            List of stats dictionaries, most recently played first
+        """
+        with self._db_manager.reader() as conn:
+            cursor = conn.execute(
+                "SELECT * FROM play_stats WHERE total_plays > 0 "
+                "ORDER BY last_played DESC LIMIT ?",
+                (limit,),
+            )
+            return [dict(row) for row in cursor.fetchall()]
+
+    def get_played_song_count(self) -> int:
+        """Get the number of distinct songs that have been played."""
+        with self._db_manager.reader() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM play_stats WHERE total_plays > 0"
+            ).fetchone()[0]
+
     def get_history_count(self) -> int:
         """Get the total number of songs in history."""
-        with self._db_manager as conn:
+        with self._db_manager.reader() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) FROM play_history")
             return cursor.fetchone()[0]
@@ -169,15 +336,49 @@ class RecentlyPlayedManager:
             List of dictionaries containing song details
         """
         # The DatabaseConnectionManager already sets row_factory = sqlite3.Row in get_connection()
-        with self._db_manager as conn:
+        with self._db_manager.reader() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                "SELECT id, song_name, played_at, source, play_count FROM play_history "
-                "ORDER BY played_at DESC LIMIT ?",
+                "SELECT id, song_name, played_at, source, play_count, track_id "
+                "FROM play_history ORDER BY played_at DESC LIMIT ?",
                 (limit,),
             )
             return [dict(row) for row in cursor.fetchall()]
 
+    def get_recent_tracks(self, limit: int = 500) -> List[dict]:
+        """
+        Get the most recently played songs joined with their track metadata.
+
+        History rows are matched to the tracks table by primary key, so each
+        entry carries the URL, artist and album it was played with. Entries
+        recorded before tracks were linked have an empty URL.
+
+        Args:
+            limit: Maximum number of songs to return
+
+        Returns:
+            List of dictionaries containing history and track details
+        """
+        from aurras.core.cache.tracks import TrackRegistry
+
+        recent_songs = self.get_recent_songs(limit)
+        tracks = TrackRegistry().get_tracks(song["track_id"] for song in recent_songs)
+
+        for song in recent_songs:
+            track = tracks.get(song["track_id"], {})
+            song.update(
+                {
+                    "url": track.get("url", ""),
+                    "track_name": track.get("track_name") or song["song_name"],
+                    "artist_name": track.get("artist_name", ""),
+                    "album_name": track.get("album_name", ""),
+                    "thumbnail_url": track.get("thumbnail_url", ""),
+                    "duration": track.get("duration", 0),
+                }
+            )
+
+        return recent_songs
+
     def get_previous_song(self) -> Optional[str]:
         """
         Get the previous song from history.
@@ -187,7 +388,7 @@ class RecentlyPlayedManager:
         """
         logger.debug(f"Current position in history: {self._current_position}")
 
-        with self._db_manager as conn:
+        with self._db_manager.reader() as conn:
             cursor = conn.cursor()
 
             # Get total number of songs in history
@@ -226,6 +427,7 @@ class RecentlyPlayedManager:
         with self._db_manager as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM play_history")
+            cursor.execute("DELETE FROM play_stats")
 
         self._current_position = -1
         self._last_played_song = None
@@ -17,6 +17,7 @@ from aurras.core.player.mpv.state import (
     HistoryData,
     LyricsState,
 )
+from aurras.core.player.mpv.snapshot import PlayerSnapshot
 
 __all__ = [
     "MPVPlayer",
@@ -29,4 +30,5 @@ __all__ = [
     "UserFeedback",
     "HistoryData",
     "LyricsState",
+    "PlayerSnapshot",
 ]
@@ -8,16 +8,21 @@ all the functionality from other modules into a cohesive player experience.
 import gc
 import time
 import locale
+import threading
 from collections import deque
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor
 
 from aurras.core.player.mpv.ui import PlayerLayout
 from aurras.core.player.mpv.keyboard import setup_key_bindings
+from aurras.core.player.mpv.prefetch import StreamPrefetcher, quote_option
 from aurras.core.player.mpv.events import create_property_observers
+from aurras.core.player.mpv.scheduler import FrameScheduler, FrameStats
+from aurras.core.player.mpv.snapshot import PlayerSnapshot, PropertyMirror
 from aurras.core.player.mpv.lyrics_integration import (
     prefetch_lyrics,
     get_lyrics_display,
+    get_lyrics_next_change,
 )
 from aurras.core.player.mpv.state import (
     PlaybackState,
@@ -31,16 +36,28 @@ from aurras.core.player.mpv.state import (
     LyricsState,
 )
 from aurras.core.player.cache import LRUCache
-from aurras.core.player.python_mpv import MPV, ShutdownError
+from aurras.core.player.python_mpv import (
+    MPV,
+    MpvEventEndFile,
+    MpvEventID,
+    ShutdownError,
+)
+from aurras.core.player.audio_cache import PART_SUFFIX, AudioCache
 from aurras.core.player.history import RecentlyPlayedManager
 from aurras.core.player.memory import memory_stats_decorator, optimize_memory_usage
 from aurras.services.lyrics import LyricsManager
 from aurras.utils.logger import get_logger
 from aurras.core.settings import SETTINGS
-from aurras.utils.console import console
+from aurras.utils.console import console, markup_cache
 
 logger = get_logger("aurras.core.player.mpv.core", log_to_console=False)
 
+# Load the next queue page when playback is this many songs from the end
+QUEUE_REFILL_MARGIN = 5
+# Frames due at a content change are drawn this much later, so the position
+# read by the frame is past the change
+FRAME_SLACK = 0.01
+
 
 class MPVPlayer(MPV):
     """
@@ -94,8 +111,11 @@ class MPVPlayer(MPV):
 
         self._init_state_properties(volume)
         self._configure_mpv(loglevel)
+        self._audio_cache = AudioCache()
+        self._prefetcher = StreamPrefetcher(self, ytdl_format)
 
         self._observers = create_property_observers(self)
+        self._observers.extend(self._properties.observe(self))
         setup_key_bindings(self)
 
         self._active_futures = deque(maxlen=25)
@@ -103,7 +123,21 @@ class MPVPlayer(MPV):
         @self.property_observer("time-pos")
         def _track_time_pos(_name: str, value: Optional[float]) -> None:
             if hasattr(self, "_state"):
+                previous = self._state.elapsed_time
                 self._state.elapsed_time = value if value is not None else 0
+                # The display schedules the progress itself; a jump is a seek
+                if abs(self._state.elapsed_time - previous) > 1:
+                    self._wake_display()
+            if value is not None and hasattr(self, "_history"):
+                self._history.position = value
+
+        @self.property_observer("volume")
+        def _track_volume(_name: str, _value: Optional[float]) -> None:
+            self._wake_display()
+
+        @self.event_callback("file-loaded", "seek", "end-file")
+        def _track_recording(event) -> None:
+            self._on_recording_event(event)
 
     def _init_state_properties(self, volume: int) -> None:
         """Initialize all state properties with default values using dataclasses."""
@@ -120,11 +154,26 @@ class MPVPlayer(MPV):
             else LyricsStatus.LOADING
         )
         self._user_feedback: Optional[UserFeedback] = None
+        # Observed mpv properties, read instead of querying libmpv
+        self._properties = PropertyMirror()
+        # Woken by mpv events and user actions that change what the display shows
+        self._frames = FrameScheduler()
 
         self._metadata_cache = LRUCache(max_size=10)
 
         self._current_song_names = deque(maxlen=200)
 
+        # Pages of (song name, URL) pairs not yet appended to the queue
+        self._queue_pages: Optional[Iterator[List[Tuple[str, str]]]] = None
+        self._queue_refill_lock = threading.Lock()
+        self._queue_refilling = False
+        # Serializes appends with the stream prefetcher's entry swaps
+        self._playlist_lock = threading.Lock()
+
+        # Stream recording of the current song, kept if it plays through
+        self._recording: Optional[str] = None
+        self._recording_complete = False
+
         self.volume = volume
 
         self._memory_stats = {
@@ -138,6 +187,8 @@ class MPVPlayer(MPV):
         self._set_property("msg-level", f"all={loglevel}")
         self._set_property("audio-buffer", 2.0)
         self._set_property("cache", "yes")
+        # Open the next entry early; prefetched streams make this gapless
+        self._set_property("prefetch-playlist", "yes")
 
     # --- Event Handlers ---
 
@@ -166,6 +217,7 @@ class MPVPlayer(MPV):
                 f"Playback {status.lower()}",
                 FeedbackType.PLAYBACK,
             )
+            self._wake_display()
         except Exception as e:
             logger.error(f"Error in pause change handler: {e}")
 
@@ -182,6 +234,7 @@ class MPVPlayer(MPV):
             logger.debug(f"Duration updated to {value:.2f} seconds")
 
             self._check_metadata_complete()
+            self._wake_display()
 
     def _on_metadata_change(self, _name: str, value: Optional[Dict[str, Any]]) -> None:
         """
@@ -215,6 +268,7 @@ class MPVPlayer(MPV):
         if changed:
             logger.debug(f"Updated metadata: {self._metadata}")
             self._check_metadata_complete()
+            self._wake_display()
 
     def _on_playlist_pos_change(self, _name: str, value: Optional[int]) -> None:
         """
@@ -231,12 +285,16 @@ class MPVPlayer(MPV):
         self._state.current_playlist_pos = value
         logger.debug(f"Playlist position changed from {old_pos} to {value}")
 
+        if old_pos != value:
+            self._submit_listen_record(old_pos)
+
         self._state.metadata_ready = False
         self._metadata.title = "Unknown"
         self._metadata.artist = "Unknown"
         self._metadata.album = "Unknown"
 
         self._lyrics.cached_lyrics = None
+        self._lyrics.parsed_lyrics = None
         self._lyrics.no_lyrics_message = None
         self._lyrics.status = LyricsStatus.LOADING
 
@@ -256,6 +314,10 @@ class MPVPlayer(MPV):
         elif value == 0 and self._state.queue_start_index > 0:
             logger.info("Now playing from history songs")
 
+        self._maybe_extend_queue(value)
+        self._prefetcher.on_position(value)
+        self._wake_display()
+
     # --- Main Player API ---
 
     @memory_stats_decorator(interval_seconds=30)
@@ -265,6 +327,8 @@ class MPVPlayer(MPV):
         song_names: List[str],
         show_lyrics: bool = True,
         start_index: int = 0,
+        pending: Optional[Iterable[Tuple[str, str]]] = None,
+        pages: Optional[Iterator[List[Tuple[str, str]]]] = None,
     ) -> int:
         """
         Main entry point for playing media with enhanced UI.
@@ -274,6 +338,11 @@ class MPVPlayer(MPV):
             song_names: List of song names corresponding to the URLs
             show_lyrics: Whether to show lyrics
             start_index: Index in the queue to start from (for history integration)
+            pending: Optional iterable of (song name, URL) pairs that are appended
+                to the queue in the background while playback is running
+            pages: Optional iterator over further pages of (song name, URL)
+                pairs; a page is only appended when playback gets close to the
+                end of the queue, so large libraries are loaded as they're played
 
         Returns:
             Result code (0 for success)
@@ -296,6 +365,17 @@ class MPVPlayer(MPV):
 
             self._initialize_player(queue, start_index)
 
+            self._queue_pages = pages
+            self._maybe_extend_queue(start_index)
+
+            if pending is not None:
+                threading.Thread(
+                    target=self._feed_pending,
+                    args=(pending,),
+                    name="aurras-queue-feeder",
+                    daemon=True,
+                ).start()
+
             first_song = (
                 song_names[start_index]
                 if 0 <= start_index < len(song_names)
@@ -331,6 +411,13 @@ class MPVPlayer(MPV):
             return 2
         finally:
             self._stop_display()
+            self._queue_pages = None
+            self._prefetcher.shutdown()
+            self._record_listen(
+                self._state.current_playlist_pos,
+                self._history.position,
+                self._metadata.duration,
+            )
             if self._thread_pool:
                 self._thread_pool.shutdown(wait=False)
             self.cleanup_resources()
@@ -347,7 +434,8 @@ class MPVPlayer(MPV):
         for i, url in enumerate(queue):
             if url and url.strip():
                 logger.info(f"Using URL for playback: {url}")
-                self.playlist_append(url)
+                url, options = self._playlist_entry(url)
+                self.playlist_append(url, **options)
             else:
                 logger.error(f"No valid URL or file path for song at position {i}")
                 self.playlist_append("null://")
@@ -359,6 +447,152 @@ class MPVPlayer(MPV):
         else:
             logger.error("No playable items in playlist")
 
+    def enqueue(self, url: str, song_name: str) -> None:
+        """
+        Append a song to the end of the running queue.
+
+        Args:
+            url: URL or file path of the song
+            song_name: Name of the song to display
+        """
+        if url and url.strip():
+            url, options = self._playlist_entry(url)
+        else:
+            url, options = "null://", {}
+
+        with self._playlist_lock:
+            # Register the name first so the playlist-pos observer accepts it
+            self._current_song_names.append(song_name)
+            self.playlist_append(url, **options)
+            index = len(self._current_song_names) - 1
+
+        self._prefetcher.on_append(index, self._state.current_playlist_pos)
+
+    def _feed_pending(self, pending: Iterable[Tuple[str, str]]) -> None:
+        """
+        Append songs to the queue as they become available.
+
+        Args:
+            pending: Iterable of (song name, URL) pairs
+        """
+        appended = 0
+        try:
+            for song_name, url in pending:
+                if self._state.stop_requested:
+                    break
+                self.enqueue(url, song_name)
+                appended += 1
+        except ShutdownError:
+            logger.debug("MPV core shutdown while feeding the queue")
+        except Exception as e:
+            logger.error(f"Error appending songs to the queue: {e}")
+        finally:
+            close = getattr(pending, "close", None)
+            if close is not None:
+                close()
+            logger.info(f"Appended {appended} songs to the running queue")
+
+    def _playlist_entry(self, url: str) -> Tuple[str, Dict[str, str]]:
+        """
+        Get what to queue for a URL: its cached file, or the URL to record.
+
+        Args:
+            url: URL or file path of the song
+
+        Returns:
+            Tuple of (file name, loadfile options) for the playlist entry
+        """
+        cached = self._audio_cache.lookup(url)
+        if cached:
+            return cached, {}
+
+        record = self._audio_cache.recording_path(url)
+        return url, ({"stream-record": quote_option(record)} if record else {})
+
+    def _on_recording_event(self, event) -> None:
+        """
+        Cache the stream recording of a song that played through.
+
+        Args:
+            event: mpv file-loaded, seek or end-file event
+        """
+        event_id = event.event_id.value
+
+        if event_id == MpvEventID.FILE_LOADED:
+            record = self._safe_get_property("stream_record")
+            path = self._safe_get_property("path")
+            if record and record.endswith(PART_SUFFIX):
+                self._recording, self._recording_complete = record, True
+                self._submit_cache_task(self._audio_cache.record_play, record)
+            elif path and self._audio_cache.is_cache_file(path):
+                self._submit_cache_task(self._audio_cache.record_play, path)
+        elif event_id == MpvEventID.SEEK:
+            # A seek leaves a gap in the recording
+            self._recording_complete = False
+        elif event_id == MpvEventID.END_FILE and self._recording:
+            record, self._recording = self._recording, None
+            played_through = event.data.reason == MpvEventEndFile.EOF
+            if self._recording_complete and played_through:
+                self._submit_cache_task(self._audio_cache.store, record)
+            else:
+                self._audio_cache.discard(record)
+
+    def _submit_cache_task(self, task, path: str) -> None:
+        """Run an audio cache update off the mpv event thread."""
+        try:
+            self._thread_pool.submit(task, path)
+        except RuntimeError:
+            # The pool is shut down once playback is over
+            task(path)
+
+    def _maybe_extend_queue(self, position: int) -> None:
+        """
+        Load the next queue page in the background if playback nears the end.
+
+        Args:
+            position: Current playlist position
+        """
+        if self._queue_pages is None:
+            return
+        if len(self._current_song_names) - position > QUEUE_REFILL_MARGIN:
+            return
+
+        with self._queue_refill_lock:
+            if self._queue_refilling:
+                return
+            self._queue_refilling = True
+
+        try:
+            self._thread_pool.submit(self._extend_queue)
+        except RuntimeError:
+            # The pool is shut down once playback is over
+            self._queue_refilling = False
+
+    def _extend_queue(self) -> None:
+        """Append the next queue page."""
+        try:
+            pages = self._queue_pages
+            page = next(pages, None) if pages is not None else None
+            if page is None:
+                self._queue_pages = None
+                return
+
+            for song_name, url in page:
+                if self._state.stop_requested:
+                    return
+                self.enqueue(url, song_name)
+            logger.info(
+                f"Appended {len(page)} songs, queue holds "
+                f"{len(self._current_song_names)}"
+            )
+        except ShutdownError:
+            logger.debug("MPV core shutdown while extending the queue")
+        except Exception as e:
+            logger.error(f"Error loading the next queue page: {e}")
+            self._queue_pages = None
+        finally:
+            self._queue_refilling = False
+
     def _start_display(self, song_name: str) -> None:
         """Start the live display UI."""
         self._run_display(song_name)
@@ -389,8 +623,11 @@ class MPVPlayer(MPV):
                     and self._state.playback_state != PlaybackState.STOPPED
                 ):
                     try:
+                        self._frames.begin_frame()
+                        snapshot = self._properties.snapshot
+
                         current_song = self._get_current_song_name()
-                        elapsed = self._state.elapsed_time or 0
+                        elapsed = snapshot.time_pos
                         duration = self._metadata.duration
                         artist = self._metadata.artist
                         album = self._metadata.album
@@ -403,7 +640,9 @@ class MPVPlayer(MPV):
                         else:
                             refresh_count += 1
 
-                        if not metadata_ready and refresh_count > 2:
+                        # Wait one update after a song change, by which time the
+                        # position handler has reset the previous song's state
+                        if not metadata_ready and refresh_count > 0:
                             metadata_ready = self._state.metadata_ready
 
                         # Check for lyrics and history without storing unused variables
@@ -427,7 +666,7 @@ class MPVPlayer(MPV):
                             "elapsed": elapsed,
                             "duration": duration,
                             "playback_state": self._state.playback_state,
-                            "volume": self._safe_get_property("volume", 0),
+                            "volume": snapshot.volume,
                             "theme": self._state.current_theme,
                             "playlist_position": self._state.current_playlist_pos,
                             "playlist_count": len(self._current_song_names),
@@ -446,10 +685,11 @@ class MPVPlayer(MPV):
                         ):
                             player_layout.toggle_lyrics()
 
-                        # Update the UI with current player state
-                        player_layout.update(player_state)
+                        # Redraws only if anything visible changed
+                        redrawn = player_layout.update(player_state)
+                        self._frames.end_frame(redrawn)
 
-                        time.sleep(self._state.current_refresh_rate)
+                        self._frames.wait(self._next_frame_delay(elapsed, duration))
 
                     except ShutdownError:
                         self._state.stop_requested = True
@@ -460,6 +700,19 @@ class MPVPlayer(MPV):
             finally:
                 player_layout.stop_live_ui()
 
+                stats = self._frames.stats()
+                logger.debug(
+                    f"Display: {stats.redraws} redraws in {stats.frames} frames, "
+                    f"{stats.average_time * 1000:.2f} ms average, "
+                    f"{stats.max_time * 1000:.2f} ms max, "
+                    f"{stats.redraws_per_second:.2f} redraws/s"
+                )
+                markup_stats = markup_cache.stats()
+                logger.debug(
+                    f"Markup cache: {markup_stats.size} entries, "
+                    f"{markup_stats.hit_rate:.1%} hit rate"
+                )
+
         except Exception as e:
             logger.error(f"Display thread error: {e}")
             # Don't crash the playback just because the display had an error
@@ -514,6 +767,8 @@ class MPVPlayer(MPV):
             self._thread_pool,
             self._active_futures,
         )
+        # Show the lyrics as soon as they arrive
+        self._lyrics.future.add_done_callback(lambda _: self._wake_display())
 
     # --- Utility Methods ---
 
@@ -532,22 +787,19 @@ class MPVPlayer(MPV):
         """
         Load and categorize play history data for the current song.
 
-        Retrieves play count and last played time from history manager,
-        then categorizes the song as FAVORITE, REGULAR, OCCASIONAL, or NEW
+        Reads the song's play count and last played time from its play stats
+        row, then categorizes the song as FAVORITE, REGULAR, OCCASIONAL, or NEW
         based on play frequency.
 
         Args:
             song_name: Name of the current song
         """
         try:
-            recent_songs = self.history_manager.get_recent_songs(1000)
-
-            matching_songs = [s for s in recent_songs if s["song_name"] == song_name]
+            stats = self.history_manager.get_play_stats(song_name)
 
-            if matching_songs:
-                song_data = matching_songs[0]
-                self._history.play_count = song_data.get("play_count", 1)
-                self._history.last_played = song_data.get("played_at", 0)
+            if stats:
+                self._history.play_count = stats["total_plays"]
+                self._history.last_played = stats["last_played"]
 
                 if self._history.play_count > 10:
                     self._history.category = HistoryCategory.FAVORITE
@@ -576,6 +828,44 @@ class MPVPlayer(MPV):
                 True  # Still mark as loaded to prevent repeated attempts
             )
 
+    def _submit_listen_record(self, position: int) -> None:
+        """
+        Record the listening time of the song that just ended, off the event thread.
+
+        Args:
+            position: Playlist position of the song that ended
+        """
+        listened = self._history.position
+        duration = self._metadata.duration
+        self._history.position = 0
+
+        try:
+            self._thread_pool.submit(
+                self._record_listen, position, listened, duration
+            )
+        except RuntimeError:
+            # Pool already shut down while the player is closing
+            self._record_listen(position, listened, duration)
+
+    def _record_listen(self, position: int, listened: float, duration: float) -> None:
+        """
+        Add listening time (and a skip, if cut short) to a song's play stats.
+
+        Args:
+            position: Playlist position of the song
+            listened: How far into the song playback got, in seconds
+            duration: Duration of the song in seconds
+        """
+        if not (0 <= position < len(self._current_song_names)):
+            return
+
+        try:
+            self.history_manager.record_listen(
+                self._current_song_names[position], listened, duration
+            )
+        except Exception as e:
+            logger.error(f"Error recording listening time: {e}")
+
     def _show_user_feedback(
         self,
         action: str,
@@ -610,22 +900,78 @@ class MPVPlayer(MPV):
                 timestamp=time.time(),
                 timeout=timeout,
             )
+            self._wake_display()
+
+    def _wake_display(self) -> None:
+        """Wake the display loop to redraw the changed state."""
+        self._frames.wake()
+
+    def _next_frame_delay(self, elapsed: float, duration: float) -> Optional[float]:
+        """
+        Get how long until the display changes without any event.
+
+        mpv events wake the display for every other change; what changes with
+        time is the progress bar reaching the next second, the lyrics moving on
+        and a feedback message expiring.
+
+        Args:
+            elapsed: Playback position the last frame showed
+            duration: Song duration in seconds
+
+        Returns:
+            Seconds until the next change, or None if nothing is due
+        """
+        due = []
+
+        if self._state.playback_state == PlaybackState.PLAYING:
+            due.append(int(elapsed) + 1 - elapsed)
+
+            if self._state.show_lyrics:
+                next_lyric = get_lyrics_next_change(
+                    elapsed, duration, self._lyrics, self.lyrics_manager
+                )
+                if next_lyric is not None:
+                    due.append(next_lyric - elapsed)
+
+        feedback = self._user_feedback
+        if feedback is not None and feedback.timeout > 0:
+            expiry = feedback.timestamp + feedback.timeout - time.time()
+            if expiry >= 0:
+                due.append(expiry)
+
+        return min(due) + FRAME_SLACK if due else None
+
+    def frame_stats(self) -> FrameStats:
+        """
+        Get the frame counters of the display.
+
+        Returns:
+            FrameStats with the number and cost of display updates
+        """
+        return self._frames.stats()
 
     def _is_paused(self) -> bool:
         """
         Safely check if the player is currently in paused state.
 
-        Uses property access with fallback to state checking for reliability.
+        Reads the observed pause property, so it never blocks on mpv.
 
         Returns:
             True if player is paused, False otherwise
         """
-        try:
-            paused = self._safe_get_property("pause", False)
-            return bool(paused)
-        except Exception as e:
-            logger.debug(f"Could not access pause property: {e}")
-            return self._state.playback_state == PlaybackState.PAUSED
+        return self._properties.snapshot.pause
+
+    def playback_snapshot(self) -> PlayerSnapshot:
+        """
+        Get the latest snapshot of the observed mpv properties.
+
+        The snapshot is immutable and reading it never calls into libmpv;
+        compare versions to tell whether anything changed between two reads.
+
+        Returns:
+            PlayerSnapshot of position, duration, pause, volume and playlist
+        """
+        return self._properties.snapshot
 
     def _safe_get_property(self, name: str, default=None):
         """
@@ -703,11 +1049,12 @@ class MPVPlayer(MPV):
             if self._state.stop_requested:
                 raise ShutdownError("Player is shutting down")
 
+            snapshot = self._properties.snapshot
             return {
                 "is_playing": self._state.playback_state == PlaybackState.PLAYING,
-                "position": self._safe_get_property("time_pos", 0),
-                "duration": self._safe_get_property("duration", 0),
-                "volume": self._safe_get_property("volume", 0),
+                "position": snapshot.time_pos,
+                "duration": snapshot.duration,
+                "volume": snapshot.volume,
                 "metadata": {
                     "title": self._metadata.title,
                     "artist": self._metadata.artist,
@@ -717,6 +1064,7 @@ class MPVPlayer(MPV):
                 "playlist_position": self._state.current_playlist_pos,
                 "playlist_count": len(self._current_song_names),
                 "lyrics_status": self._lyrics.status.name,
+                "version": snapshot.version,
             }
         except ShutdownError:
             return {
@@ -728,6 +1076,7 @@ class MPVPlayer(MPV):
                 "playlist_position": 0,
                 "playlist_count": 0,
                 "lyrics_status": LyricsStatus.DISABLED.name,
+                "version": self._properties.version,
             }
         except Exception as e:
             logger.error(f"Error getting playback info: {e}")
@@ -740,6 +1089,7 @@ class MPVPlayer(MPV):
                 "playlist_position": 0,
                 "playlist_count": 0,
                 "lyrics_status": LyricsStatus.DISABLED.name,
+                "version": self._properties.version,
                 "error": str(e),
             }
 
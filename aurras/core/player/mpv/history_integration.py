@@ -6,16 +6,88 @@ It handles retrieving history songs, creating combined playlists, and managing t
 between history songs and searched songs.
 """
 
+import time
 from collections import deque
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 
 from aurras.utils.logger import get_logger
-from aurras.services.youtube.search import SearchSong
+from aurras.core.downloader import DownloadsDatabase
 from aurras.core.player.history import RecentlyPlayedManager
+from aurras.core.cache.search_db import SearchFromSongDataBase
+from aurras.core.cache.tracks import TrackRegistry
+from aurras.services.youtube.resolver import TrackResolver
 
 logger = get_logger("aurras.core.player.history_integration", log_to_console=False)
 
 
+class HistoryUrlResolver:
+    """
+    Resolves URLs for a batch of history songs in as few passes as possible.
+
+    Exact track names are mapped with one indexed query against the downloads
+    and cache databases; only the remaining songs go through the TrackResolver,
+    which tries the fuzzy cache index before searching online in parallel.
+
+    Attributes:
+        timings: Per-phase timings of the last resolve call in milliseconds
+    """
+
+    def __init__(self, resolver: Optional[TrackResolver] = None):
+        """
+        Initialize the resolver.
+
+        Args:
+            resolver: Optional TrackResolver used for songs missing from the databases
+        """
+        self.search_db = SearchFromSongDataBase()
+        self.downloads_db = DownloadsDatabase()
+        self._resolver = resolver
+        self.timings: Dict[str, float] = {}
+
+    @property
+    def resolver(self) -> TrackResolver:
+        """Lazily create the TrackResolver, since most batches never need it."""
+        if self._resolver is None:
+            self._resolver = TrackResolver()
+        return self._resolver
+
+    def resolve(self, song_names: List[str]) -> Dict[str, str]:
+        """
+        Map song names to playable URLs.
+
+        Args:
+            song_names: Song names to resolve
+
+        Returns:
+            Dictionary with song name as key and URL as value (unresolved songs omitted)
+        """
+        names = list(dict.fromkeys(name for name in song_names if name))
+        started = time.perf_counter()
+
+        # Downloaded files take priority over streaming URLs
+        urls = self.search_db.get_urls_by_track_names(names)
+        urls.update(self.downloads_db.get_file_paths_by_track_names(names))
+        lookup_done = time.perf_counter()
+
+        misses = [name for name in names if name not in urls]
+        if misses:
+            for query, song in self.resolver.resolve(misses):
+                urls[query] = song.url
+        resolve_done = time.perf_counter()
+
+        self.timings = {
+            "lookup_ms": round((lookup_done - started) * 1000, 2),
+            "resolve_ms": round((resolve_done - lookup_done) * 1000, 2),
+            "total_ms": round((resolve_done - started) * 1000, 2),
+            "database_hits": len(names) - len(misses),
+            "resolved_misses": len(urls) - (len(names) - len(misses)),
+            "unresolved": len(names) - len(urls),
+        }
+        logger.info(f"Resolved history URLs: {self.timings}")
+
+        return urls
+
+
 class HistoryIntegration:
     """
     Handles the integration of playback history with current song selections.
@@ -25,23 +97,33 @@ class HistoryIntegration:
 
     Attributes:
         history_manager: Manager for retrieving recently played songs
+        url_resolver: Batched resolver for history song URLs
         max_history_songs: Maximum number of history songs to include
         deduplicate: Whether to remove duplicate songs from history
     """
 
-    def __init__(self, max_history_songs: int = 21, deduplicate: bool = True):
+    def __init__(
+        self,
+        max_history_songs: int = 21,
+        deduplicate: bool = True,
+        url_resolver: Optional[HistoryUrlResolver] = None,
+    ):
         """
         Initialize the history integration handler.
 
         Args:
             max_history_songs: Maximum number of history songs to include
             deduplicate: Whether to remove duplicate songs from history
+            url_resolver: Optional resolver used to find URLs for history songs
         """
         self.history_manager = RecentlyPlayedManager()
+        self.url_resolver = url_resolver or HistoryUrlResolver()
+        self.track_registry = TrackRegistry()
         self.max_history_songs = max_history_songs
         self.deduplicate = deduplicate
         self._navigating_history = False
         self.history_cache = deque(maxlen=max_history_songs)
+        self._track_urls: Dict[str, str] = {}
         logger.debug(f"History integration initialized (max_songs={max_history_songs})")
 
     def get_history_songs(self) -> List[Dict]:
@@ -51,7 +133,7 @@ class HistoryIntegration:
         Returns:
             List of history song dictionaries with metadata
         """
-        recent_history = self.history_manager.get_recent_songs(self.max_history_songs)
+        recent_history = self.history_manager.get_recent_tracks(self.max_history_songs)
 
         history_deque = deque(reversed(recent_history), maxlen=self.max_history_songs)
 
@@ -70,6 +152,8 @@ class HistoryIntegration:
         history_songs = deque(maxlen=self.max_history_songs)
         for song in recent_history:
             song_name = song["song_name"]
+            if song.get("url"):
+                self._track_urls[song_name] = song["url"]
             if not self.deduplicate or song_name not in history_songs:
                 history_songs.append(song_name)
 
@@ -77,7 +161,10 @@ class HistoryIntegration:
 
     def get_urls_for_history_songs(self, history_songs: List[str]) -> List[str]:
         """
-        Find URLs for history songs by searching.
+        Find URLs for history songs with one batched lookup.
+
+        Songs linked to the tracks table already carry their URL; only the
+        rest go through the URL resolver.
 
         Args:
             history_songs: List of song names to find URLs for
@@ -85,21 +172,17 @@ class HistoryIntegration:
         Returns:
             List of URLs corresponding to the history songs
         """
-        history_urls = []
-        failed_songs = []
-
-        for song_name in history_songs:
-            # Create a fresh search for each song
-            temp_search = SearchSong([song_name])
-            temp_search.search_song(
-                include_history=False
-            )  # Don't include history to avoid recursion
-
-            if temp_search.song_url_searched:
-                history_urls.append(temp_search.song_url_searched[0])
-            else:
-                failed_songs.append(song_name)
-                history_urls.append("null://")
+        urls = {
+            name: self._track_urls[name]
+            for name in history_songs
+            if name in self._track_urls
+        }
+        unlinked = [name for name in history_songs if name not in urls]
+        if unlinked:
+            urls.update(self.url_resolver.resolve(unlinked))
+
+        history_urls = [urls.get(song_name, "null://") for song_name in history_songs]
+        failed_songs = [name for name in history_songs if name not in urls]
 
         if failed_songs:
             logger.warning(
@@ -160,20 +243,29 @@ class HistoryIntegration:
     #         f"[{theme.dim}]Songs from history in queue ({len(history_songs)}): {history_str}...[/]"
     #     )
 
-    def add_songs_to_history(self, songs: List[str], source: str = "online") -> None:
+    def add_songs_to_history(
+        self,
+        songs: List[str],
+        source: str = "online",
+        urls: Optional[List[str]] = None,
+    ) -> None:
         """
         Add played songs to history.
 
         Args:
             songs: List of song names to add to history
             source: Source of the songs (e.g., 'online', 'playlist:name')
+            urls: Optional URLs of the songs, used to link them to the tracks table
         """
         if getattr(self, "_navigating_history", False):
             logger.debug("Not adding songs to history while navigating history")
             return
 
-        for song in songs:
-            self.history_manager.add_to_history(song, source)
+        urls = urls or []
+        for index, song in enumerate(songs):
+            url = urls[index] if index < len(urls) else ""
+            track_id = self.track_registry.register(url, track_name=song)
+            self.history_manager.add_to_history(song, source, track_id)
 
         logger.debug(f"Added {len(songs)} songs to history (source: {source})")
 
@@ -225,6 +317,6 @@ def integrate_history_with_playback(
 
     # integration.display_history_info(all_songs[:start_index])
 
-    integration.add_songs_to_history(searched_songs)
+    integration.add_songs_to_history(searched_songs, urls=searched_urls)
 
     return all_songs, all_urls, start_index
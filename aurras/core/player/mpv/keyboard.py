@@ -29,6 +29,7 @@ def setup_key_bindings(player) -> None:
             # Mark the player as stopping FIRST to prevent new operations
             player._state.stop_requested = True
             player._state.playback_state = PlaybackState.STOPPED
+            player._wake_display()
 
             # Unregister all observers to prevent callback race conditions
             if hasattr(player, "_observers"):
@@ -202,6 +203,7 @@ def setup_key_bindings(player) -> None:
 
             # Force cache reset for any theme-dependent elements
             player._lyrics.cached_lyrics = None
+            player._lyrics.parsed_lyrics = None
 
             player._show_user_feedback(
                 "Theme", f"Changed to {next_theme}", FeedbackType.THEME
@@ -212,6 +214,7 @@ def setup_key_bindings(player) -> None:
             player._state.current_theme = next_theme
 
             player._lyrics.cached_lyrics = None
+            player._lyrics.parsed_lyrics = None
 
             player._show_user_feedback(
                 "Theme", f"Changed to {next_theme}", FeedbackType.THEME
@@ -5,7 +5,7 @@ This module provides functionality for fetching, formatting and displaying
 lyrics in the MPV player interface with theme-consistent styling.
 """
 
-from typing import List
+from typing import List, Optional
 from concurrent.futures import Future
 
 from aurras.utils.logger import get_logger
@@ -47,9 +47,8 @@ def prefetch_lyrics(
         try:
             lyrics = lyrics_manager.fetch_lyrics(song, artist, album, duration)
             if lyrics:
+                # fetch_lyrics has already cached them
                 logger.info(f"Successfully fetched lyrics for '{song}'")
-                # Store in cache (limit size to prevent memory bloat)
-                lyrics_manager.store_in_cache(lyrics, song, artist, album)
                 return lyrics
             else:
                 logger.info(f"No lyrics found for '{song}'")
@@ -125,6 +124,36 @@ def get_lyrics_display(
     return f"{lyrics_state.no_lyrics_message or 'No lyrics available'}"
 
 
+def get_lyrics_next_change(
+    elapsed: float,
+    duration: float,
+    lyrics_state: LyricsState,
+    lyrics_manager: LyricsManager,
+) -> Optional[float]:
+    """
+    Get the playback position at which the lyrics display next changes.
+
+    Args:
+        elapsed: Current playback position in seconds
+        duration: Song duration in seconds
+        lyrics_state: Current lyrics state object
+        lyrics_manager: LyricsManager instance
+
+    Returns:
+        Playback position in seconds, or None if the display only changes on
+        events (lyrics loading or not found)
+    """
+    if (
+        lyrics_state.status != LyricsStatus.AVAILABLE
+        or lyrics_state.parsed_lyrics is None
+    ):
+        return None
+
+    return lyrics_manager.next_lyrics_change(
+        lyrics_state.parsed_lyrics, elapsed, duration
+    )
+
+
 def _format_feedback_message(message: str) -> str:
     """Format a feedback message with theme-consistent styling."""
     feedback_text = apply_gradient_to_text(message, "feedback")
@@ -151,11 +180,11 @@ def _format_cached_lyrics(
     Returns:
         Formatted lyrics text
     """
-    if not lyrics_state.cached_lyrics:
+    if lyrics_state.parsed_lyrics is None:
         return lyrics_manager.get_no_lyrics_message()
 
-    return lyrics_manager.create_focused_lyrics_view(
-        lyrics_state.cached_lyrics,
+    return lyrics_manager.render_lyrics(
+        lyrics_state.parsed_lyrics,
         elapsed,
         duration,
     )
@@ -182,10 +211,17 @@ def _handle_completed_lyrics_fetch(
         Formatted lyrics display
     """
     try:
+        # Parse once when the fetch completes; later frames reuse the result
+        if lyrics_state.parsed_lyrics is not None:
+            return _format_cached_lyrics(
+                elapsed, duration, lyrics_state, lyrics_manager
+            )
+
         lyrics: List[str] = lyrics_state.future.result()
 
         if lyrics:
             lyrics_state.cached_lyrics = lyrics
+            lyrics_state.parsed_lyrics = lyrics_manager.parse_lyrics(lyrics)
             lyrics_state.status = LyricsStatus.AVAILABLE
             return _format_cached_lyrics(
                 elapsed, duration, lyrics_state, lyrics_manager
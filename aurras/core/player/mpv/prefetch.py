@@ -0,0 +1,188 @@
+"""
+Stream prefetching for the MPV player.
+
+mpv resolves YouTube URLs through its ytdl hook only when a track starts,
+which leaves a gap of a few seconds at every track change of an online queue.
+This module resolves the streams of the next few queue entries while the
+current one plays, and swaps the direct stream URLs into mpv's playlist, so
+the next track starts at once (and mpv can prefetch it for gapless playback).
+"""
+
+import weakref
+from functools import partial
+from concurrent.futures import Future
+from typing import Optional
+
+from aurras.utils.logger import get_logger
+from aurras.core.settings import SETTINGS
+from aurras.services.youtube.streams import (
+    ResolvedStream,
+    StreamResolver,
+    is_youtube_url,
+)
+
+logger = get_logger("aurras.core.player.mpv.prefetch", log_to_console=False)
+
+DEFAULT_LOOKAHEAD = 2
+
+# The entry after the current one isn't swapped this close to the track's end,
+# when mpv may move onto it while it is being replaced
+SWAP_MARGIN = 3.0  # seconds
+
+
+def _configured_lookahead() -> int:
+    """Get the configured number of tracks to prefetch, falling back to the default."""
+    try:
+        return max(0, int(SETTINGS.stream_prefetch_count))
+    except (AttributeError, TypeError, ValueError):
+        return DEFAULT_LOOKAHEAD
+
+
+def quote_option(value: str) -> str:
+    """Quote a loadfile option value, which may contain commas, for mpv."""
+    return f"%{len(value.encode('utf-8'))}%{value}"
+
+
+def _entry_url(player, index: int) -> Optional[str]:
+    """Get the file name of a playlist entry, or None if there's none."""
+    if player._state.stop_requested:
+        return None
+    try:
+        return player._get_property(f"playlist/{index}/filename")
+    except Exception:
+        # Past the end of the playlist, or mpv is shutting down
+        return None
+
+
+class StreamPrefetcher:
+    """
+    Resolves upcoming YouTube entries of a player's queue ahead of time.
+
+    Attributes:
+        lookahead: Number of entries after the current one to resolve
+        resolver: Resolver of YouTube URLs to streams
+    """
+
+    def __init__(
+        self,
+        player,
+        ytdl_format: str = "bestaudio",
+        lookahead: Optional[int] = None,
+        resolver: Optional[StreamResolver] = None,
+    ) -> None:
+        """
+        Initialize the prefetcher.
+
+        Args:
+            player: The MPV player instance (only weakly referenced)
+            ytdl_format: yt-dlp format selector the player uses
+            lookahead: Number of entries to resolve (from settings if None)
+            resolver: Optional StreamResolver (one is created if None)
+        """
+        self._player_ref = weakref.ref(player)
+        self.lookahead = _configured_lookahead() if lookahead is None else lookahead
+        self.resolver = resolver or StreamResolver(ytdl_format)
+
+    def on_position(self, position: int) -> None:
+        """
+        Resolve the entries after a new playlist position.
+
+        Args:
+            position: Current playlist position
+        """
+        for index in range(position + 1, position + 1 + self.lookahead):
+            if not self.prefetch(index):
+                break
+
+    def on_append(self, index: int, position: int) -> None:
+        """
+        Resolve an appended entry if it's within the lookahead.
+
+        Args:
+            index: Playlist index of the new entry
+            position: Current playlist position
+        """
+        if position < index <= position + self.lookahead:
+            self.prefetch(index)
+
+    def prefetch(self, index: int) -> bool:
+        """
+        Resolve the stream of a playlist entry and swap it in when done.
+
+        Args:
+            index: Playlist index of the entry
+
+        Returns:
+            False if there's no entry at the index, True otherwise
+        """
+        player = self._player_ref()
+        if player is None:
+            return False
+
+        url = _entry_url(player, index)
+        if url is None:
+            return False
+        if not is_youtube_url(url):
+            return True
+
+        try:
+            future = self.resolver.resolve(url)
+        except RuntimeError:
+            # The resolver is shut down once playback is over
+            return False
+
+        future.add_done_callback(partial(self._swap, index, url))
+        return True
+
+    def _swap(self, index: int, url: str, future: Future) -> None:
+        """Replace a playlist entry with its resolved stream."""
+        player = self._player_ref()
+        if player is None or future.cancelled():
+            return
+
+        stream: Optional[ResolvedStream] = future.result()
+        if stream is None or player._state.stop_requested:
+            return
+
+        try:
+            with player._playlist_lock:
+                # Entries that started playing were already resolved by mpv
+                position = player._safe_get_property("playlist_pos", -1)
+                if position is None or index <= position:
+                    return
+                if _entry_url(player, index) != url:
+                    return
+                if index == position + 1:
+                    remaining = player._safe_get_property("time-remaining")
+                    if remaining is not None and remaining < SWAP_MARGIN:
+                        return
+
+                options = {}
+                if 0 <= index < len(player._current_song_names):
+                    song_name = player._current_song_names[index]
+                    options["force-media-title"] = quote_option(song_name)
+                if stream.user_agent:
+                    options["user-agent"] = quote_option(stream.user_agent)
+                if record := player._audio_cache.recording_path(url):
+                    options["stream-record"] = quote_option(record)
+
+                if player.mpv_version_tuple >= (0, 38, 0):
+                    player.loadfile(stream.url, "insert-at", index, **options)
+                else:
+                    player.loadfile(stream.url, "append", **options)
+                    player.playlist_move(player.playlist_count - 1, index)
+
+                # If mpv moved onto the original entry meanwhile, the insert
+                # shifted it to index + 1: keep it and drop the resolved copy
+                if player._safe_get_property("playlist_pos", -1) == index + 1:
+                    player.playlist_remove(index)
+                    return
+                player.playlist_remove(index + 1)
+
+            logger.debug(f"Swapped in the resolved stream of entry {index}")
+        except Exception as e:
+            logger.debug(f"Could not swap in the stream of entry {index}: {e}")
+
+    def shutdown(self) -> None:
+        """Stop resolving streams."""
+        self.resolver.shutdown()
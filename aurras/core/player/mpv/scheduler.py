@@ -0,0 +1,127 @@
+"""
+Frame scheduling for the MPV player display.
+
+The display only has to be redrawn when something visible changes. Changes
+caused by mpv events and key presses wake the scheduler at once; changes that
+come with the passing of time (the progress bar reaching the next second, the
+next lyric, a feedback message expiring) are worked out by the display, which
+asks the scheduler to sleep exactly until the earliest of them. Frames are
+never closer together than the frame rate cap allows, so a burst of events is
+drawn as a single frame.
+"""
+
+import time
+import threading
+from typing import NamedTuple, Optional
+
+from aurras.utils.logger import get_logger
+
+logger = get_logger("aurras.core.player.mpv.scheduler", log_to_console=False)
+
+DEFAULT_MAX_FPS = 20.0
+# Longest the display sleeps without an mpv event, to notice a stopped player
+IDLE_TIMEOUT = 1.0
+
+
+class FrameStats(NamedTuple):
+    """Frame counters of a display session."""
+
+    frames: int  # Display updates
+    redraws: int  # Updates that redrew the terminal
+    total_time: float  # Seconds spent in updates
+    max_time: float  # Seconds of the slowest update
+    uptime: float  # Seconds since the scheduler was created
+
+    @property
+    def average_time(self) -> float:
+        """Average seconds per display update."""
+        return self.total_time / self.frames if self.frames else 0.0
+
+    @property
+    def redraws_per_second(self) -> float:
+        """Average terminal redraws per second."""
+        return self.redraws / self.uptime if self.uptime > 0 else 0.0
+
+
+class FrameScheduler:
+    """
+    Schedules display updates from content deadlines and wake-ups.
+
+    Attributes:
+        min_interval: Shortest time between two frames, in seconds
+        idle_timeout: Longest time between two frames, in seconds
+    """
+
+    def __init__(
+        self, max_fps: float = DEFAULT_MAX_FPS, idle_timeout: float = IDLE_TIMEOUT
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_fps: Frame rate cap
+            idle_timeout: Longest sleep when nothing is due
+        """
+        self.min_interval = 1.0 / max_fps if max_fps > 0 else 0.0
+        self.idle_timeout = idle_timeout
+
+        self._wake = threading.Event()
+        self._created_at = time.monotonic()
+        self._frame_start = 0.0
+        self._last_frame = 0.0
+
+        self._frames = 0
+        self._redraws = 0
+        self._total_time = 0.0
+        self._max_time = 0.0
+
+    def wake(self) -> None:
+        """Request a frame as soon as the frame rate cap allows."""
+        self._wake.set()
+
+    def begin_frame(self) -> None:
+        """Mark the start of a frame; wake-ups from now on ask for the next one."""
+        # Cleared before the frame reads any state, so no change is missed
+        self._wake.clear()
+        self._frame_start = self._last_frame = time.monotonic()
+
+    def end_frame(self, redrawn: bool) -> None:
+        """
+        Record the end of a frame.
+
+        Args:
+            redrawn: Whether the frame redrew the terminal
+        """
+        frame_time = time.monotonic() - self._frame_start
+        self._frames += 1
+        self._redraws += redrawn
+        self._total_time += frame_time
+        self._max_time = max(self._max_time, frame_time)
+
+    def wait(self, delay: Optional[float] = None) -> None:
+        """
+        Sleep until the next frame is due or a wake-up arrives.
+
+        Args:
+            delay: Seconds until the content next changes on its own, or None
+                if it only changes on events
+        """
+        if delay is None or delay > self.idle_timeout:
+            delay = self.idle_timeout
+
+        self._wake.wait(max(0.0, delay))
+
+        # Keep to the frame rate cap, which also merges bursts of wake-ups
+        remaining = self._last_frame + self.min_interval - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def stats(self) -> FrameStats:
+        """Get the frame counters so far."""
+        return FrameStats(
+            self._frames,
+            self._redraws,
+            self._total_time,
+            self._max_time,
+            time.monotonic() - self._created_at,
+        )
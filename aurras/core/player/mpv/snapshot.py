@@ -0,0 +1,105 @@
+"""
+Observed-property state mirror for the MPV player.
+
+Reading a property from libmpv is a synchronous call into the mpv core, which
+decodes the value on every read and blocks while the core is busy. This module
+keeps a copy of the properties the UI and the playback API read, fed by
+observe_property callbacks on the python-mpv event thread, so that readers
+never call into libmpv.
+
+The copy is an immutable snapshot that is replaced as a whole on every change.
+Readers take a consistent view without a lock, and the snapshot's version
+tells them whether anything changed since the view they last used.
+
+Example:
+    ```python
+    mirror = PropertyMirror()
+    observers = mirror.observe(player)
+    snapshot = mirror.snapshot
+    print(snapshot.time_pos, snapshot.volume)
+    ```
+"""
+
+from typing import Any, List, NamedTuple
+
+from aurras.core.player.mpv.events import WeakPropertyObserver
+
+
+class PlayerSnapshot(NamedTuple):
+    """Immutable view of the observed mpv properties."""
+
+    version: int = 0  # Incremented on every change
+    time_pos: float = 0.0
+    duration: float = 0.0
+    pause: bool = False
+    volume: float = 0.0
+    playlist_pos: int = -1
+    playlist_count: int = 0
+
+
+# Observed mpv properties and the snapshot fields they feed
+OBSERVED_PROPERTIES = {
+    "time-pos": "time_pos",
+    "duration": "duration",
+    "pause": "pause",
+    "volume": "volume",
+    "playlist-pos": "playlist_pos",
+    "playlist-count": "playlist_count",
+}
+
+
+class PropertyMirror:
+    """
+    Mirror of mpv properties, updated by property observers.
+
+    Only the python-mpv event thread writes the snapshot, so replacing the
+    reference is all the synchronization readers need.
+    """
+
+    def __init__(self):
+        """Initialize the mirror with an empty snapshot."""
+        self._snapshot = PlayerSnapshot()
+
+    @property
+    def snapshot(self) -> PlayerSnapshot:
+        """The latest snapshot of the observed properties."""
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        """Version of the latest snapshot."""
+        return self._snapshot.version
+
+    def observe(self, player) -> List[WeakPropertyObserver]:
+        """
+        Start mirroring the properties of a player.
+
+        Args:
+            player: The MPV player instance
+
+        Returns:
+            The registered observers (keep a reference to prevent GC)
+        """
+        observers = []
+        for name in OBSERVED_PROPERTIES:
+            observer = WeakPropertyObserver(player, name, self._on_change)
+            observer.register()
+            observers.append(observer)
+        return observers
+
+    def _on_change(self, name: str, value: Any) -> None:
+        """Replace the snapshot when an observed property changed."""
+        field = OBSERVED_PROPERTIES.get(name)
+        if field is None:
+            return
+
+        snapshot = self._snapshot
+        if value is None:
+            # Unavailable, e.g. between two files
+            value = PlayerSnapshot._field_defaults[field]
+        if getattr(snapshot, field) == value:
+            return
+
+        self._snapshot = snapshot._replace(
+            version=snapshot.version + 1, **{field: value}
+        )
@@ -10,6 +10,8 @@ from dataclasses import dataclass
 from concurrent.futures import Future
 from typing import Dict, Any, List, Optional, Tuple
 
+from aurras.services.lyrics.parser import ParsedLyrics
+
 ThemeDict = Dict[str, Any]
 SongInfo = Tuple[str, str, str]  # song, artist, album
 
@@ -99,6 +101,7 @@ class HistoryData:
     category: HistoryCategory = HistoryCategory.NEW
     last_played: Optional[int] = None
     loaded: bool = False
+    position: float = 0  # Last playback position in this song
 
 
 @dataclass
@@ -108,4 +111,5 @@ class LyricsState:
     status: LyricsStatus = LyricsStatus.LOADING
     future: Optional[Future] = None
     cached_lyrics: Optional[List[str]] = None
+    parsed_lyrics: Optional[ParsedLyrics] = None
     no_lyrics_message: Optional[str] = None
@@ -4,17 +4,23 @@ UI rendering module for the MPV player.
 This module provides enhanced UI components for the player interface
 with consistent styling, animations, and theme integration.
 It uses the component-based architecture from the console renderer system.
+
+Components are created once and kept for the whole playback session. Each
+update only marks the components whose values changed as dirty, and the live
+display is redrawn only when something visible changed.
 """
 
-from typing import Optional, Dict, Any, List, Tuple
+import time
+from typing import Optional, Dict, Any, List, Sequence, Tuple
 
 from rich.console import Group
 from rich.columns import Columns
 
+from aurras.core.player.queue_window import QueueWindow
 from aurras.core.player.mpv.state import FeedbackType, PlaybackState, UserFeedback
 from aurras.utils.console import console, apply_gradient_to_text
 from aurras.utils.console.renderer import (
-    UIComponent,
+    RetainedComponent,
     ProgressIndicator,
     FeedbackMessage,
     KeybindingHelp,
@@ -22,7 +28,12 @@ from aurras.utils.console.renderer import (
 )
 
 
-class SongInfoComponent(UIComponent):
+def _feedback_expired(feedback: UserFeedback) -> bool:
+    """Check whether a feedback message has been shown for its full timeout."""
+    return 0 < feedback.timeout < time.time() - feedback.timestamp
+
+
+class SongInfoComponent(RetainedComponent):
     """Component to display song information with rich formatting."""
 
     def __init__(
@@ -45,6 +56,7 @@ class SongInfoComponent(UIComponent):
             playlist_position: Current position in playlist
             playlist_count: Total songs in playlis
         """
+        super().__init__()
         self.song = song
         self.artist = artist
         self.album = album
@@ -52,7 +64,7 @@ class SongInfoComponent(UIComponent):
         self.playlist_position = playlist_position
         self.playlist_count = playlist_count
 
-    def render(self) -> str:
+    def build(self) -> str:
         """Render song information with gradient styling."""
         info_text = ""
 
@@ -100,7 +112,7 @@ class SongInfoComponent(UIComponent):
         return info_text
 
 
-class PlaybackProgressBar(UIComponent):
+class PlaybackProgressBar(RetainedComponent):
     """Enhanced progress bar for media playback."""
 
     def __init__(
@@ -119,12 +131,22 @@ class PlaybackProgressBar(UIComponent):
             playback_state: Current playback state
             width: Bar width in characters
         """
-        self.elapsed = max(0, elapsed)
+        super().__init__()
+        # Whole seconds, so the bar is only redrawn when the time shown changes
+        self.elapsed = int(max(0, elapsed))
         self.duration = max(0.1, duration)  # Avoid division by zero
         self.playback_state = playback_state
         self.width = width
 
-    def render(self) -> Any:
+    def update(self, **changes: Any) -> bool:
+        """Apply a state update, ignoring elapsed time within the same second."""
+        if "elapsed" in changes:
+            changes["elapsed"] = int(max(0, changes["elapsed"] or 0))
+        if "duration" in changes:
+            changes["duration"] = max(0.1, changes["duration"] or 0)
+        return super().update(**changes)
+
+    def build(self) -> Any:
         """Render the playback progress bar."""
 
         indicator = ProgressIndicator(
@@ -138,13 +160,14 @@ class PlaybackProgressBar(UIComponent):
         return indicator.render()
 
 
-class StatusDisplay(UIComponent):
+class StatusDisplay(RetainedComponent):
     """Component to display player status information."""
 
     def __init__(
         self,
         playback_state: PlaybackState,
         volume: int,
+        theme: Optional[str] = None,
     ):
         """
         Initialize status display.
@@ -152,11 +175,14 @@ class StatusDisplay(UIComponent):
         Args:
             playback_state: Current playback state enum
             volume: Current volume level
+            theme: Name of the active theme
         """
+        super().__init__()
         self.playback_state = playback_state
         self.volume = volume
+        self.theme = theme
 
-    def render(self) -> str:
+    def build(self) -> str:
         """Render the status text."""
         theme_info = f" · Theme: {console.theme_obj.name}" if console.theme_obj else ""
 
@@ -168,12 +194,12 @@ class StatusDisplay(UIComponent):
         )
 
 
-class QueueDisplay(UIComponent):
+class QueueDisplay(RetainedComponent):
     """Component to display upcoming songs in the queue."""
 
     def __init__(
         self,
-        upcoming_songs: List[str],
+        upcoming_songs: Sequence[str],
         current_position: int,
         max_songs: int = 3,
     ):
@@ -185,25 +211,42 @@ class QueueDisplay(UIComponent):
             current_position: Current position in the queue
             max_songs: Maximum number of upcoming songs to show
         """
-        self.all_songs = upcoming_songs
-        self.current_position = current_position
+        super().__init__()
         self.max_songs = max_songs
+        # Limit to max_songs or 2
+        self._window = QueueWindow(
+            upcoming_songs, current_position, after=min(max_songs, 2)
+        )
+        self.upcoming: Tuple[str, ...] = self._window.upcoming()
 
-    def render(self) -> Optional[str]:
-        """Render upcoming songs in the queue with styled formatting."""
-        if not self.all_songs or self.current_position >= len(self.all_songs) - 1:
-            return None
+    def show_queue(self, songs: Sequence[str], position: int) -> bool:
+        """
+        Update the upcoming songs from the queue and the current position.
 
-        # Get upcoming songs
-        upcoming = self.all_songs[self.current_position + 1 :]
-        if not upcoming:
-            return None
+        Only the window after the position is read, so this doesn't depend on
+        the length of the queue.
 
-        # Limit to max_songs or 2
-        upcoming = upcoming[: min(self.max_songs, 2)]
+        Args:
+            songs: All song names in the queue
+            position: Current position in the queue
+
+        Returns:
+            True if the songs shown changed
+        """
+        if songs is not self._window.songs:
+            self._window.reset(songs, position)
+        elif not self._window.move(position):
+            return False
+
+        return self.update(upcoming=self._window.upcoming())
+
+    def build(self) -> Optional[str]:
+        """Render upcoming songs in the queue with styled formatting."""
+        if not self.upcoming:
+            return None
 
         # Format the queue display with song numbers
-        queue_text = f"Upcoming: {', '.join(upcoming)}"
+        queue_text = f"Upcoming: {', '.join(self.upcoming)}"
 
         return console.style_text(
             text=apply_gradient_to_text(queue_text, console.status_gradient),
@@ -211,7 +254,7 @@ class QueueDisplay(UIComponent):
         )
 
 
-class UserFeedbackDisplay(UIComponent):
+class UserFeedbackDisplay(RetainedComponent):
     """Component to display user feedback notifications."""
 
     def __init__(self, feedback: Optional[UserFeedback] = None):
@@ -221,9 +264,17 @@ class UserFeedbackDisplay(UIComponent):
         Args:
             feedback: UserFeedback object with action information
         """
+        super().__init__()
         self.feedback = feedback
 
-    def render(self) -> Optional[str]:
+    def update(self, **changes: Any) -> bool:
+        """Apply a state update, hiding the feedback once it has expired."""
+        feedback = changes.get("feedback", self.feedback)
+        if feedback is not None and _feedback_expired(feedback):
+            changes["feedback"] = None
+        return super().update(**changes)
+
+    def build(self) -> Optional[str]:
         """Render user feedback with theme-appropriate styling."""
         if not self.feedback:
             return None
@@ -262,18 +313,18 @@ class UserFeedbackDisplay(UIComponent):
         return feedback_message.render()
 
 
-class LyricsDisplay(UIComponent):
+class LyricsDisplay(RetainedComponent):
     """Component for displaying time-synced lyrics."""
 
-    def __init__(self, lyrics: List[Tuple[str, str]]):
+    def __init__(self, lyrics: Any = None):
         super().__init__()
         self.lyrics = lyrics
 
-    def render(self):
-        return self.lyrics
+    def build(self):
+        return self.lyrics or None
 
 
-class PlayerControls(UIComponent):
+class PlayerControls(RetainedComponent):
     """Component to display available player controls."""
 
     def __init__(self, detailed: bool = False):
@@ -283,9 +334,10 @@ class PlayerControls(UIComponent):
         Args:
             detailed: Whether to show detailed controls
         """
+        super().__init__()
         self.detailed = detailed
 
-    def render(self) -> Any:
+    def build(self) -> Any:
         """Render the keyboard controls help."""
         # _, active_theme_styles = ThemeHelper.retrieve_theme_gradients_and_styles()
 
@@ -318,6 +370,30 @@ class PlayerControls(UIComponent):
         ).render()
 
 
+# Player state keys routed to each component, as {state key: attribute}
+_COMPONENT_STATE = {
+    "song_info": {
+        "song": "song",
+        "artist": "artist",
+        "album": "album",
+        "playlist_position": "playlist_position",
+        "playlist_count": "playlist_count",
+    },
+    "progress": {
+        "elapsed": "elapsed",
+        "duration": "duration",
+        "playback_state": "playback_state",
+    },
+    "status": {
+        "playback_state": "playback_state",
+        "volume": "volume",
+        "theme": "theme",
+    },
+    "feedback": {"feedback": "feedback"},
+    "lyrics": {"lyrics_lines": "lyrics"},
+}
+
+
 class PlayerLayout:
     """
     Manager class for the player UI layout and rendering.
@@ -340,67 +416,73 @@ class PlayerLayout:
         self.show_history = False
         self.detailed_controls = False
 
-    def create_player_ui(self, player_state: Dict[str, Any]) -> None:
-        """
-        Create and register all UI components based on player state.
+        self._theme: Optional[str] = None
+        # Set when the arrangement changes without any component changing
+        self._layout_dirty = True
 
-        Args:
-            player_state: Dictionary containing player state info
-        """
-        song = player_state.get("song", "Unknown")
-        artist = player_state.get("artist", "Unknown")
-        album = player_state.get("album", "Unknown")
-        elapsed = player_state.get("elapsed", 0)
-        duration = player_state.get("duration", 0)
-        playback_state = player_state.get("playback_state", PlaybackState.STOPPED)
-        volume = player_state.get("volume", 100)
-        playlist_position = player_state.get("playlist_position", 0)
-        playlist_count = player_state.get("playlist_count", 0)
-        user_feedback = player_state.get("feedback", None)
-        lyrics_content = player_state.get("lyrics_lines", [])
-        song_list = player_state.get("song_names", [])
+        self.create_player_ui()
 
+    def create_player_ui(self) -> None:
+        """Create and register all UI components, in display order."""
         self.renderer.components.clear()
 
-        # Create song info component
-        song_info = SongInfoComponent(
-            song,
-            artist,
-            album,
-            source="",
-            playlist_position=playlist_position,
-            playlist_count=playlist_count,
-        )
-        self.renderer.add_component("song_info", song_info)
-
-        # Create progress bar component
-        progress = PlaybackProgressBar(elapsed, duration, playback_state)
-        self.renderer.add_component("progress", progress)
+        components = {
+            "song_info": SongInfoComponent("Unknown", "Unknown", "Unknown"),
+            "progress": PlaybackProgressBar(0, 0, PlaybackState.STOPPED),
+            "status": StatusDisplay(PlaybackState.STOPPED, 100),
+            "queue": QueueDisplay([], 0),
+            "feedback": UserFeedbackDisplay(),
+            "lyrics": LyricsDisplay(),
+            "controls": PlayerControls(detailed=self.detailed_controls),
+        }
+        for name, component in components.items():
+            self.renderer.add_component(name, component)
 
-        # Create status display
-        status = StatusDisplay(playback_state, volume)
-        self.renderer.add_component("status", status)
+        self._layout_dirty = True
 
-        # Add queue display if songs are in queue
-        if song_list and len(song_list) > 1 and playlist_position < len(song_list) - 1:
-            queue = QueueDisplay(song_list, playlist_position)
-            self.renderer.add_component("queue", queue)
+    def apply_state(self, player_state: Dict[str, Any]) -> bool:
+        """
+        Apply a (possibly partial) player state to the components.
 
-        # Add user feedback if available
-        if user_feedback:
-            feedback = UserFeedbackDisplay(user_feedback)
-            self.renderer.add_component("feedback", feedback)
+        Args:
+            player_state: Dictionary containing player state info
 
-        # Add lyrics if enabled
-        if self.show_lyrics and lyrics_content:
-            lyrics = LyricsDisplay(lyrics_content)
-            self.renderer.add_component("lyrics", lyrics)
+        Returns:
+            True if anything visible changed since the last redraw
+        """
+        components = self.renderer.components
+
+        theme = player_state.get("theme", self._theme)
+        if theme != self._theme:
+            # Every component is styled with the theme's gradients
+            self._theme = theme
+            for component in components.values():
+                component.invalidate()
+
+        for name, fields in _COMPONENT_STATE.items():
+            changes = {
+                attribute: player_state[key]
+                for key, attribute in fields.items()
+                if key in player_state
+            }
+            if changes:
+                components[name].update(**changes)
+
+        if "song_names" in player_state:
+            components["queue"].show_queue(
+                player_state["song_names"],
+                player_state.get(
+                    "playlist_position", components["song_info"].playlist_position
+                ),
+            )
 
-        # Add controls
-        controls = PlayerControls(detailed=self.detailed_controls)
-        self.renderer.add_component("controls", controls)
+        # Re-check the feedback even without a new one, so it disappears on time
+        components["feedback"].update()
+        components["controls"].update(detailed=self.detailed_controls)
 
-        self.renderer._layout_func = self._create_multi_panel_layout
+        return self._layout_dirty or any(
+            component.dirty for component in components.values()
+        )
 
     def _create_multi_panel_layout(self) -> Any:
         """
@@ -409,6 +491,8 @@ class PlayerLayout:
         Returns:
             Rich renderable with appropriate column layout
         """
+        self._layout_dirty = False
+
         left_renderable: List[Any] = []
         right_renderable: List[Any] = []
 
@@ -439,10 +523,12 @@ class PlayerLayout:
     def toggle_lyrics(self) -> None:
         """Toggle visibility of lyrics display."""
         self.show_lyrics = not self.show_lyrics
+        self._layout_dirty = True
 
     def toggle_history(self) -> None:
         """Toggle visibility of play history."""
         self.show_history = not self.show_history
+        self._layout_dirty = True
 
     def toggle_detailed_controls(self) -> None:
         """Toggle between simple and detailed control display."""
@@ -452,10 +538,16 @@ class PlayerLayout:
         """
         Start live updating UI.
 
+        The display is only redrawn by update(), when the state changed.
+
         Args:
-            refresh_per_second: UI refresh rate
+            refresh_per_second: Maximum UI refresh rate
         """
-        self.renderer.start_live_display(refresh_per_second=refresh_per_second)
+        self.renderer.start_live_display(
+            refresh_per_second=refresh_per_second,
+            layout_func=self._create_multi_panel_layout,
+            auto_refresh=False,
+        )
         self._running = True
 
     def stop_live_ui(self) -> None:
@@ -463,13 +555,18 @@ class PlayerLayout:
         self.renderer.stop_live_display()
         self._running = False
 
-    def update(self, player_state: Dict[str, Any]) -> None:
+    def update(self, player_state: Dict[str, Any]) -> bool:
         """
-        Update the UI with current player state.
+        Update the UI with current player state, redrawing only on changes.
 
         Args:
             player_state: Dictionary with current player state
+
+        Returns:
+            True if the display was redrawn
         """
-        self.create_player_ui(player_state)
-        if self._running:
-            self.renderer.refresh()
+        if not self.apply_state(player_state) or not self._running:
+            return False
+
+        self.renderer.refresh()
+        return True
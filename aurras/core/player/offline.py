@@ -4,10 +4,11 @@ Offline Player Module
 This module provides functionality for playing songs from local files.
 """
 
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 
 from aurras.utils.console import console
 from aurras.utils.logger import get_logger
+from aurras.core.library import DownloadLibrary
 from aurras.core.downloader import DownloadsDatabase
 from aurras.utils.exceptions import (
     AurrasError,
@@ -24,6 +25,9 @@ from aurras.core.player.mpv.history_integration import integrate_history_with_pl
 
 logger = get_logger("aurras.core.player.offline", log_to_console=False)
 
+# Songs loaded into the player at a time; later pages follow during playback
+QUEUE_PAGE_SIZE = 100
+
 
 class InitializeOfflinePlayer:
     """
@@ -36,53 +40,63 @@ class InitializeOfflinePlayer:
         """
         self.player = None
         self.downloads_db = DownloadsDatabase()
+        self.library = DownloadLibrary()
 
 
 class GenerateQueue(InitializeOfflinePlayer):
     """"""
 
-    def __init__(self):
+    def __init__(self, page_size: int = QUEUE_PAGE_SIZE):
         super().__init__()
+        self.page_size = page_size
+        self._pages: Iterator[List[Tuple[str, str]]] = iter(())
 
-    def _songs_fetched_from_db(self):
+    def _songs_fetched_from_db(self) -> Iterator[List[Tuple[str, str]]]:
         """
-        Fetch songs from the database.
+        Page through the downloaded songs whose files are present.
         """
         try:
-            song_dict = self.downloads_db.get_downloaded_songs()
-            logger.debug(f"Retrieved {len(song_dict)} songs from the database")
-            return song_dict
+            # Rescans only stat the files, so this stays cheap on large
+            # libraries; songs whose file was moved are found by their hash
+            self.library.scan()
         except Exception as e:
             logger.error(f"Database error when fetching songs: {e}", exc_info=True)
             raise DatabaseError(f"Failed to fetch songs from database: {e}")
 
+        # A song downloaded twice (e.g. on its own and in a playlist) plays once
+        seen = set()
+        for page in self.library.iter_available_songs(self.page_size):
+            songs = []
+            for song_info in page:
+                song_name = song_info["track_name"]
+                if song_name not in seen:
+                    seen.add(song_name)
+                    songs.append((song_name, song_info["url"]))
+            if songs:
+                yield songs
+
     def create_queues(self) -> Tuple[List[str], List[str]]:
         """
-        Create a queue of songs to play.
+        Create the first page of the queue of songs to play.
 
-        Args:
-            metadata: Metadata of the song to play
+        The rest of the library is left in `remaining_pages`, to be appended
+        while the first page plays.
+
+        Returns:
+            Tuple of (song names, URLs) of the first page
         """
         try:
-            metadata = self._songs_fetched_from_db()
-            if not metadata:
+            self._pages = self._songs_fetched_from_db()
+            first_page = next(self._pages, [])
+            if not first_page:
                 logger.warning(
                     "No songs found in the database. Maybe try downloading some first?"
                 )
                 return [], []
 
-            song_names: List[str] = []
-            queue: List[str] = []
-
-            for _, song_info in metadata.items():
-                # Extract the song name and URL from the metadata
-                song_name = song_info.get("track_name")
-                song_url = song_info.get("url")
-
-                song_names.append(song_name)
-                queue.append(song_url)
-
-                logger.debug(f"Added song to queue: {song_name} - {song_url}")
+            song_names = [song_name for song_name, _ in first_page]
+            queue = [song_url for _, song_url in first_page]
+            logger.debug(f"Loaded the first {len(queue)} songs of the queue")
 
             return (song_names, queue)
         except DatabaseError:
@@ -92,6 +106,11 @@ class GenerateQueue(InitializeOfflinePlayer):
             logger.error(f"Error creating queue: {e}", exc_info=True)
             raise AurrasError(f"Error preparing song queue: {e}")
 
+    @property
+    def remaining_pages(self) -> Iterator[List[Tuple[str, str]]]:
+        """Pages of (song name, URL) pairs after the ones already taken."""
+        return self._pages
+
 
 class LocalPlaybackHandler(InitializeOfflinePlayer):
     """
@@ -139,9 +158,9 @@ class LocalPlaybackHandler(InitializeOfflinePlayer):
 
             # Play songs with or without history integration
             if not include_history:
-                self._play_without_history(show_lyrics, shuffle)
+                self._play_without_history(song_names, song_urls, show_lyrics)
             else:
-                self._play_with_history(show_lyrics, shuffle)
+                self._play_with_history(song_names, song_urls, show_lyrics)
 
             logger.debug("Playback completed successfully")
 
@@ -172,25 +191,28 @@ class LocalPlaybackHandler(InitializeOfflinePlayer):
         finally:
             self._cleanup_player()
 
-    def _play_without_history(self, show_lyrics=True, shuffle=False):
+    def _play_without_history(self, song_names, song_urls, show_lyrics=True):
         """Play songs without including history."""
-        song_names, song_urls = self.queue.create_queues()
         logger.info(f"Standard playback without history: {len(song_names)} songs")
 
         try:
             mpv = MPVPlayer(loglevel="error")
             self.add_player(mpv)
 
-            mpv.player(song_urls, song_names, show_lyrics=show_lyrics)
+            mpv.player(
+                song_urls,
+                song_names,
+                show_lyrics=show_lyrics,
+                pages=self.queue.remaining_pages,
+            )
             logger.debug("Song played successfully")
         except Exception as e:
             logger.error(f"Error in offline playback without history: {e}")
             raise PlaybackError(f"Error during offline playback: {e}")
 
-    def _play_with_history(self, show_lyrics=True, shuffle=False):
+    def _play_with_history(self, song_names, song_urls, show_lyrics=True):
         """Play songs with history integration."""
         try:
-            song_names, song_urls = self.queue.create_queues()
             logger.info(f"Playback with history: {len(song_names)} songs")
 
             all_songs, all_urls, start_index = integrate_history_with_playback(
@@ -200,7 +222,13 @@ class LocalPlaybackHandler(InitializeOfflinePlayer):
             mpv = MPVPlayer(loglevel="error")
             self.add_player(mpv)
 
-            mpv.player(all_urls, all_songs, show_lyrics, start_index)
+            mpv.player(
+                all_urls,
+                all_songs,
+                show_lyrics,
+                start_index,
+                pages=self.queue.remaining_pages,
+            )
             logger.debug("Song played successfully")
         except Exception as e:
             logger.error(f"Error in offline playback with history: {e}")
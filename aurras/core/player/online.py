@@ -4,14 +4,19 @@ Online Player Module
 This module provides functionality for playing songs online by streaming.
 """
 
-from typing import List, Union
+import random
+from typing import Iterator, List, Optional, Tuple, Union
 from rich.progress import SpinnerColumn, TextColumn, Progress
 
 from aurras.utils.logger import get_logger
 from aurras.core.player.mpv.core import MPVPlayer
 from aurras.core.player.mpv.state import PlaybackState
-from aurras.core.player.mpv.history_integration import integrate_history_with_playback
-from aurras.services.youtube.search import SearchSong
+from aurras.core.player.mpv.history_integration import (
+    HistoryIntegration,
+    integrate_history_with_playback,
+)
+from aurras.services.youtube.search import SearchSong, SongResult
+from aurras.services.youtube.resolver import TrackResolver
 from aurras.utils.console import console
 from aurras.utils.exceptions import (
     # AurrasError,
@@ -46,12 +51,17 @@ class SongStreamHandler(InitializeOnlinePlayer):
         history_manager: RecentlyPlayedManager for tracking song history
     """
 
-    def __init__(self, song_input: Union[str, List[str]]):
+    def __init__(
+        self,
+        song_input: Union[str, List[str]],
+        resolver: Optional[TrackResolver] = None,
+    ):
         """
         Initialize the ListenSongOnline class.
 
         Args:
             song_input: Either a single song as a string or a list of songs to play
+            resolver: Optional TrackResolver used for streamed playback
         """
         super().__init__()
         # Normalize input to a list if it's a string
@@ -59,6 +69,7 @@ class SongStreamHandler(InitializeOnlinePlayer):
             [song_input] if isinstance(song_input, str) else song_input
         )
         self.search = SearchSong(self.search_queries)
+        self.resolver = resolver
         self._is_part_of_queue = False
 
     def add_player(self, player):
@@ -150,6 +161,89 @@ class SongStreamHandler(InitializeOnlinePlayer):
             # Important: ensure player is terminated when done
             self._cleanup_player()
 
+    def stream_songs_online(self, show_lyrics=True, shuffle=False):
+        """
+        Play the songs while they are still being resolved.
+
+        Tracks are resolved in parallel and playback starts as soon as the first
+        one is ready; the rest are appended to the running queue in order.
+
+        Args:
+            show_lyrics: Whether to show lyrics during playback
+            shuffle: Whether to shuffle the playback order
+        """
+        try:
+            queries = list(self.search_queries)
+            if shuffle:
+                # Tracks are queued in query order, so shuffling the queries
+                # shuffles playback without waiting for every track to resolve
+                random.shuffle(queries)
+
+            resolver = self.resolver or TrackResolver()
+            tracks = resolver.resolve(queries)
+
+            first = next(tracks, None)
+            if first is None:
+                msg = f"No songs found matching: {', '.join(self.search_queries)}"
+                logger.warning(msg)
+                raise SongsNotFoundError(msg)
+
+            _, first_song = first
+            logger.info(f"First track resolved, starting playback: {first_song.name}")
+
+            history = HistoryIntegration()
+            if getattr(self.search, "include_history", False):
+                all_songs, all_urls, start_index = history.create_combined_playlist(
+                    [first_song.name], [first_song.url]
+                )
+            else:
+                all_songs, all_urls = [first_song.name], [first_song.url]
+                start_index = 0
+            history.add_songs_to_history([first_song.name], urls=[first_song.url])
+
+            mpv = MPVPlayer(loglevel="error")
+            self.add_player(mpv)
+
+            mpv.player(
+                all_urls,
+                all_songs,
+                show_lyrics,
+                start_index,
+                pending=self._record_pending(tracks, history),
+            )
+            logger.debug("Streamed queue played successfully")
+
+        except KeyboardInterrupt:
+            console.print_warning("Playback interrupted by user")
+            logger.info("Playback interrupted by user")
+        except Exception as e:
+            console.print_error(f"Unexpected error during playback: {str(e)}")
+            logger.error(f"Streamed playback error: {e}")
+        finally:
+            self._cleanup_player()
+
+    def _record_pending(
+        self,
+        tracks: Iterator[Tuple[str, SongResult]],
+        history: HistoryIntegration,
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Adapt resolved tracks for the player queue and record them in history.
+
+        Args:
+            tracks: Iterator of (query, resolved song) tuples
+            history: HistoryIntegration used to record the tracks
+
+        Yields:
+            Tuples of (song name, URL)
+        """
+        try:
+            for _, song in tracks:
+                history.add_songs_to_history([song.name], urls=[song.url])
+                yield song.name, song.url
+        finally:
+            tracks.close()
+
     def _play_without_history(self, show_lyrics=True, shuffle=False):
         """Play songs without including history."""
         logger.info(
@@ -0,0 +1,159 @@
+"""
+Queue View Model
+
+Queues can hold thousands of songs, but a view only ever shows a few of them:
+the player display the next couple of songs, the TUI queue panel the rows
+scrolled into view. QueueWindow keeps a reference to the queue (never a copy)
+and hands out just the slice a view needs. When the playing position moves,
+it reports which entries entered and left the window, so a view updates in
+time proportional to what it shows rather than to the length of the queue.
+
+Example:
+    ```python
+    window = QueueWindow(song_names, position=0, before=0, after=2)
+    diff = window.move(1)
+    if diff:
+        print(window.upcoming())
+    ```
+"""
+
+from typing import List, NamedTuple, Sequence, Tuple
+
+
+class QueueDiff(NamedTuple):
+    """Queue indexes that left and entered a window when it changed."""
+
+    removed: range
+    added: range
+
+    def __bool__(self) -> bool:
+        """Whether the window shows different entries."""
+        return bool(self.removed or self.added)
+
+
+def _difference(a: range, b: range) -> range:
+    """
+    Get the indexes of one window that aren't in another.
+
+    Windows move with the position and only grow at the end (songs are only
+    appended), so the difference is always a single range.
+    """
+    if not b or b.stop <= a.start or b.start >= a.stop:
+        return a
+    if b.start > a.start:
+        return range(a.start, b.start)
+    return range(max(b.stop, a.start), a.stop) or range(0)
+
+
+def _slice(songs: Sequence[str], start: int, stop: int) -> List[str]:
+    """Slice a queue, which may be a list or a deque."""
+    try:
+        return list(songs[start:stop])
+    except TypeError:
+        # Deques index but don't slice
+        return [songs[index] for index in range(start, stop)]
+
+
+class QueueWindow:
+    """
+    Window of a queue around the playing position.
+
+    Attributes:
+        songs: The queue (referenced, not copied)
+        position: Playing position in the queue
+        before: Number of entries shown before the position
+        after: Number of entries shown after the position
+    """
+
+    def __init__(
+        self,
+        songs: Sequence[str] = (),
+        position: int = 0,
+        before: int = 0,
+        after: int = 2,
+    ):
+        """
+        Initialize the window.
+
+        Args:
+            songs: Song names in the queue
+            position: Playing position
+            before: Number of entries shown before the position
+            after: Number of entries shown after the position
+        """
+        self.songs = songs
+        self.position = position
+        self.before = before
+        self.after = after
+        self._bounds = self._window(position)
+
+    def __len__(self) -> int:
+        """Number of songs in the whole queue."""
+        return len(self.songs)
+
+    @property
+    def bounds(self) -> range:
+        """Queue indexes currently in the window."""
+        return self._bounds
+
+    def _window(self, position: int) -> range:
+        """Get the queue indexes in the window around a position."""
+        return range(
+            max(0, position - self.before),
+            min(len(self.songs), position + self.after + 1),
+        )
+
+    def move(self, position: int) -> QueueDiff:
+        """
+        Move the window to a new position (or re-check it after appends).
+
+        Args:
+            position: New playing position
+
+        Returns:
+            QueueDiff of the indexes that left and entered the window
+        """
+        old, new = self._bounds, self._window(position)
+        self.position, self._bounds = position, new
+        return QueueDiff(_difference(old, new), _difference(new, old))
+
+    def reset(self, songs: Sequence[str], position: int = 0) -> QueueDiff:
+        """
+        Show a different queue.
+
+        Args:
+            songs: Song names in the new queue
+            position: Playing position in the new queue
+
+        Returns:
+            QueueDiff removing the whole old window and adding the new one
+        """
+        old = self._bounds
+        self.songs = songs
+        self.position = position
+        self._bounds = self._window(position)
+        return QueueDiff(old, self._bounds)
+
+    def items(self) -> List[Tuple[int, str]]:
+        """Get the (index, song name) pairs in the window."""
+        bounds = self._bounds
+        return list(zip(bounds, _slice(self.songs, bounds.start, bounds.stop)))
+
+    def upcoming(self) -> Tuple[str, ...]:
+        """Get the song names in the window after the playing position."""
+        start = max(self.position + 1, self._bounds.start)
+        return tuple(_slice(self.songs, start, self._bounds.stop))
+
+    def page(self, start: int, count: int) -> List[Tuple[int, str]]:
+        """
+        Get (index, song name) pairs of any part of the queue.
+
+        Args:
+            start: First queue index
+            count: Maximum number of entries
+
+        Returns:
+            Up to count pairs, fewer at the end of the queue
+        """
+        stop = min(len(self.songs), start + count)
+        return list(zip(range(start, stop), _slice(self.songs, start, stop)))
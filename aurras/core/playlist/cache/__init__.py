@@ -9,8 +9,12 @@ clearing cached search history.
 
 from aurras.utils.logger import get_logger
 from aurras.utils.path_manager import _path_manager
+from aurras.utils.db_migrations import run_migrations
 from aurras.utils.db_connection import DatabaseConnectionManager
-from aurras.core.playlist.cache.initialize import InitializePlaylistDatabase
+from aurras.core.playlist.cache.initialize import (
+    PLAYLIST_MIGRATIONS,
+    InitializePlaylistDatabase,
+)
 
 logger = get_logger("aurras.core.playlist.cache", log_to_console=False)
 
@@ -21,6 +25,7 @@ logger.debug(
 
 # Initialize the playlist database when the module is imported
 InitializePlaylistDatabase().initialize_cache(playlist_db_connection.connection)
+run_migrations(playlist_db_connection, PLAYLIST_MIGRATIONS)
 logger.debug(f"Playlist cache database initialized: {_path_manager.playlists_db}")
 
 
@@ -4,6 +4,22 @@ Cache Initialization Module
 This module provides a class for initializing the playlist database.
 """
 
+from aurras.utils.db_migrations import Migration
+from aurras.utils.db_connection import ensure_column
+
+
+def _add_playlist_song_indexes(connection) -> None:
+    """Index playlist songs by name, for linking and removing them by track."""
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS idx_playlist_songs_track_artist "
+        "ON playlist_songs(track_name, artist_name)"
+    )
+
+
+PLAYLIST_MIGRATIONS = [
+    Migration(1, "Index playlist songs by name", _add_playlist_song_indexes),
+]
+
 
 class InitializePlaylistDatabase:
     """
@@ -51,7 +67,13 @@ class InitializePlaylistDatabase:
                 track_name TEXT NOT NULL,
                 artist_name TEXT,
                 added_at INTEGER,
+                track_id TEXT,
                 FOREIGN KEY (playlist_id) REFERENCES playlists(id),
                 UNIQUE(playlist_id, track_name, artist_name)
             )"""
         )
+        ensure_column(connection, "playlist_songs", "track_id", "TEXT")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_playlist_songs_track_id "
+            "ON playlist_songs(track_id)"
+        )
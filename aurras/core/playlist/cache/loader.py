@@ -29,7 +29,7 @@ class LoadPlaylistData:
         Returns:
             tuple[int, str] | None: A tuple of (playlist_id, corrected_name) if found, None otherwise
         """
-        with playlist_db_connection as conn:
+        with playlist_db_connection.reader() as conn:
             cursor = conn.cursor()
             cursor.execute("""SELECT id, name FROM playlists""")
             playlists_data = cursor.fetchall()
@@ -61,7 +61,7 @@ class LoadPlaylistData:
             if playlist_id is None:
                 return None
 
-            with playlist_db_connection as conn:
+            with playlist_db_connection.reader() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """SELECT * FROM playlists WHERE id = ?""",
@@ -83,7 +83,7 @@ class LoadPlaylistData:
                     }
                 ]
 
-        with playlist_db_connection as conn:
+        with playlist_db_connection.reader() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM playlists")
 
@@ -115,7 +115,7 @@ class LoadPlaylistData:
         Returns:
             list: A list of dictionaries containing song metadata
         """
-        with playlist_db_connection as conn:
+        with playlist_db_connection.reader() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """SELECT * FROM playlist_songs WHERE playlist_id IN ({})""".format(
@@ -85,15 +85,17 @@ class UpdatePlaylistDatabase:
 
         Args:
             songs_metadata (List[tuple]): List of tuples containing song metadata
-                (playlist_id, track_name, artist_name, album_name, added_at)
+                (playlist_id, track_name, artist_name, added_at, track_id)
         """
         with playlist_db_connection as conn:
             cursor = conn.cursor()
             cursor.executemany(
                 """
-                INSERT OR IGNORE INTO playlist_songs 
-                (playlist_id, track_name, artist_name, added_at)
-                VALUES (?, ?, ?, ?)
+                INSERT INTO playlist_songs 
+                (playlist_id, track_name, artist_name, added_at, track_id)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(playlist_id, track_name, artist_name) DO UPDATE SET
+                    track_id = COALESCE(excluded.track_id, track_id)
                 """,
                 songs_metadata,
             )
@@ -112,7 +114,8 @@ class UpdatePlaylistDatabase:
         Args:
             playlist_name (str): The name of the playlist to add songs to
             songs_metadata (List[tuple]): List of tuples containing song metadata
-                (track_name, artist_name, ?, ?, added_at)
+                (track_name, artist_name, track_id, ?, added_at); an empty
+                track_id leaves the song unlinked from the tracks table
         """
         playlist_id = self._get_playlist_id(playlist_name)
         if playlist_id is None:
@@ -124,6 +127,7 @@ class UpdatePlaylistDatabase:
                 data[0],  # track_name
                 data[1],  # artist_name
                 data[4],  # added_at - same timestamp for batch
+                data[2] or None,  # track_id
             )
             for data in songs_metadata
         ]
@@ -23,6 +23,9 @@ class Settings(BaseModel):
     # Playback settings
     maximum_volume: str = "130"
     default_volume: str = "100"
+    search_workers: str = "8"
+    stream_prefetch_count: str = "2"
+    audio_cache_size_mb: str = "1024"
 
     # Download settings
     playlist_path: str = str(_path_manager.playlists_dir)
@@ -30,6 +33,7 @@ class Settings(BaseModel):
     download_format: str = "mp3"
     download_bitrate: str = "auto"
     maximum_retries: str = "3"
+    download_workers: str = "4"
 
     # Recommendation settings
     enable_recommendations: str = "yes"
@@ -0,0 +1,180 @@
+"""
+spotdl Metadata Module
+
+This module reads spotdl save files (metadata.spotdl) incrementally. A save
+file is a JSON array of track records; instead of loading it whole, records
+are decoded one at a time from a small buffer, so memory stays bounded by the
+size of a single record no matter how large the download was.
+
+The stream remembers how far it has read, so when more records are appended to
+the file (see append_save_file) the next pass picks up the new ones only.
+
+Example:
+    ```python
+    stream = SaveFileStream("metadata.spotdl")
+    for record in stream.records():
+        print(record["name"])
+    ```
+"""
+
+import os
+import json
+import codecs
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from aurras.utils.logger import get_logger
+
+logger = get_logger("aurras.core.spotdl_metadata", log_to_console=False)
+
+CHUNK_SIZE = 64 * 1024
+# Characters between records: array brackets, commas and whitespace
+_SEPARATORS = "[], \t\r\n"
+
+_decoder = json.JSONDecoder()
+
+
+class SaveFileStream:
+    """
+    Resumable, incremental reader of a spotdl save file.
+    """
+
+    def __init__(self, path: str | Path, chunk_size: int = CHUNK_SIZE):
+        """
+        Initialize the stream.
+
+        Args:
+            path: Path to the save file
+            chunk_size: Bytes read from the file at a time
+        """
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        # Byte offset just past the last record that was yielded
+        self.offset = 0
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the records added since the last pass.
+
+        A record cut off at the end of the file (still being written) is left
+        for the next pass.
+
+        Yields:
+            Track records, in file order
+
+        Raises:
+            FileNotFoundError: If the save file doesn't exist
+            json.JSONDecodeError: If the file holds something other than records
+        """
+        size = os.path.getsize(self.path)
+        if size < self.offset:
+            # The file was replaced rather than appended to
+            logger.debug(f"{self.path} shrank, reading it from the start")
+            self.offset = 0
+
+        with open(self.path, "rb") as file:
+            file.seek(self.offset)
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            buffer = ""
+            position = 0
+            eof = False
+
+            while True:
+                start = position
+                while position < len(buffer) and buffer[position] in _SEPARATORS:
+                    position += 1
+
+                if position < len(buffer):
+                    if buffer[position] != "{":
+                        raise json.JSONDecodeError(
+                            "Expected a track record", buffer, position
+                        )
+                    try:
+                        record, end = _decoder.raw_decode(buffer, position)
+                    except json.JSONDecodeError:
+                        # Incomplete record; read more below
+                        pass
+                    else:
+                        self.offset += len(buffer[start:end].encode("utf-8"))
+                        position = end
+                        yield record
+                        continue
+
+                if eof:
+                    break
+
+                chunk = file.read(self.chunk_size)
+                eof = not chunk
+                # Keep only the unconsumed tail, so the buffer stays small
+                buffer = buffer[start:] + decoder.decode(chunk, final=eof)
+                position = 0
+
+        buffer = buffer[position:]
+        if buffer:
+            logger.debug(
+                f"Stopped at byte {self.offset} of {self.path}: incomplete record"
+            )
+
+
+def append_save_file(target: str | Path, source: str | Path) -> int:
+    """
+    Append the records of one save file to another, keeping it a valid array.
+
+    Args:
+        target: Save file to append to (created if missing)
+        source: Save file whose records are appended
+
+    Returns:
+        Number of records appended
+    """
+    records = [
+        json.dumps(record, ensure_ascii=False)
+        for record in SaveFileStream(source).records()
+    ]
+    if not records:
+        return 0
+
+    target = Path(target)
+    body = ",\n".join(records).encode("utf-8")
+
+    with open(target, "r+b" if target.exists() else "w+b") as file:
+        tail = _array_tail(file)
+        if tail is None:
+            if file.seek(0, os.SEEK_END):
+                logger.warning(f"{target} isn't a save file, overwriting it")
+            file.seek(0)
+            file.truncate()
+            file.write(b"[" + body + b"]\n")
+        else:
+            closing, empty = tail
+            file.seek(closing)
+            file.truncate()
+            file.write((b"" if empty else b",\n") + body + b"]\n")
+
+    return len(records)
+
+
+def _array_tail(file) -> Optional[Tuple[int, bool]]:
+    """
+    Find the closing bracket of the array in a save file.
+
+    Returns:
+        Tuple of (bracket offset, whether the array is empty), or None if the
+        file doesn't end with an array
+    """
+
+    def previous_char(position: int) -> Tuple[int, bytes]:
+        while position > 0:
+            file.seek(position - 1)
+            char = file.read(1)
+            if char not in b" \t\r\n":
+                return position - 1, char
+            position -= 1
+        return -1, b""
+
+    closing, char = previous_char(file.seek(0, os.SEEK_END))
+    if char != b"]":
+        return None
+
+    _, char = previous_char(closing)
+    return closing, char == b"["
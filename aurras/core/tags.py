@@ -0,0 +1,433 @@
+"""
+Audio Tags Module
+
+This module reads title, artist, album and duration from local audio files
+without any third-party library. Only the headers are looked at: files are
+memory-mapped, so the parsers index into the tag and header regions without
+reading the audio data.
+
+Supported formats:
+    - MP3: ID3v2.2-2.4 and ID3v1 tags, duration from TLEN, the Xing/Info or
+      VBRI header, or the bitrate of the first frame
+    - FLAC: STREAMINFO and Vorbis comments
+    - OGG: Vorbis and Opus comments, duration from the last page's granule
+    - M4A/MP4: iTunes ilst atoms and the mvhd duration
+
+Large file lists are read with a process pool (see read_tags_many).
+"""
+
+import os
+import mmap
+import struct
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from aurras.utils.logger import get_logger
+
+logger = get_logger("aurras.core.tags", log_to_console=False)
+
+# Below this many files a process pool costs more than it saves
+POOL_THRESHOLD = 64
+
+
+class AudioTags(NamedTuple):
+    """Tags read from an audio file; empty strings and 0 where unknown."""
+
+    title: str = ""
+    artist: str = ""
+    album: str = ""
+    duration: int = 0  # Seconds
+
+
+# Vorbis comment / ID3 frame / MP4 atom names of each field
+_VORBIS_FIELDS = {"TITLE": "title", "ARTIST": "artist", "ALBUM": "album"}
+_ID3_FIELDS = {
+    b"TIT2": "title",
+    b"TPE1": "artist",
+    b"TALB": "album",
+    b"TT2": "title",
+    b"TP1": "artist",
+    b"TAL": "album",
+}
+_MP4_FIELDS = {b"\xa9nam": "title", b"\xa9ART": "artist", b"\xa9alb": "album"}
+
+# MPEG audio layer III tables, by MPEG version (1, or 2 and 2.5)
+_MP3_BITRATES = {
+    1: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),  # MPEG 1
+    2: (22050, 24000, 16000),  # MPEG 2
+    0: (11025, 12000, 8000),  # MPEG 2.5
+}
+
+
+def read_tags(path: str) -> Optional[AudioTags]:
+    """
+    Read the tags of an audio file.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        The tags, or None if the file can't be read or its format is unknown
+    """
+    try:
+        with open(path, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return _parse(data)
+    except (OSError, ValueError, struct.error, IndexError) as e:
+        # ValueError is raised for empty files by mmap
+        logger.debug(f"Could not read tags of {path}: {e}")
+        return None
+
+
+def read_tags_many(
+    paths: List[str], workers: Optional[int] = None
+) -> Dict[str, AudioTags]:
+    """
+    Read the tags of several files, in parallel processes for long lists.
+
+    Args:
+        paths: Paths to the files
+        workers: Number of processes (CPU count if None)
+
+    Returns:
+        Dictionary with path as key and tags as value, for readable files
+    """
+    if len(paths) < POOL_THRESHOLD:
+        results = map(read_tags, paths)
+    else:
+        workers = workers or os.cpu_count() or 1
+        # spawn, since the pool may be started from a process with threads
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            chunksize = max(1, len(paths) // (workers * 4))
+            results = list(executor.map(read_tags, paths, chunksize=chunksize))
+
+    return {path: tags for path, tags in zip(paths, results) if tags}
+
+
+def _parse(data: mmap.mmap) -> Optional[AudioTags]:
+    """Dispatch to the parser of the file's format."""
+    head = data[:12]
+
+    if head[:4] == b"fLaC":
+        return _parse_flac(data, 0)
+    if head[:4] == b"OggS":
+        return _parse_ogg(data)
+    if head[4:8] == b"ftyp":
+        return _parse_mp4(data)
+
+    if head[:3] == b"ID3":
+        tag_end = 10 + _syncsafe(data[6:10]) + (10 if data[5] & 0x10 else 0)
+        # FLAC files sometimes carry an ID3 tag in front
+        if data[tag_end : tag_end + 4] == b"fLaC":
+            return _parse_flac(data, tag_end)
+        return _parse_mp3(data)
+
+    if len(data) > 2 and data[0] == 0xFF and data[1] & 0xE0 == 0xE0:
+        return _parse_mp3(data)
+
+    return None
+
+
+def _syncsafe(raw: bytes) -> int:
+    """Decode a 7-bits-per-byte ID3 integer."""
+    value = 0
+    for byte in raw:
+        value = (value << 7) | (byte & 0x7F)
+    return value
+
+
+def _decode_id3_text(raw: bytes) -> str:
+    """Decode an ID3 text frame (encoding byte followed by the text)."""
+    if not raw:
+        return ""
+
+    encoding, text = raw[0], raw[1:]
+    if encoding == 1:
+        value = text.decode("utf-16", "replace")
+    elif encoding == 2:
+        value = text.decode("utf-16-be", "replace")
+    elif encoding == 3:
+        value = text.decode("utf-8", "replace")
+    else:
+        value = text.decode("latin-1")
+
+    # ID3v2.4 separates multiple values with NUL, each UTF-16 one with a BOM
+    parts = (part.lstrip("\ufeff") for part in value.split("\x00"))
+    return ", ".join(part for part in parts if part).strip()
+
+
+def _parse_mp3(data: mmap.mmap) -> AudioTags:
+    """Read ID3 tags and the duration of an MP3 file."""
+    fields: Dict[str, str] = {}
+    length_ms = 0
+    audio_start = 0
+
+    if data[:3] == b"ID3":
+        major, flags = data[3], data[5]
+        tag_size = _syncsafe(data[6:10])
+        audio_start = 10 + tag_size + (10 if flags & 0x10 else 0)
+        position = 10
+
+        if flags & 0x40 and major >= 3:  # Extended header
+            extended = data[10:14]
+            if major == 4:
+                position += _syncsafe(extended)
+            else:
+                position += struct.unpack(">I", extended)[0] + 4
+
+        id_size, header_size = (3, 6) if major == 2 else (4, 10)
+        end = 10 + tag_size
+
+        while position + header_size <= end:
+            frame_id = data[position : position + id_size]
+            if not frame_id.strip(b"\x00"):
+                break  # Padding
+
+            raw_size = data[position + id_size : position + id_size * 2]
+            if major == 2:
+                size = int.from_bytes(raw_size, "big")
+            elif major == 4:
+                size = _syncsafe(raw_size)
+            else:
+                size = struct.unpack(">I", raw_size)[0]
+
+            body = data[position + header_size : position + header_size + size]
+            position += header_size + size
+
+            if frame_id in _ID3_FIELDS:
+                fields.setdefault(_ID3_FIELDS[frame_id], _decode_id3_text(body))
+            elif frame_id in (b"TLEN", b"TLE"):
+                length = _decode_id3_text(body)
+                length_ms = int(length) if length.isdigit() else 0
+
+    # ID3v1 at the end of the file fills in what ID3v2 didn't have
+    if len(data) >= 128 and data[-128:-125] == b"TAG":
+        v1 = data[-128:]
+        for name, start in (("title", 3), ("artist", 33), ("album", 63)):
+            value = v1[start : start + 30].split(b"\x00")[0].decode("latin-1").strip()
+            if value and not fields.get(name):
+                fields[name] = value
+
+    duration = length_ms // 1000 or _mp3_duration(data, audio_start)
+    return AudioTags(duration=int(duration), **fields)
+
+
+def _mp3_duration(data: mmap.mmap, start: int) -> float:
+    """Work out the duration from the first MPEG frame after the tag."""
+    # Tolerate padding between the tag and the first frame
+    limit = min(len(data) - 4, start + 64 * 1024)
+    position = start
+    while position < limit:
+        if data[position] == 0xFF and data[position + 1] & 0xE0 == 0xE0:
+            break
+        position += 1
+    else:
+        return 0
+
+    header = data[position : position + 4]
+    version_bits = (header[1] >> 3) & 0x03
+    layer_bits = (header[1] >> 1) & 0x03
+    bitrate_index = header[2] >> 4
+    rate_index = (header[2] >> 2) & 0x03
+    mono = header[3] >> 6 == 3
+
+    if version_bits == 1 or layer_bits != 1 or rate_index == 3:
+        return 0  # Reserved values, or not layer III
+
+    mpeg1 = version_bits == 3
+    sample_rate = _MP3_SAMPLE_RATES[version_bits][rate_index]
+    samples_per_frame = 1152 if mpeg1 else 576
+
+    # Xing/Info (LAME) or VBRI headers count the frames of VBR files
+    side_info = (17 if mono else 32) if mpeg1 else (9 if mono else 17)
+    xing = position + 4 + side_info
+    if data[xing : xing + 4] in (b"Xing", b"Info"):
+        flags = struct.unpack(">I", data[xing + 4 : xing + 8])[0]
+        if flags & 0x01:
+            frames = struct.unpack(">I", data[xing + 8 : xing + 12])[0]
+            return frames * samples_per_frame / sample_rate
+
+    vbri = position + 36
+    if data[vbri : vbri + 4] == b"VBRI":
+        frames = struct.unpack(">I", data[vbri + 14 : vbri + 18])[0]
+        return frames * samples_per_frame / sample_rate
+
+    bitrate = _MP3_BITRATES[1 if mpeg1 else 2][bitrate_index] * 1000
+    if not bitrate:
+        return 0
+
+    audio_end = len(data) - (128 if data[-128:-125] == b"TAG" else 0)
+    return (audio_end - position) * 8 / bitrate
+
+
+def _parse_vorbis_comment(data, position: int) -> Dict[str, str]:
+    """Read the fields of a Vorbis comment block (used by FLAC and OGG)."""
+    vendor_length = struct.unpack("<I", data[position : position + 4])[0]
+    position += 4 + vendor_length
+    count = struct.unpack("<I", data[position : position + 4])[0]
+    position += 4
+
+    fields: Dict[str, List[str]] = {}
+    for _ in range(count):
+        length = struct.unpack("<I", data[position : position + 4])[0]
+        position += 4
+        key, _, value = bytes(data[position : position + length]).partition(b"=")
+        position += length
+
+        name = _VORBIS_FIELDS.get(key.decode("ascii", "replace").upper())
+        if name:
+            fields.setdefault(name, []).append(value.decode("utf-8", "replace"))
+
+    return {name: ", ".join(values) for name, values in fields.items()}
+
+
+def _parse_flac(data: mmap.mmap, start: int) -> AudioTags:
+    """Read the STREAMINFO and Vorbis comment blocks of a FLAC file."""
+    fields: Dict[str, str] = {}
+    duration = 0
+    position = start + 4
+    last = False
+
+    while not last and position + 4 <= len(data):
+        header = data[position]
+        last = bool(header & 0x80)
+        block_type = header & 0x7F
+        length = int.from_bytes(data[position + 1 : position + 4], "big")
+        body = position + 4
+
+        if block_type == 0:  # STREAMINFO
+            info = data[body : body + 18]
+            sample_rate = (info[10] << 12) | (info[11] << 4) | (info[12] >> 4)
+            total_samples = ((info[13] & 0x0F) << 32) | struct.unpack(
+                ">I", info[14:18]
+            )[0]
+            if sample_rate:
+                duration = total_samples // sample_rate
+        elif block_type == 4:  # VORBIS_COMMENT
+            fields = _parse_vorbis_comment(data, body)
+
+        position = body + length
+
+    return AudioTags(duration=duration, **fields)
+
+
+def _ogg_packets(data: mmap.mmap, count: int) -> List[bytes]:
+    """Reassemble the first packets of an OGG stream."""
+    packets: List[bytes] = []
+    current = bytearray()
+    position = 0
+
+    while len(packets) < count and data[position : position + 4] == b"OggS":
+        segments = data[position + 26]
+        table = data[position + 27 : position + 27 + segments]
+        position += 27 + segments
+
+        for size in table:
+            current += data[position : position + size]
+            position += size
+            # A segment shorter than 255 bytes ends the packet
+            if size < 255:
+                packets.append(bytes(current))
+                current = bytearray()
+                if len(packets) == count:
+                    break
+
+    return packets
+
+
+def _parse_ogg(data: mmap.mmap) -> Optional[AudioTags]:
+    """Read the comments and duration of an OGG Vorbis or Opus file."""
+    packets = _ogg_packets(data, 2)
+    if len(packets) < 2:
+        return None
+
+    identification, comments = packets
+    if identification.startswith(b"\x01vorbis"):
+        sample_rate = struct.unpack("<I", identification[12:16])[0]
+        pre_skip = 0
+        fields = _parse_vorbis_comment(comments, 7)
+    elif identification.startswith(b"OpusHead"):
+        # Opus granule positions always count 48 kHz samples
+        sample_rate = 48000
+        pre_skip = struct.unpack("<H", identification[10:12])[0]
+        fields = _parse_vorbis_comment(comments, 8)
+    else:
+        return None
+
+    duration = 0
+    last_page = data.rfind(b"OggS")
+    if last_page >= 0 and sample_rate:
+        granule = struct.unpack("<q", data[last_page + 6 : last_page + 14])[0]
+        duration = max(0, granule - pre_skip) // sample_rate
+
+    return AudioTags(duration=duration, **fields)
+
+
+def _mp4_atoms(data: mmap.mmap, start: int, end: int):
+    """Yield (type, body start, body end) of the atoms in a range."""
+    position = start
+    while position + 8 <= end:
+        size, kind = struct.unpack(">I4s", data[position : position + 8])
+        header = 8
+        if size == 1:
+            size = struct.unpack(">Q", data[position + 8 : position + 16])[0]
+            header = 16
+        elif size == 0:
+            size = end - position
+        if size < header:
+            return
+
+        yield kind, position + header, min(position + size, end)
+        position += size
+
+
+def _find_mp4_atom(
+    data: mmap.mmap, start: int, end: int, path: List[bytes]
+) -> Optional[Tuple[int, int]]:
+    """Find the body range of a nested atom, e.g. [b"moov", b"udta"]."""
+    for kind, body_start, body_end in _mp4_atoms(data, start, end):
+        if kind == path[0]:
+            if len(path) == 1:
+                return body_start, body_end
+            # meta is a full atom: version and flags precede its children
+            child_start = body_start + 4 if kind == b"meta" else body_start
+            return _find_mp4_atom(data, child_start, body_end, path[1:])
+    return None
+
+
+def _parse_mp4(data: mmap.mmap) -> AudioTags:
+    """Read the iTunes metadata and duration of an M4A/MP4 file."""
+    fields: Dict[str, str] = {}
+    duration = 0
+
+    mvhd = _find_mp4_atom(data, 0, len(data), [b"moov", b"mvhd"])
+    if mvhd:
+        start = mvhd[0]
+        if data[start] == 1:
+            timescale, length = struct.unpack(">IQ", data[start + 20 : start + 32])
+        else:
+            timescale, length = struct.unpack(">II", data[start + 12 : start + 20])
+        if timescale:
+            duration = length // timescale
+
+    ilst = _find_mp4_atom(data, 0, len(data), [b"moov", b"udta", b"meta", b"ilst"])
+    if ilst:
+        for kind, start, end in _mp4_atoms(data, *ilst):
+            name = _MP4_FIELDS.get(kind)
+            if not name:
+                continue
+            for child, body_start, body_end in _mp4_atoms(data, start, end):
+                if child == b"data":
+                    # Type indicator and locale come before the value
+                    value = data[body_start + 8 : body_end]
+                    fields[name] = value.decode("utf-8", "replace")
+                    break
+
+    return AudioTags(duration=duration, **fields)
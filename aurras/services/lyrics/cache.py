@@ -5,11 +5,12 @@ This module provides functionality for caching lyrics in memory and database.
 """
 
 import re
+import time
 import sqlite3
 from typing import Optional, Dict, List, Any
 
 from aurras.utils.logger import get_logger
-from aurras.utils.path_manager import _path_manager
+from aurras.core.cache import cache_db_connection
 from aurras.core.cache.updater import UpdateSearchHistoryDatabase
 
 logger = get_logger("aurras.services.lyrics.cache", log_to_console=False)
@@ -23,9 +24,11 @@ class LyricsCache:
     using the unified cache database schema.
     """
 
+    MISS_TTL = 3 * 24 * 60 * 60  # Retry songs without lyrics after 3 days
+
     def __init__(self):
         """Initialize the lyrics cache."""
-        self.cache_db_path = _path_manager.cache_db
+        self.cache_db = cache_db_connection
         self._memory_cache: Dict[str, List[str]] = {}
 
     def get_from_cache(self, song: str, artist: str, album: str) -> Optional[List[str]]:
@@ -112,6 +115,52 @@ class LyricsCache:
         except Exception as e:
             logger.error(f"Error storing lyrics in database: {e}")
 
+    def is_known_miss(self, song: str, artist: str) -> bool:
+        """
+        Check whether the providers recently had no lyrics for a song.
+
+        Args:
+            song: Song name
+            artist: Artist name
+
+        Returns:
+            True if a lookup found nothing less than MISS_TTL seconds ago
+        """
+        try:
+            with self.cache_db.reader() as conn:
+                row = conn.execute(
+                    "SELECT checked_at FROM lyrics_misses "
+                    "WHERE track_name = ? AND artist_name = ?",
+                    (song, artist),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Error checking lyrics misses: {e}")
+            return False
+
+        return bool(row) and time.time() - row[0] < self.MISS_TTL
+
+    def record_miss(self, song: str, artist: str) -> None:
+        """
+        Remember that no provider had lyrics for a song.
+
+        Args:
+            song: Song name
+            artist: Artist name
+        """
+        try:
+            with self.cache_db as conn:
+                conn.execute(
+                    """
+                    INSERT INTO lyrics_misses (track_name, artist_name, checked_at)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT(track_name, artist_name) DO UPDATE SET
+                        checked_at = excluded.checked_at
+                    """,
+                    (song, artist, int(time.time())),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Error recording lyrics miss: {e}")
+
     def load_lyrics_from_db(
         self, track_name: str, artist_name: str, album_name: str
     ) -> Optional[Dict[str, Any]]:
@@ -136,7 +185,7 @@ class LyricsCache:
                 f"DB lookup: Song='{track_name}', Artist='{artist_name}', Album='{album_name}'"
             )
 
-            with sqlite3.connect(self.cache_db_path) as conn:
+            with self.cache_db.reader() as conn:
                 cursor = conn.cursor()
 
                 # Try exact match first
@@ -162,17 +211,7 @@ class LyricsCache:
 
                 # Try fuzzy match if exact match fails and we have a reasonable track name
                 if len(track_name) > 3:  # Only try fuzzy match for substantial titles
-                    cursor.execute(
-                        """
-                        SELECT l.synced_lyrics, l.plain_lyrics 
-                        FROM cache c 
-                        JOIN lyrics l ON c.id = l.cache_id
-                        WHERE c.track_name LIKE ?
-                        ORDER BY l.fetch_time DESC LIMIT 1
-                        """,
-                        (f"%{track_name}%",),
-                    )
-                    result = cursor.fetchone()
+                    result = self._find_lyrics_by_substring(cursor, track_name)
 
                     if result and (result[0] or result[1]):
                         synced_lyrics, plain_lyrics = result
@@ -188,6 +227,47 @@ class LyricsCache:
             logger.error(f"Error retrieving lyrics from DB: {e}")
             return None
 
+    def _find_lyrics_by_substring(self, cursor, track_name: str):
+        """
+        Find the latest lyrics of a cached track whose name contains track_name.
+
+        Uses the trigram full-text index when the database has one, and a
+        LIKE scan otherwise.
+
+        Args:
+            cursor: Cursor on the cache database
+            track_name: Name of the track
+
+        Returns:
+            Row of (synced_lyrics, plain_lyrics), or None if nothing matched
+        """
+        phrase = '"' + track_name.replace('"', '""') + '"'
+
+        try:
+            cursor.execute(
+                """
+                SELECT l.synced_lyrics, l.plain_lyrics
+                FROM cache_fts f
+                JOIN lyrics l ON l.cache_id = f.rowid
+                WHERE cache_fts MATCH ?
+                ORDER BY l.fetch_time DESC LIMIT 1
+                """,
+                (f"track_name : {phrase}",),
+            )
+        except sqlite3.OperationalError:
+            cursor.execute(
+                """
+                SELECT l.synced_lyrics, l.plain_lyrics 
+                FROM cache c 
+                JOIN lyrics l ON c.id = l.cache_id
+                WHERE c.track_name LIKE ?
+                ORDER BY l.fetch_time DESC LIMIT 1
+                """,
+                (f"%{track_name}%",),
+            )
+
+        return cursor.fetchone()
+
     def _save_lyrics(
         self,
         track_name: str,
@@ -222,7 +302,7 @@ class LyricsCache:
             updater = UpdateSearchHistoryDatabase()
 
             # Look up song in cache by name and artist
-            with sqlite3.connect(self.cache_db_path) as conn:
+            with self.cache_db.reader() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
@@ -2,26 +2,81 @@
 Lyrics fetching module.
 
 This module provides functionality for fetching lyrics from APIs and services.
+
+Every provider is queried once, all of them at the same time. The first synced
+result wins; plain lyrics are only used if no provider has synced lyrics by the
+deadline, and plain lyrics for synced results are derived locally.
 """
 
-import requests
+import time
 import threading
-import syncedlyrics
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from syncedlyrics import providers as lyrics_providers
 
 from aurras.utils.logger import get_logger
-from aurras.services.lyrics.cache import LyricsCache
+from aurras.services.lyrics.parser import LyricsParser
 
 LYRICS_AVAILABLE = True
 
 logger = get_logger("aurras.services.lyrics.fetcher", log_to_console=False)
 
+# In order of preference when only plain lyrics are found
+LYRICS_PROVIDERS = ("Musixmatch", "Lrclib", "NetEase", "Megalobiz", "Genius")
+
+# Seconds to wait for a synced result before settling for what has arrived
+FETCH_DEADLINE = 8.0
+
+# Providers can outlive a fetch that hit its deadline, so leave room for them
+_executor = ThreadPoolExecutor(
+    max_workers=len(LYRICS_PROVIDERS) * 2, thread_name_prefix="aurras-lyrics"
+)
+_local = threading.local()
+
+
+def _get_provider(name: str):
+    """
+    Get this thread's instance of a provider.
+
+    Providers hold an HTTP session and attach a log handler when created, so
+    each worker thread creates them once and reuses them.
+    """
+    instances = getattr(_local, "providers", None)
+    if instances is None:
+        instances = _local.providers = {}
+
+    if name not in instances:
+        provider_class = getattr(lyrics_providers, name, None)
+        instances[name] = provider_class() if provider_class else None
+
+    return instances[name]
+
+
+def _split_result(result: Any) -> Tuple[str, str]:
+    """Get (synced, plain) text from a provider result of any syncedlyrics version."""
+    if not result:
+        return "", ""
+
+    if isinstance(result, str):
+        if LyricsParser.is_synced_lyrics(result.splitlines()):
+            return result, ""
+        return "", result
+
+    synced = getattr(result, "synced", None) or ""
+    plain = getattr(result, "unsynced", None) or ""
+    return synced, plain
+
 
 class LyricsFetcher:
     """Fetcher class to handle fetching lyrics from the API."""
 
     def __init__(
-        self, track_name: str, artist_name: str, album_name: str, duration: int
+        self,
+        track_name: str,
+        artist_name: str,
+        album_name: str,
+        duration: int,
+        deadline: float = FETCH_DEADLINE,
     ):
         """
         Initialize the LyricsFetcher.
@@ -31,78 +86,103 @@ class LyricsFetcher:
             artist_name: Name of the artist
             album_name: Name of the album
             duration: Duration of the track in seconds
+            deadline: Seconds to wait for providers before giving up on them
         """
-        self.lyrics = None
-        self.lock = threading.Lock()
-        self.cache = LyricsCache()
         self.track_name = track_name
         self.artist_name = artist_name
         self.album_name = album_name
         self.duration = duration
+        self.deadline = deadline
+        # Set when every provider answered and none had lyrics
+        self.not_found = False
 
     def fetch_lyrics(self) -> Dict[str, Any]:
         """
-        Fetch lyrics from the API.
+        Fetch lyrics from the providers.
 
-        This method focuses solely on fetching lyrics from external sources,
-        delegating all caching operations to the LyricsCache class.
+        Caching is left to the caller (see LyricsManager); this method only
+        talks to the lyrics providers.
 
         Returns:
             Dictionary with 'synced_lyrics' and 'plain_lyrics' keys
         """
-        cached_lyrics = self.cache.load_lyrics_from_db(
-            self.track_name, self.artist_name, self.album_name
-        )
-
-        if cached_lyrics:
-            return cached_lyrics
+        self.not_found = False
 
         if not LYRICS_AVAILABLE:
-            return {"synced_lyrics": "", "plain_lyrics": ""}
-
-        with self.lock:
-            try:
-                self.lyrics = syncedlyrics.search(
-                    f"{self.track_name} - {self.artist_name}"
+            return self._result([], [])
+
+        search_term = f"{self.track_name} - {self.artist_name}"
+        futures = {
+            _executor.submit(self._search_provider, name, search_term): name
+            for name in LYRICS_PROVIDERS
+        }
+        pending = set(futures)
+        plain_results: Dict[str, List[str]] = {}
+        failed = False
+        deadline = time.monotonic() + self.deadline
+
+        try:
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.debug(f"Lyrics deadline hit for '{self.track_name}'")
+                    break
+
+                done, pending = wait(
+                    pending, timeout=remaining, return_when=FIRST_COMPLETED
                 )
 
-                synced_lyrics = (
-                    syncedlyrics.search(
-                        f"{self.track_name} - {self.artist_name}",
-                        synced_only=True,
-                    )
-                    or ""
-                )
-                plain_lyrics = (
-                    syncedlyrics.search(
-                        f"{self.track_name} - {self.artist_name}",
-                        plain_only=True,
-                    )
-                    or ""
-                )
+                for future in done:
+                    provider = futures[future]
+                    try:
+                        synced, plain = future.result()
+                    except Exception as e:
+                        logger.debug(f"Lyrics provider {provider} failed: {e}")
+                        failed = True
+                        continue
+
+                    if synced:
+                        logger.info(f"Found synced lyrics on {provider}")
+                        synced_lines = synced.splitlines()
+                        return self._result(
+                            synced_lines, LyricsParser.get_plain_lyrics(synced_lines)
+                        )
+
+                    if plain:
+                        plain_results[provider] = plain.splitlines()
+        finally:
+            for future in pending:
+                future.cancel()
+
+        for provider in LYRICS_PROVIDERS:
+            if provider in plain_results:
+                logger.info(f"Found plain lyrics on {provider}")
+                return self._result([], plain_results[provider])
+
+        self.not_found = not pending and not failed
+        return self._result([], [])
+
+    @staticmethod
+    def _search_provider(name: str, search_term: str) -> Tuple[str, str]:
+        """
+        Query a single provider once.
+
+        Args:
+            name: Provider class name in syncedlyrics
+            search_term: "<track> - <artist>" search string
 
-                synced_lyrics_list = synced_lyrics.split("\n") if synced_lyrics else []
-                plain_lyrics_list = plain_lyrics.split("\n") if plain_lyrics else []
-
-                # Store fetched lyrics in the cache
-                if synced_lyrics_list or plain_lyrics_list:
-                    self.cache.store_in_cache(
-                        synced_lyrics_list if synced_lyrics_list else plain_lyrics_list,
-                        self.track_name,
-                        self.artist_name,
-                        self.album_name,
-                        self.duration,
-                    )
-
-                return {
-                    "synced_lyrics": synced_lyrics_list,
-                    "plain_lyrics": plain_lyrics_list,
-                }
-
-            except requests.RequestException as e:
-                logger.error(f"Error fetching lyrics: {e}")
-                return {"synced_lyrics": "", "plain_lyrics": ""}
-
-            except Exception as e:
-                logger.error(f"Error in lyrics fetcher: {e}")
-                return {"synced_lyrics": "", "plain_lyrics": ""}
+        Returns:
+            Tuple of (synced, plain) lyrics text, empty where not found
+        """
+        provider = _get_provider(name)
+        if provider is None:
+            return "", ""
+
+        return _split_result(provider.get_lrc(search_term))
+
+    @staticmethod
+    def _result(
+        synced_lyrics: List[str], plain_lyrics: List[str]
+    ) -> Dict[str, List[str]]:
+        """Build the result dictionary returned by fetch_lyrics."""
+        return {"synced_lyrics": synced_lyrics, "plain_lyrics": plain_lyrics}
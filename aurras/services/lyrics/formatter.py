@@ -5,10 +5,13 @@ This module provides functionality for formatting lyrics for display with theme
 """
 
 import random
-from typing import List, Dict, Any, Tuple, Callable
+from typing import List, Dict, Any, Callable, Optional
 
 from aurras.utils.console import console
-from aurras.services.lyrics.parser import LyricsParser
+from aurras.services.lyrics.parser import LyricsParser, ParsedLyrics
+
+# Number of plain lyrics lines shown at once
+PLAIN_CHUNK_SIZE = 15
 
 
 class LyricsFormatter:
@@ -95,75 +98,168 @@ class LyricsFormatter:
         if not lyrics_lines:
             return self.get_no_lyrics_message()
 
-        if not self.parser.is_synced_lyrics(lyrics_lines) or plain_mode:
-            return self._display_plain_lyrics(lyrics_lines, current_time, duration)
+        return self.render_lyrics(
+            ParsedLyrics.from_lines(lyrics_lines),
+            current_time,
+            duration,
+            context_lines,
+            plain_mode,
+        )
 
-        return self._display_synced_lyrics(lyrics_lines, current_time, context_lines)
+    def render_lyrics(
+        self,
+        parsed_lyrics: ParsedLyrics,
+        current_time: float,
+        duration: float,
+        context_lines: int = 6,
+        plain_mode: bool = False,
+    ) -> str:
+        """
+        Render pre-parsed lyrics for the current playback position.
+
+        Lines that aren't highlighted are styled once and reused from the
+        cache in `parsed_lyrics`, so each call only styles the active line.
+
+        Args:
+            parsed_lyrics: Lyrics parsed when they were loaded
+            current_time: Current playback position in seconds
+            duration: Song duration in seconds
+            context_lines: Number of context lines to show
+            plain_mode: If True, display plain lyrics without timestamps
+
+        Returns:
+            Formatted lyrics text with gradient highlighting
+        """
+        if not parsed_lyrics.synced or plain_mode:
+            return self._display_plain_lyrics(parsed_lyrics, current_time, duration)
+
+        return self._display_synced_lyrics(parsed_lyrics, current_time, context_lines)
+
+    def next_change_time(
+        self, parsed_lyrics: ParsedLyrics, current_time: float, duration: float
+    ) -> Optional[float]:
+        """
+        Get the playback position at which the rendered lyrics next change.
+
+        Follows the highlighting of render_lyrics: synced lyrics change when
+        the highlighted word moves on or the next line starts, plain lyrics
+        when the next chunk of lines is shown.
+
+        Args:
+            parsed_lyrics: Parsed lyrics
+            current_time: Current playback position in seconds
+            duration: Song duration in seconds
+
+        Returns:
+            Playback position in seconds, or None if they won't change again
+        """
+        if not parsed_lyrics:
+            return None
+
+        if not parsed_lyrics.synced:
+            total_chunks = max(1, len(parsed_lyrics) // PLAIN_CHUNK_SIZE)
+            if duration <= 0:
+                return None
+            current_chunk = int(current_time / duration * total_chunks)
+            if current_chunk >= total_chunks - 1:
+                return None
+            return duration * (current_chunk + 1) / total_chunks
+
+        index = parsed_lyrics.index_at(current_time)
+        line_start = parsed_lyrics.timestamps[index]
+        if current_time < line_start:
+            # Before the first line
+            return line_start
+
+        # A word is highlighted once the line's progress reaches its first
+        # character, as in _simulate_word_highlighting
+        words = parsed_lyrics.texts[index].split()
+        total_chars = sum(len(word) for word in words) + len(words) - 1
+        line_duration = parsed_lyrics.end_times[index] - line_start
+        if line_duration > 0 and total_chars > 0:
+            char_pos = 0
+            for word in words[:-1]:
+                char_pos += len(word) + 1
+                word_start = line_start + line_duration * char_pos / total_chars
+                if word_start > current_time:
+                    return word_start
+
+        if index + 1 < len(parsed_lyrics):
+            return parsed_lyrics.timestamps[index + 1]
+        return None
 
     def _display_plain_lyrics(
-        self, lyrics_lines: List[str], current_time: float, duration: float
+        self, parsed_lyrics: ParsedLyrics, current_time: float, duration: float
     ) -> str:
         """
         Display plain lyrics with simple gradient formatting based on current playback time.
 
         Args:
-            lyrics_lines: List of lyrics lines
+            parsed_lyrics: Parsed lyrics
             current_time: Current playback position in seconds
+            duration: Song duration in seconds
 
         Returns:
             Formatted lyrics text with the appropriate chunk visible
         """
-        plain_lyrics = self.parser.get_plain_lyrics(lyrics_lines)
+        plain_lyrics = parsed_lyrics.texts
 
         if not plain_lyrics:
             return self.get_no_lyrics_message()
 
-        CHUNK_SIZE = 15  # Number of lines to show at once
-
         # Calculate which chunk of lyrics to show
-        total_chunks = max(1, len(plain_lyrics) // CHUNK_SIZE)
-        current_chunk = min(
-            int((current_time / duration) * total_chunks), total_chunks - 1
-        )
+        total_chunks = max(1, len(plain_lyrics) // PLAIN_CHUNK_SIZE)
+        progress = current_time / duration if duration > 0 else 0
+        current_chunk = min(int(progress * total_chunks), total_chunks - 1)
 
         # Calculate the start and end indices
-        start_index = current_chunk * CHUNK_SIZE
-        end_index = min(start_index + CHUNK_SIZE, len(plain_lyrics))
-
-        # Get the current lyrics chunk
-        current_chunk_lyrics = plain_lyrics[start_index:end_index]
-
-        result_lines = []
-
-        for line in current_chunk_lyrics:
-            styled_line = console.style_text(text=line, style_key="primary")
-            result_lines.append(styled_line)
+        start_index = current_chunk * PLAIN_CHUNK_SIZE
+        end_index = min(start_index + PLAIN_CHUNK_SIZE, len(plain_lyrics))
+
+        # The line cache of synced lyrics holds muted markup, so style these here
+        if parsed_lyrics.synced:
+            result_lines = [
+                console.style_text(text=line, style_key="primary")
+                for line in plain_lyrics[start_index:end_index]
+            ]
+        else:
+            result_lines = [
+                self._cached_line_markup(parsed_lyrics, i, "primary")
+                for i in range(start_index, end_index)
+            ]
 
         return self._create_simple_gradient_view(result_lines)
 
     def _display_synced_lyrics(
-        self, lyrics_lines: List[str], current_time: float, context_lines: int
+        self, parsed_lyrics: ParsedLyrics, current_time: float, context_lines: int
     ) -> str:
         """Display synced lyrics with the current line highlighted."""
-        # Parse timestamps and build a list of (timestamp, text) tuples
-        parsed_lyrics = self.parser.parse_synced_lyrics(lyrics_lines)
-
         if not parsed_lyrics:
             return "[italic]Could not parse lyrics timestamps[/italic]"
 
         # Find the current line based on timestamp
-        current_index = self.parser.find_current_lyric_index(
-            parsed_lyrics, current_time
-        )
+        current_index = parsed_lyrics.index_at(current_time)
 
         # Create gradient display
         return self._create_gradient_lyrics_view(
             parsed_lyrics, current_time, current_index, context_lines
         )
 
+    def _cached_line_markup(
+        self, parsed_lyrics: ParsedLyrics, index: int, style_key: str
+    ) -> str:
+        """Get the styled markup of a line that isn't highlighted, styling it once."""
+        markup = parsed_lyrics.line_markup[index]
+        if markup is None:
+            markup = console.style_text(
+                text=parsed_lyrics.texts[index], style_key=style_key
+            )
+            parsed_lyrics.line_markup[index] = markup
+        return markup
+
     def _create_gradient_lyrics_view(
         self,
-        parsed_lyrics: List[Tuple[float, str]],
+        parsed_lyrics: ParsedLyrics,
         current_time: float,
         current_index: int,
         context_lines: int,
@@ -172,7 +268,7 @@ class LyricsFormatter:
         Create a themed display for synced lyrics with word-level highlighting.
 
         Args:
-            parsed_lyrics: List of (timestamp, text) tuples
+            parsed_lyrics: Parsed synced lyrics
             current_time: Current playback position in seconds
             current_index: Index of current line
             context_lines: Number of context lines to show
@@ -193,17 +289,20 @@ class LyricsFormatter:
 
         # Add the lines with proper highlighting
         for i in range(start_index, end_index):
-            timestamp, text = parsed_lyrics[i]
-
             if i == current_index:
                 # Current line - highlight with word-level animation
                 word_highlight = self._simulate_word_highlighting(
-                    text, timestamp, current_time, parsed_lyrics, i
+                    parsed_lyrics.texts[i],
+                    parsed_lyrics.timestamps[i],
+                    parsed_lyrics.end_times[i],
+                    current_time,
                 )
                 result_lines.append(word_highlight)
             else:
                 # Other lines - use theme color but dimmed
-                result_lines.append(console.style_text(text=text, style_key="text_muted"))
+                result_lines.append(
+                    self._cached_line_markup(parsed_lyrics, i, "text_muted")
+                )
 
         # Add a footer if we're not at the end
         if end_index < len(parsed_lyrics):
@@ -215,9 +314,8 @@ class LyricsFormatter:
         self,
         text: str,
         line_start_time: float,
+        line_end_time: float,
         current_time: float,
-        parsed_lyrics: List[Tuple[float, str]],
-        line_index: int,
     ) -> str:
         """
         Simulate word-level highlighting for standard LRC format.
@@ -225,10 +323,8 @@ class LyricsFormatter:
         Args:
             text: The line text
             line_start_time: Timestamp of current line
+            line_end_time: Time the current line ends
             current_time: Current playback position
-            parsed_lyrics: All parsed lyrics
-            line_index: Current line index
-            theme_style: Theme style dictionary
 
         Returns:
             Formatted text with simulated word-level highlighting
@@ -237,19 +333,6 @@ class LyricsFormatter:
         if not words:
             return text
 
-        # Calculate the end time of this line (start of next line or estimate)
-        line_end_time = None
-        if line_index < len(parsed_lyrics) - 1:
-            line_end_time = parsed_lyrics[line_index + 1][0]
-        else:
-            # For the last line, estimate duration based on average line duration
-            if line_index > 0:
-                prev_duration = line_start_time - parsed_lyrics[line_index - 1][0]
-                line_end_time = line_start_time + prev_duration
-            else:
-                # Default to 5 seconds if we can't estimate
-                line_end_time = line_start_time + 5
-
         # Calculate line duration
         line_duration = line_end_time - line_start_time
 
@@ -267,7 +350,9 @@ class LyricsFormatter:
         )  # Include spaces
 
         # Calculate "progress" through the line (0.0 to 1.0)
-        progress = min(1.0, elapsed_in_line / line_duration)
+        progress = (
+            min(1.0, elapsed_in_line / line_duration) if line_duration > 0 else 1.0
+        )
 
         # Calculate which character we're at based on progress
         target_char_pos = int(progress * total_chars)
@@ -5,12 +5,12 @@ This module provides the main manager class for handling lyrics operations.
 It serves as the primary interface between the lyrics service and the rest of the application.
 """
 
-from typing import List
+from typing import List, Optional
 
 from aurras.core.settings import SETTINGS
 from aurras.utils.logger import get_logger
 from aurras.services.lyrics.cache import LyricsCache
-from aurras.services.lyrics.parser import LyricsParser
+from aurras.services.lyrics.parser import LyricsParser, ParsedLyrics
 from aurras.services.lyrics.fetcher import LyricsFetcher
 from aurras.services.lyrics.formatter import LyricsFormatter
 
@@ -92,6 +92,11 @@ class LyricsManager:
             if cached_lyrics:
                 return cached_lyrics
 
+            # Don't ask the providers again about songs they recently didn't have
+            if self.lyrics_cache.is_known_miss(song, artist):
+                logger.debug(f"Skipping lyrics lookup for recent miss '{song}'")
+                return []
+
             # Log what we're searching for
             logger.info(
                 f"Fetching lyrics for: Song='{song}', Artist='{artist}', Album='{album}'"
@@ -101,6 +106,9 @@ class LyricsManager:
             lyrics_fetcher = LyricsFetcher(song, artist, album, duration)
             lyrics_data = lyrics_fetcher.fetch_lyrics()
 
+            if lyrics_fetcher.not_found:
+                self.lyrics_cache.record_miss(song, artist)
+
             if not lyrics_data:
                 logger.info(f"No lyrics found for '{song}'")
                 return []
@@ -218,6 +226,59 @@ class LyricsManager:
             lyrics_lines, current_time, duration, context_lines, plain_mode
         )
 
+    def parse_lyrics(self, lyrics_lines: List[str]) -> ParsedLyrics:
+        """
+        Parse lyrics once so they can be rendered cheaply on every frame.
+
+        Args:
+            lyrics_lines: List of lyrics lines (synced or plain)
+
+        Returns:
+            ParsedLyrics instance to pass to `render_lyrics`
+        """
+        return ParsedLyrics.from_lines(lyrics_lines)
+
+    def render_lyrics(
+        self,
+        parsed_lyrics: ParsedLyrics,
+        current_time: float,
+        duration: float,
+        context_lines: int = 6,
+    ) -> str:
+        """
+        Render pre-parsed lyrics with the current line highlighted.
+
+        Args:
+            parsed_lyrics: Lyrics returned by `parse_lyrics`
+            current_time: Current playback position in seconds
+            duration: Song duration in seconds
+            context_lines: Number of context lines to show
+
+        Returns:
+            Formatted lyrics text with gradient highlighting
+        """
+        return self.lyrics_formatter.render_lyrics(
+            parsed_lyrics, current_time, duration, context_lines
+        )
+
+    def next_lyrics_change(
+        self, parsed_lyrics: ParsedLyrics, current_time: float, duration: float
+    ) -> Optional[float]:
+        """
+        Get the playback position at which rendered lyrics next change.
+
+        Args:
+            parsed_lyrics: Lyrics returned by `parse_lyrics`
+            current_time: Current playback position in seconds
+            duration: Song duration in seconds
+
+        Returns:
+            Playback position in seconds, or None if they won't change again
+        """
+        return self.lyrics_formatter.next_change_time(
+            parsed_lyrics, current_time, duration
+        )
+
     # --- Additional access to internal components ---
 
     def _is_synced_lyrics(self, lyrics_lines: List[str]) -> bool:
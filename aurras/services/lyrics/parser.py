@@ -5,7 +5,8 @@ This module provides functionality for parsing and processing lyrics formats.
 """
 
 import re
-from typing import List, Tuple
+from bisect import bisect_right
+from typing import List, Optional, Tuple
 
 TIMESTAMP_PATTERN = r"\[(\d+):(\d+\.\d+)\]"
 WORD_TIMESTAMP_PATTERN = r"<\d+:\d+\.\d+>"
@@ -13,6 +14,9 @@ LINE_TIMESTAMP_PATTERN = r"\[\d+:\d+\.\d+\]"
 WORD_PATTERN = r"<(\d+):(\d+\.\d+)>\s*([^<]+)"
 LINE_PATTERN = r"\[(\d+):(\d+\.\d+)\](.*?)(?=\[\d+:\d+\.\d+\]|$)"
 
+# Assumed length of the last line when there's no earlier line to estimate from
+DEFAULT_LINE_DURATION = 5.0
+
 
 class LyricsParser:
     """Parser for different lyrics formats with support for synced and plain lyrics."""
@@ -119,3 +123,83 @@ class LyricsParser:
                 return max(0, i - 1)
         # If we get here, we're at the last line
         return len(parsed_lyrics) - 1
+
+
+class ParsedLyrics:
+    """
+    Lyrics parsed once when they are loaded, ready to be rendered every frame.
+
+    Synced lyrics keep their line start times in a sorted array so the current
+    line is found with a binary search, and each line's end time is worked out
+    up front. The styled markup of lines that aren't being highlighted is
+    cached per line by the formatter, so a frame only restyles the active line.
+    """
+
+    __slots__ = ("synced", "timestamps", "texts", "end_times", "line_markup")
+
+    def __init__(self, lines: List[Tuple[float, str]], synced: bool = True):
+        """
+        Initialize from parsed lines.
+
+        Args:
+            lines: (timestamp, text) tuples sorted by timestamp; timestamps are
+                ignored for plain lyrics
+            synced: Whether the lyrics carry timestamps
+        """
+        self.synced = synced
+        self.timestamps: List[float] = [timestamp for timestamp, _ in lines]
+        self.texts: List[str] = [text for _, text in lines]
+        self.end_times: List[float] = self._compute_end_times(self.timestamps)
+        self.line_markup: List[Optional[str]] = [None] * len(lines)
+
+    @classmethod
+    def from_lines(cls, lyrics_lines: List[str]) -> "ParsedLyrics":
+        """
+        Parse raw lyrics lines, synced or plain.
+
+        Args:
+            lyrics_lines: Lyrics lines as fetched or cached
+
+        Returns:
+            ParsedLyrics instance (empty if nothing could be parsed)
+        """
+        if LyricsParser.is_synced_lyrics(lyrics_lines):
+            return cls(LyricsParser.parse_synced_lyrics(lyrics_lines))
+
+        plain_lines = LyricsParser.get_plain_lyrics(lyrics_lines)
+        return cls([(0.0, line) for line in plain_lines], synced=False)
+
+    @staticmethod
+    def _compute_end_times(timestamps: List[float]) -> List[float]:
+        """
+        Work out when each line ends: at the start of the next line, or for
+        the last line after as long as the line before it lasted.
+        """
+        end_times = timestamps[1:]
+
+        if len(timestamps) > 1:
+            end_times.append(2 * timestamps[-1] - timestamps[-2])
+        elif timestamps:
+            end_times.append(timestamps[-1] + DEFAULT_LINE_DURATION)
+
+        return end_times
+
+    def __len__(self) -> int:
+        """Number of lyrics lines."""
+        return len(self.texts)
+
+    def index_at(self, current_time: float) -> int:
+        """
+        Find the index of the line playing at the given time.
+
+        Args:
+            current_time: Playback position in seconds
+
+        Returns:
+            Index of the current line (the first line before it starts), or -1
+            if there are no lines
+        """
+        if not self.texts:
+            return -1
+
+        return max(0, bisect_right(self.timestamps, current_time) - 1)
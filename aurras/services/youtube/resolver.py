@@ -0,0 +1,163 @@
+"""
+Track Resolver Module
+
+This module provides a bounded pool of workers that resolves track names to
+playable songs in parallel, so playback can start as soon as the first track
+is resolved instead of waiting for the whole queue.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from aurras.core.settings import SETTINGS
+from aurras.utils.logger import get_logger
+from aurras.services.youtube.search import (
+    CacheProvider,
+    DatabaseCacheProvider,
+    SearchProvider,
+    SongResult,
+    YouTubeSearchProvider,
+)
+
+logger = get_logger("aurras.services.youtube.resolver", log_to_console=False)
+
+DEFAULT_SEARCH_WORKERS = 8
+
+
+def _configured_workers() -> int:
+    """Get the configured number of search workers, falling back to the default."""
+    try:
+        return max(1, int(SETTINGS.search_workers))
+    except (AttributeError, TypeError, ValueError):
+        return DEFAULT_SEARCH_WORKERS
+
+
+class TrackResolver:
+    """
+    Resolves track names to SongResults using a bounded pool of workers.
+
+    Cached tracks are served straight from the cache provider; the rest are
+    searched concurrently through a single shared search provider. Results are
+    yielded in queue order as soon as every track before them is resolved.
+
+    Attributes:
+        search_provider: Provider used for tracks missing from the cache
+        cache_provider: Provider used for cached lookups and saving new results
+        max_workers: Maximum number of concurrent online lookups
+    """
+
+    def __init__(
+        self,
+        search_provider: Optional[SearchProvider] = None,
+        cache_provider: Optional[CacheProvider] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the resolver with optional providers (for easier testing).
+
+        Args:
+            search_provider: Provider for online searches
+            cache_provider: Provider for cached lookups
+            max_workers: Maximum number of concurrent online lookups
+        """
+        self.search_provider = search_provider or YouTubeSearchProvider()
+        self.cache_provider = cache_provider or DatabaseCacheProvider()
+        self.max_workers = max(1, max_workers or _configured_workers())
+
+    def _search_one(self, query: str) -> Optional[SongResult]:
+        """
+        Search a single query with the shared search provider.
+
+        Args:
+            query: Track name to search for
+
+        Returns:
+            The first search result, or None if nothing was found
+        """
+        try:
+            results = self.search_provider.search([query])
+        except Exception as e:
+            logger.error(f"Error resolving '{query}': {e}")
+            return None
+
+        return results[0] if results else None
+
+    def resolve(self, queries: List[str]) -> Iterator[Tuple[str, SongResult]]:
+        """
+        Resolve track names, yielding them in queue order as they become ready.
+
+        Tracks that can't be resolved are skipped. Closing the iterator early
+        cancels any lookups that haven't started yet.
+
+        Args:
+            queries: Track names to resolve
+
+        Yields:
+            Tuples of (query, resolved song)
+        """
+        if not queries:
+            return
+
+        try:
+            cached = self.cache_provider.get_songs(queries)
+        except Exception as e:
+            logger.warning(f"Cache lookup failed, resolving everything online: {e}")
+            cached = {}
+
+        misses = list(dict.fromkeys(q for q in queries if q not in cached))
+        logger.info(
+            f"Resolving {len(queries)} tracks: {len(queries) - len(misses)} cached, "
+            f"{len(misses)} online with {self.max_workers} workers"
+        )
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, max(1, len(misses))),
+            thread_name_prefix="aurras-resolver",
+        )
+        futures: Dict[str, Future] = {
+            query: executor.submit(self._search_one, query) for query in misses
+        }
+        resolved_online: Dict[str, SongResult] = {}
+
+        try:
+            for query in queries:
+                song = cached.get(query)
+
+                if song is None:
+                    song = futures[query].result()
+                    if song is None:
+                        logger.warning(f"Could not resolve track: {query}")
+                        continue
+                    resolved_online[query] = song
+
+                yield query, song
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._save_resolved(resolved_online)
+
+    def resolve_all(self, queries: List[str]) -> List[Tuple[str, SongResult]]:
+        """
+        Resolve every track name before returning.
+
+        Args:
+            queries: Track names to resolve
+
+        Returns:
+            List of (query, resolved song) tuples in queue order
+        """
+        return list(self.resolve(queries))
+
+    def _save_resolved(self, resolved: Dict[str, SongResult]) -> None:
+        """
+        Save songs resolved online to the cache in a single call.
+
+        Args:
+            resolved: Mapping of query to the song found online
+        """
+        if not resolved:
+            return
+
+        try:
+            self.cache_provider.save_songs(resolved)
+        except Exception as e:
+            logger.warning(f"Failed to cache resolved tracks: {e}")
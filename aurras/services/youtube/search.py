@@ -5,12 +5,14 @@ This module provides functionality for searching songs on YouTube with improved
 organization, error handling, and maintainability.
 """
 
+import threading
 from ytmusicapi import YTMusic
 from typing import List, Dict, Optional, Any, Protocol, NamedTuple, Tuple
 
 from aurras.utils.logger import get_logger
 from aurras.core.downloader import DownloadsDatabase
 from aurras.core.player.history import RecentlyPlayedManager
+from aurras.core.cache.index import song_search_index
 from aurras.core.cache.search_db import SearchFromSongDataBase
 from aurras.core.cache.updater import UpdateSearchHistoryDatabase
 from aurras.utils.handle_fuzzy_search import FuzzySearcher, FuzzyDictMatcher
@@ -56,10 +58,25 @@ class CacheProvider(Protocol):
 
 # Implementation classes
 class YouTubeSearchProvider:
-    """Provider for YouTube song searches."""
+    """
+    Provider for YouTube song searches.
+
+    A YTMusic client is created once per worker thread and reused for every
+    query that thread handles, so concurrent resolvers can share one provider
+    without opening a fresh session per lookup.
+    """
 
     def __init__(self) -> None:
         self._temp_storage: Dict[str, SongResult] = {}
+        self._local = threading.local()
+
+    def _get_client(self) -> YTMusic:
+        """Get the YTMusic client for the calling thread, creating it on first use."""
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = YTMusic()
+            self._local.client = client
+        return client
 
     def search(self, queries: List[str]) -> List[SongResult]:
         """Search for songs on YouTube."""
@@ -85,40 +102,39 @@ class YouTubeSearchProvider:
     def _search_single_query(self, query: str) -> Optional[SongResult]:
         """Search for a single query on YouTube."""
         try:
-            with YTMusic() as ytmusic:
-                results = ytmusic.search(query, filter="songs", limit=1)
+            results = self._get_client().search(query, filter="songs", limit=1)
 
-                if not results:
-                    logger.warning(f"No results found for: {query}")
-                    return None
+            if not results:
+                logger.warning(f"No results found for: {query}")
+                return None
 
-                song_data = results[0]
-                video_id = song_data.get("videoId")
+            song_data = results[0]
+            video_id = song_data.get("videoId")
 
-                if not video_id:
-                    logger.warning(f"No video ID found for: {query}")
-                    return None
+            if not video_id:
+                logger.warning(f"No video ID found for: {query}")
+                return None
 
-                title = song_data.get("title", "Unknown Song")
-                artist = (
-                    song_data.get("artists", [{}])[0].get("name", "Unknown Artist")
-                    if song_data.get("artists")
-                    else "Unknown Artist"
-                )
+            title = song_data.get("title", "Unknown Song")
+            artist = (
+                song_data.get("artists", [{}])[0].get("name", "Unknown Artist")
+                if song_data.get("artists")
+                else "Unknown Artist"
+            )
 
-                # Extract album information if available
-                album = "Unknown Album"
-                if "album" in song_data and song_data["album"]:
-                    album = song_data["album"].get("name", "Unknown Album")
+            # Extract album information if available
+            album = "Unknown Album"
+            if "album" in song_data and song_data["album"]:
+                album = song_data["album"].get("name", "Unknown Album")
 
-                url = f"https://www.youtube.com/watch?v={video_id}"
+            url = f"https://www.youtube.com/watch?v={video_id}"
 
-                # Get thumbnail if available
-                thumbnail_url = ""
-                if "thumbnails" in song_data and song_data["thumbnails"]:
-                    thumbnail_url = song_data["thumbnails"][0]["url"]
+            # Get thumbnail if available
+            thumbnail_url = ""
+            if "thumbnails" in song_data and song_data["thumbnails"]:
+                thumbnail_url = song_data["thumbnails"][0]["url"]
 
-                return SongResult(title, url, thumbnail_url, artist, album)
+            return SongResult(title, url, thumbnail_url, artist, album)
 
         except Exception as e:
             logger.error(f"YTMusic API error for '{query}': {e}")
@@ -140,22 +156,17 @@ class DatabaseCacheProvider:
         """Get songs from the database cache."""
         result = {}
 
-        cache_dict = self.search_db.initialize_full_song_dict()
-        downloads_dict = self.downloads_db.get_downloaded_songs()
-        song_dict = self.fuzzy_dict_matcher.merge_song_databases(
-            cache_dict, downloads_dict
-        )  # Instead of using update method, we use our enhanced merge method
-        logger.debug(f"Retrieved {len(song_dict)} songs from cache dictionary")
+        # The index is built from the database once and then kept up to date
+        # by save_to_cache, so lookups don't rescan the whole cache table
+        song_search_index.ensure_built(self._load_song_dict)
 
         for query in queries:
             # convert the query to actual song name that might be present in cache
-            query_corrected = self.fuzzy_search.find_best_match(
-                query, list(song_dict.keys())
-            )
-            if query_corrected is None:
-                return result
+            match = song_search_index.find(query, self.fuzzy_search.threshold)
+            if match is None:
+                continue
 
-            song_info = song_dict[query_corrected]
+            _, song_info = match
 
             result[query] = SongResult(
                 name=song_info["track_name"],
@@ -167,45 +178,47 @@ class DatabaseCacheProvider:
 
         return result
 
+    def get_indexed_songs(self) -> List[Dict[str, Any]]:
+        """
+        Get every cached and downloaded song from the in-memory index.
+
+        Returns:
+            List of song metadata dictionaries
+        """
+        song_search_index.ensure_built(self._load_song_dict)
+        return song_search_index.values()
+
+    def _load_song_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Load the merged cache and downloads dictionary to build the index from."""
+        cache_dict = self.search_db.initialize_full_song_dict()
+        downloads_dict = self.downloads_db.get_downloaded_songs()
+        song_dict = self.fuzzy_dict_matcher.merge_song_databases(
+            cache_dict, downloads_dict
+        )  # Instead of using update method, we use our enhanced merge method
+        logger.debug(f"Retrieved {len(song_dict)} songs from cache dictionary")
+        return song_dict
+
     def save_songs(self, query_to_song: Dict[str, SongResult]) -> None:
         """Save songs with complete metadata to the database cache."""
         try:
-            # Get existing songs to avoid duplicates
-            existing_songs = self.search_db.initialize_full_song_dict()
-
-            for query, song in query_to_song.items():
-                # Check if this song already exists in the cache
-                exists = False
-
-                # Check by URL (most reliable way to identify duplicates)
-                for _, cache_song in existing_songs.items():
-                    if (cache_song.get("url") == song.url and song.url) or (
-                        cache_song.get("track_name") == song.name
-                        and cache_song.get("artist_name") == song.artist
-                        and song.name
-                        and song.artist
-                    ):
-                        exists = True
-                        logger.debug(
-                            f"Song already in cache: {song.name} by {song.artist}"
-                        )
-                        break
-
-                # Only save if the song doesn't exist
-                if not exists:
-                    # Use the enhanced save method with consistent field names
-                    self.updater.save_to_cache(
-                        song_user_searched=query,
-                        track_name=song.name,
-                        url=song.url,
-                        artist_name=song.artist,
-                        album_name=song.album,
-                        thumbnail_url=song.thumbnail_url,
-                        duration=0,  # We don't have duration from YouTube search
-                    )
-                    logger.debug(
-                        f"Cached new song: {query} -> {song.name} by {song.artist}"
-                    )
+            # Songs already cached (by URL, or by track and artist name) are
+            # skipped by the database in the same statement
+            saved = self.updater.save_many_to_cache(
+                (
+                    {
+                        "song_user_searched": query,
+                        "track_name": song.name,
+                        "url": song.url,
+                        "artist_name": song.artist,
+                        "album_name": song.album,
+                        "thumbnail_url": song.thumbnail_url,
+                        "duration": 0,  # We don't have duration from YouTube search
+                    }
+                    for query, song in query_to_song.items()
+                ),
+                update_existing=False,
+            )
+            logger.debug(f"Cached {saved} of {len(query_to_song)} new songs")
         except Exception as e:
             logger.warning(f"Failed to update search cache: {str(e)}")
 
@@ -220,13 +233,16 @@ class DatabaseCacheProvider:
             List of recent songs from history as SongResult objects
         """
         try:
-            # Get recent songs from the history manager
-            recent_songs = self.history_manager.get_recent_songs(limit)
+            # Get recent songs joined with their track metadata
+            recent_songs = self.history_manager.get_recent_tracks(limit)
             logger.debug(f"Retrieved {len(recent_songs)} songs from history")
 
-            # Get song details from database for URLs
-            song_dict = self.search_db.initialize_song_dict()
-            logger.debug(f"Retrieved {len(song_dict)} songs from cache dictionary")
+            # History recorded before tracks were linked falls back to one
+            # batched, case-insensitive lookup by track name
+            unlinked = [song["song_name"] for song in recent_songs if not song["url"]]
+            urls_by_name = (
+                self.search_db.get_urls_by_track_names(unlinked) if unlinked else {}
+            )
 
             # Create a set to track seen songs to avoid duplicates
             seen_songs = set()
@@ -243,16 +259,20 @@ class DatabaseCacheProvider:
 
                 seen_songs.add(song_name)
 
-                # Find URL in dictionary (matching by song name)
-                url = None
-                for query, (name, song_url) in song_dict.items():
-                    if name.lower() == song_name.lower():  # Case-insensitive comparison
-                        url = song_url
-                        break
+                url = song_record["url"] or urls_by_name.get(song_name)
 
                 # If we found a URL, add to results
                 if url:
-                    results.append(SongResult(song_name, url, is_from_history=True))
+                    results.append(
+                        SongResult(
+                            song_name,
+                            url,
+                            song_record["thumbnail_url"] or "",
+                            song_record["artist_name"] or "",
+                            song_record["album_name"] or "",
+                            is_from_history=True,
+                        )
+                    )
                 else:
                     # Keep track of songs with missing URLs for logging
                     missing_urls.append(song_name)
@@ -0,0 +1,181 @@
+"""
+Stream Resolver Module
+
+This module resolves YouTube watch URLs to the direct audio stream URLs mpv
+would otherwise only get from its ytdl hook when a track starts. Resolved
+streams are cached until shortly before YouTube expires them, so a track that
+was resolved ahead of time starts without a lookup.
+
+yt-dlp is installed with spotdl; when it can't be imported, nothing is
+resolved and mpv keeps resolving URLs itself.
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from urllib.parse import parse_qs, urlparse
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, NamedTuple, Optional
+
+from aurras.utils.logger import get_logger
+
+logger = get_logger("aurras.services.youtube.streams", log_to_console=False)
+
+# Lifetime assumed for stream URLs without an expire parameter
+DEFAULT_STREAM_TTL = 60 * 60
+# Streams are dropped this long before they expire, so playback can finish
+EXPIRY_MARGIN = 10 * 60
+MAX_CACHED_STREAMS = 64
+
+_YOUTUBE_HOSTS = ("youtube.com", "youtu.be")
+
+
+class ResolvedStream(NamedTuple):
+    """A direct audio stream of a YouTube video."""
+
+    url: str
+    expires_at: float  # Unix time after which the URL stops working
+    user_agent: str = ""  # Sent by yt-dlp when it resolved the URL
+
+
+def is_youtube_url(url: str) -> bool:
+    """Check whether a URL is a YouTube page that has to be resolved."""
+    host = urlparse(url).hostname or ""
+    return any(host == name or host.endswith("." + name) for name in _YOUTUBE_HOSTS)
+
+
+def _stream_expiry(stream_url: str) -> float:
+    """Read the expiry time YouTube puts in its stream URLs."""
+    try:
+        return float(parse_qs(urlparse(stream_url).query)["expire"][0])
+    except (KeyError, IndexError, ValueError):
+        return time.time() + DEFAULT_STREAM_TTL
+
+
+class StreamResolver:
+    """
+    Resolves YouTube URLs to direct audio streams in background workers.
+
+    Attributes:
+        ytdl_format: yt-dlp format selector, the same one mpv is given
+    """
+
+    def __init__(self, ytdl_format: str = "bestaudio", max_workers: int = 2):
+        """
+        Initialize the resolver.
+
+        Args:
+            ytdl_format: yt-dlp format selector
+            max_workers: Maximum number of concurrent resolutions
+        """
+        self.ytdl_format = ytdl_format
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="aurras-stream"
+        )
+        self._streams: "OrderedDict[str, ResolvedStream]" = OrderedDict()
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        # YoutubeDL instances aren't thread-safe, so each worker gets its own
+        self._local = threading.local()
+
+    def get(self, url: str) -> Optional[ResolvedStream]:
+        """
+        Get the cached stream of a URL.
+
+        Args:
+            url: YouTube watch URL
+
+        Returns:
+            The stream, or None if it isn't resolved or is about to expire
+        """
+        with self._lock:
+            stream = self._streams.get(url)
+            if stream is None:
+                return None
+            if stream.expires_at - EXPIRY_MARGIN <= time.time():
+                del self._streams[url]
+                return None
+            self._streams.move_to_end(url)
+            return stream
+
+    def resolve(self, url: str) -> "Future[Optional[ResolvedStream]]":
+        """
+        Resolve a URL in the background, unless it's cached or in progress.
+
+        Args:
+            url: YouTube watch URL
+
+        Returns:
+            Future of the stream (None if it couldn't be resolved)
+        """
+        stream = self.get(url)
+        with self._lock:
+            if stream is None:
+                future = self._pending.get(url)
+                if future is None:
+                    future = self._pending[url] = self._executor.submit(
+                        self._resolve, url
+                    )
+                return future
+
+        future = Future()
+        future.set_result(stream)
+        return future
+
+    def _resolve(self, url: str) -> Optional[ResolvedStream]:
+        """Resolve a URL with yt-dlp and cache the stream."""
+        try:
+            ytdl = self._get_ytdl()
+            if ytdl is None:
+                return None
+
+            start = time.perf_counter()
+            info = ytdl.extract_info(url, download=False)
+            stream_url = info.get("url") if info else None
+            if not stream_url:
+                logger.debug(f"No direct stream for {url}")
+                return None
+
+            stream = ResolvedStream(
+                stream_url,
+                _stream_expiry(stream_url),
+                (info.get("http_headers") or {}).get("User-Agent", ""),
+            )
+            logger.debug(f"Resolved {url} in {time.perf_counter() - start:.2f}s")
+
+            with self._lock:
+                self._streams[url] = stream
+                while len(self._streams) > MAX_CACHED_STREAMS:
+                    self._streams.popitem(last=False)
+            return stream
+        except Exception as e:
+            logger.warning(f"Could not resolve stream of {url}: {e}")
+            return None
+        finally:
+            with self._lock:
+                self._pending.pop(url, None)
+
+    def _get_ytdl(self):
+        """Create the worker's yt-dlp instance on first use."""
+        ytdl = getattr(self._local, "ytdl", None)
+        if ytdl is None:
+            try:
+                from yt_dlp import YoutubeDL
+            except ImportError:
+                logger.info("yt-dlp is unavailable, streams resolve in mpv")
+                return None
+
+            ytdl = self._local.ytdl = YoutubeDL(
+                {
+                    "format": self.ytdl_format,
+                    "quiet": True,
+                    "no_warnings": True,
+                    "noplaylist": True,
+                    "skip_download": True,
+                }
+            )
+        return ytdl
+
+    def shutdown(self) -> None:
+        """Stop the workers, abandoning queued resolutions."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -3,6 +3,7 @@ Downloads management screen for Aurras TUI.
 """
 
 import os
+import time
 import asyncio
 from pathlib import Path
 from textual.app import ComposeResult
@@ -12,6 +13,7 @@ from textual.widgets import Header, Footer, Static, Button, Input, Label
 from textual.binding import Binding
 
 from ..widgets.playlist import Playlist
+from ...core.library import DownloadLibrary
 from ...core.downloader import SongDownloader
 from ...utils.path_manager import PathManager
 
@@ -31,6 +33,10 @@ class DownloadsScreen(Screen):
         """Initialize the downloads screen."""
         super().__init__()
         self.path_manager = PathManager()
+        self.library = DownloadLibrary(
+            songs_dir=self.path_manager.downloaded_songs_dir,
+            playlists_dir=self.path_manager.playlists_dir,
+        )
         self.downloaded_songs = []
         self.downloaded_playlists = []
         self.current_selection = None
@@ -87,33 +93,11 @@ class DownloadsScreen(Screen):
     async def _load_downloads(self):
         """Load downloaded songs and playlists."""
         try:
-            # Load downloaded songs
-            songs_dir = self.path_manager.downloaded_songs_dir
-            playlists_dir = self.path_manager.playlists_dir
-
-            # Get downloaded songs
-            self.downloaded_songs = []
-            if songs_dir.exists():
-                self.downloaded_songs = [
-                    f
-                    for f in os.listdir(songs_dir)
-                    if not f.startswith(".")
-                    and os.path.isfile(os.path.join(songs_dir, f))
-                    and any(
-                        f.endswith(ext)
-                        for ext in [".mp3", ".wav", ".flac", ".ogg", ".m4a"]
-                    )
-                ]
-
-            # Get downloaded playlists
-            self.downloaded_playlists = []
-            if playlists_dir.exists():
-                self.downloaded_playlists = [
-                    d
-                    for d in os.listdir(playlists_dir)
-                    if not d.startswith(".")
-                    and os.path.isdir(os.path.join(playlists_dir, d))
-                ]
+            # Rescan off the event loop; only changed files are hashed
+            await asyncio.to_thread(self.library.scan)
+
+            self.downloaded_songs = [file.name for file in self.library.get_files()]
+            self.downloaded_playlists = self.library.get_playlists()
 
             # Update the UI
             await self._update_downloads_ui()
@@ -186,47 +170,48 @@ class DownloadsScreen(Screen):
         progress_percent = self.query_one("#progress-percent", Label)
         progress_status = self.query_one("#progress-status", Static)
 
-        # Start the download process
-        async def download_async():
-            try:
-                progress_status.update("Searching for the song...")
-
-                # Update progress in stages
-                for i in range(1, 5):
-                    await asyncio.sleep(0.5)
-                    progress_percent.update(f"{i * 5}%")
-
-                progress_status.update("Preparing download...")
-                for i in range(5, 10):
-                    await asyncio.sleep(0.5)
-                    progress_percent.update(f"{i * 10}%")
+        def on_download_event(event, stats):
+            """Show per-track progress and throughput from the download workers."""
+            snapshot = stats.snapshot()
+            done = snapshot["downloaded"] + snapshot["skipped"] + snapshot["failed"]
+            percent = int(done * 100 / max(1, snapshot["total"]))
+            self.app.call_from_thread(progress_percent.update, f"{percent}%")
+            self.app.call_from_thread(
+                progress_status.update, f"{event.name} · {stats.summary()}"
+            )
 
-                progress_status.update("Downloading...")
-                for i in range(10, 20):
-                    await asyncio.sleep(0.3)
-                    progress_percent.update(f"{i * 5}%")
+        # Run the download in a worker thread so the UI stays responsive
+        def download_in_thread():
+            try:
+                self.app.call_from_thread(
+                    progress_status.update, "Preparing download..."
+                )
+                downloader = SongDownloader(
+                    [query],
+                    download_path=str(self.path_manager.downloaded_songs_dir),
+                    on_event=on_download_event,
+                )
+                success = downloader.download_songs()
 
-                # Simulate processing
-                progress_status.update("Processing download...")
-                await asyncio.sleep(1)
-                progress_percent.update("100%")
-                progress_status.update("Download complete!")
+                summary = downloader.stats.summary() if downloader.stats else ""
+                message = "Download complete!" if success else "Download failed"
+                self.app.call_from_thread(progress_percent.update, "100%")
+                self.app.call_from_thread(
+                    progress_status.update, f"{message} {summary}".strip()
+                )
 
-                # Add to downloaded songs
-                self.downloaded_songs.append(f"{query}.mp3")
-                await self._update_downloads_ui()
+                # Reload the list so the new song shows up
+                self.app.call_from_thread(self.action_refresh)
 
                 # Hide progress after a delay
-                await asyncio.sleep(2)
-                progress_container.add_class("hidden")
-                self.is_downloading = False
-
+                time.sleep(2)
             except Exception as e:
-                self.notify(f"Download error: {str(e)}")
-                progress_container.add_class("hidden")
+                self.app.call_from_thread(self.notify, f"Download error: {str(e)}")
+            finally:
+                self.app.call_from_thread(progress_container.add_class, "hidden")
                 self.is_downloading = False
 
-        self.run_worker(download_async())
+        self.run_worker(download_in_thread, thread=True)
 
     def _update_selection_details(self):
         """Update the selection details panel."""
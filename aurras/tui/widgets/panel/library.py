@@ -6,6 +6,7 @@ from textual.containers import Vertical, VerticalScroll
 from textual.widgets import OptionList
 
 from ....utils.path_manager import PathManager
+from ....core.downloader import DownloadsDatabase
 from ....playlist.manager import Select
 from ..icon import Icon
 from ..empty import Empty
@@ -58,24 +59,42 @@ class PlaylistsPanel(VerticalScroll):
 
 
 class DownloadedTracksPanel(OptionList):
-    """Widget for displaying downloaded tracks."""
+    """Widget for displaying downloaded tracks, a page at a time."""
+
+    PAGE_SIZE = 100
+    # Load the next page when the highlight gets this close to the last track
+    LOAD_MARGIN = 10
 
     def __init__(self, *args, **kwargs):
         """Initialize the tracks panel."""
         super().__init__(*args, **kwargs)
         self.border_title = "²tracks"
+        self._pages = DownloadsDatabase().iter_downloaded_songs(self.PAGE_SIZE)
 
     def compose(self):
         """Compose the tracks panel contents."""
         if not self._load_tracks():
             yield Empty()
-            return
-        self.add_options(self._load_tracks())
 
-    def _load_tracks(self):
-        """Load tracks into the panel."""
-        tracks = _path_manager.list_directory(_path_manager.downloaded_songs_dir)
-        return [f"{Icon.PRIMARY('')} {item}" for item in tracks] if tracks else None
+    def _load_tracks(self) -> bool:
+        """Add the next page of tracks to the panel; False once there are none."""
+        if self._pages is None:
+            return False
+
+        page = next(self._pages, None)
+        if page is None:
+            self._pages = None
+            return False
+
+        self.add_options([f"{Icon.PRIMARY('')} {song['track_name']}" for song in page])
+        return True
+
+    def on_option_list_option_highlighted(
+        self, event: OptionList.OptionHighlighted
+    ) -> None:
+        """Load more tracks as the highlight nears the end of the list."""
+        if event.option_index >= self.option_count - self.LOAD_MARGIN:
+            self._load_tracks()
 
 
 class LibraryPanel(Vertical):
@@ -7,19 +7,26 @@ from textual.containers import Vertical
 from textual.widgets import SelectionList, OptionList
 
 from ....player.queue import QueueManager
-from ....player.history import RecentlyPlayedManager
+from ....core.player.history import RecentlyPlayedManager
+from ....core.player.queue_window import QueueWindow
 from ..icon import Icon
 from ..empty import Empty
 
 
 class QueuePanel(SelectionList):
-    """Queue list widget showing upcoming songs."""
+    """Queue list widget showing upcoming songs, a page at a time."""
+
+    PAGE_SIZE = 100
+    # Load the next page when the highlight gets this close to the last song
+    LOAD_MARGIN = 10
 
     def __init__(self, *args, **kwargs):
         """Initialize queue with border title."""
         super().__init__(*args, **kwargs)
         self.border_title = "²queue"
         self.queue_manager = QueueManager()
+        self._queue = QueueWindow()
+        self._loaded = 0
 
     def on_mount(self):
         """Add current queue items on mount."""
@@ -28,22 +35,36 @@ class QueuePanel(SelectionList):
         self.queue_manager.register_change_callback(self._refresh_queue)
 
     def _refresh_queue(self):
-        """Refresh queue items from queue manager."""
+        """Refresh queue items from queue manager, showing the first page."""
         # Clear options safely
         self.clear_options()
 
-        queue_items = self.queue_manager.get_queue()
+        self._queue.reset(self.queue_manager.get_queue())
+        self._loaded = 0
 
-        if not queue_items:
+        if not len(self._queue):
             # Show empty state - Fix: Pass as single tuple argument
             self.add_option(("Queue is empty", "empty"))
             return
 
-        # Add actual queue items
-        for i, song in enumerate(queue_items):
-            song_id = f"queue_{i}"
-            # Fix: Pass as single tuple argument
-            self.add_option((song, song_id))
+        self._load_queue()
+
+    def _load_queue(self) -> bool:
+        """Add the next page of queue items; False once all of them are shown."""
+        page = self._queue.page(self._loaded, self.PAGE_SIZE)
+        if not page:
+            return False
+
+        self.add_options([(song, f"queue_{i}") for i, song in page])
+        self._loaded += len(page)
+        return True
+
+    def on_selection_list_selection_highlighted(
+        self, event: SelectionList.SelectionHighlighted
+    ) -> None:
+        """Load more queue items as the highlight nears the end of the list."""
+        if event.selection_index >= self.option_count - self.LOAD_MARGIN:
+            self._load_queue()
 
     def add_song(self, title, artist, duration, song_id=None):
         """Add a song to the queue."""
@@ -63,6 +84,8 @@ class QueuePanel(SelectionList):
 class RecentsPanel(OptionList):
     """Recently played list widget showing previously played songs."""
 
+    MAX_RECENTS = 100
+
     def __init__(self, *args, **kwargs):
         """Initialize with border title."""
         super().__init__(*args, **kwargs)
@@ -71,10 +94,11 @@ class RecentsPanel(OptionList):
 
     def compose(self) -> ComposeResult:
         """Compose the recents panel contents."""
-        if not self._load_recents():
+        recents = self._load_recents()
+        if not recents:
             yield Empty("No playback history!")
             return
-        self.add_options(self._load_recents())
+        self.add_options(recents)
 
     def on_mount(self):
         """Add recent history items on mount."""
@@ -86,8 +110,9 @@ class RecentsPanel(OptionList):
 
     def _load_recents(self):
         """Load recently played songs into the panel."""
-        recents = self.history_manager.get_recent_songs()
-        return [f"{Icon.PRIMARY('')} {item['song_name']}" for item in recents]
+        # One row per song, most recently played first
+        recents = self.history_manager.get_recently_played(self.MAX_RECENTS)
+        return [f"{Icon.PRIMARY('')} {item['song_id']}" for item in recents]
 
     def _clear_options(self):
         """Clear all options from the option list."""
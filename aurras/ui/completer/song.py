@@ -1,44 +1,321 @@
-from typing import List, Tuple
+"""
+Song Completer Module
 
+This module provides song name auto-completion for the search prompt.
+Suggestions are served from a local prefix index over cached and downloaded
+songs; YouTube is only queried, debounced, when the local results are sparse.
+"""
+
+import time
+import bisect
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from typing import Iterator, List, Optional, Tuple
+
+from prompt_toolkit.completion import Completion
+
+from aurras.utils.logger import get_logger
 from aurras.ui.completer.base import BaseCompleter
-from aurras.services.youtube.search import SearchFromYoutube
+from aurras.core.cache.index import song_search_index
+
+logger = get_logger("aurras.ui.completer.song", log_to_console=False)
+
+Suggestion = Tuple[str, str]
+
+DEBOUNCE_SECONDS = 0.3
+MIN_LOCAL_SUGGESTIONS = 3
+MAX_SUGGESTIONS = 10
+ONLINE_CACHE_SIZE = 128
+POLL_INTERVAL = 0.05
+
+
+class PrefixIndex:
+    """
+    Sorted prefix index over song names.
+
+    Every song is indexed under its full name and under each word it
+    contains, so "rhap" finds "Bohemian Rhapsody". Prefix lookups are a
+    binary search followed by a scan over the matching range.
+    """
+
+    def __init__(self, songs: Optional[List[Suggestion]] = None) -> None:
+        """
+        Build the index.
+
+        Args:
+            songs: List of (song name, artist) tuples to index
+        """
+        self._songs: List[Suggestion] = []
+        self._keys: List[Tuple[str, int, int]] = []
+        if songs:
+            self.build(songs)
+
+    def __len__(self) -> int:
+        """Return the number of indexed songs."""
+        return len(self._songs)
+
+    def build(self, songs: List[Suggestion]) -> None:
+        """
+        Replace the indexed songs.
+
+        Args:
+            songs: List of (song name, artist) tuples to index
+        """
+        unique = list(dict.fromkeys((name, artist) for name, artist in songs if name))
+        keys = []
+
+        for song_id, (name, _) in enumerate(unique):
+            words = name.lower().split()
+            for start in range(len(words)):
+                # Full-name keys sort before identical word keys
+                keys.append((" ".join(words[start:]), min(start, 1), song_id))
+
+        keys.sort()
+        self._songs = unique
+        self._keys = keys
+
+    def search(self, prefix: str, limit: int = MAX_SUGGESTIONS) -> List[Suggestion]:
+        """
+        Find songs whose name, or a word in it, starts with the prefix.
+
+        Args:
+            prefix: Lowercase text typed so far
+            limit: Maximum number of songs to return
+
+        Returns:
+            List of (song name, artist) tuples, full-name matches first
+        """
+        prefix = " ".join(prefix.split())
+        if not prefix:
+            return []
+
+        full_matches: List[int] = []
+        word_matches: List[int] = []
+        seen = set()
+
+        # Word matches only fill the gaps, so don't scan a huge range for them
+        scan_limit = limit * 8
+
+        position = bisect.bisect_left(self._keys, (prefix, -1, -1))
+        while (
+            position < len(self._keys)
+            and len(full_matches) < limit
+            and len(seen) < scan_limit
+        ):
+            key, word_position, song_id = self._keys[position]
+            if not key.startswith(prefix):
+                break
+            position += 1
+
+            if song_id in seen:
+                continue
+            seen.add(song_id)
+
+            if word_position == 0:
+                full_matches.append(song_id)
+            else:
+                word_matches.append(song_id)
+
+        return [self._songs[i] for i in (full_matches + word_matches)[:limit]]
 
 
 class SongCompleter(BaseCompleter):
     """
     Auto-completion class for song search.
 
-    Uses YouTube search to provide song suggestions.
+    Local matches are yielded immediately. When there are fewer than
+    `min_local` of them, the latest input is looked up on YouTube after a
+    debounce delay; lookups for input the user has already typed past are
+    dropped before they start, and their results are never shown.
+
+    The prompt runs completers in a background thread (complete_in_thread),
+    so waiting for the debounce or the network never blocks typing.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        debounce: float = DEBOUNCE_SECONDS,
+        min_local: int = MIN_LOCAL_SUGGESTIONS,
+        max_suggestions: int = MAX_SUGGESTIONS,
+    ):
         """
         Initializes the SongCompleter class.
+
+        Args:
+            debounce: Seconds to wait for typing to pause before going online
+            min_local: Number of local matches below which YouTube is queried
+            max_suggestions: Maximum number of suggestions shown
         """
-        self.song_recommendation = None
+        self.debounce = debounce
+        self.min_local = min_local
+        self.max_suggestions = max_suggestions
+
+        self._index = PrefixIndex()
+        self._index_version: Optional[int] = None
+        self._index_lock = threading.Lock()
+        self._cache_provider = None
 
-    def get_suggestions(self, text: str) -> List[Tuple[str, str]]:
+        self._online_cache: "OrderedDict[str, List[Suggestion]]" = OrderedDict()
+        self._online_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="aurras-suggest"
+        )
+        self._client = None
+
+        self._generation = 0
+        self._generation_lock = threading.Lock()
+
+        # Warm the local index so the first keystroke doesn't pay for it
+        threading.Thread(
+            target=self._refresh_index, name="aurras-suggest-index", daemon=True
+        ).start()
+
+    def get_suggestions(self, text: str) -> List[Suggestion]:
         """
-        Get song suggestions based on YouTube search.
+        Get song suggestions for the text typed so far.
 
         Args:
             text: The text to search for
 
         Returns:
-            List of tuples (song_name, "") - descriptions empty for songs
+            List of tuples (song_name, artist)
         """
-        song_name_typing = text.lstrip()
+        return list(self._iter_suggestions(text))
 
-        if song_name_typing == "":
-            return []
+    def get_completions(self, document, complete_event):
+        """
+        Yield local completions first, then online ones if they were needed.
+        """
+        text = document.text_before_cursor
+
+        for completion_text, description in self._iter_suggestions(text):
+            yield Completion(
+                completion_text,
+                start_position=-len(text),
+                display=completion_text,
+                display_meta=description,
+            )
+
+    def _iter_suggestions(self, text: str) -> Iterator[Suggestion]:
+        """Generate local suggestions, followed by online ones when sparse."""
+        generation = self._next_generation()
+        query = " ".join(text.lower().split())
+
+        if not query:
+            return
+
+        local = self._local_suggestions(query)
+        yield from local
+
+        if len(local) >= self.min_local:
+            return
+
+        shown = {name.lower() for name, _ in local}
+        remaining = self.max_suggestions - len(local)
+
+        for name, artist in self._online_suggestions(query, generation):
+            if remaining <= 0:
+                break
+            if name.lower() in shown:
+                continue
+            shown.add(name.lower())
+            remaining -= 1
+            yield name, artist
+
+    def _next_generation(self) -> int:
+        """Mark a new keystroke, making every earlier lookup stale."""
+        with self._generation_lock:
+            self._generation += 1
+            return self._generation
 
-        search_song = SearchFromYoutube([song_name_typing])
+    def _is_stale(self, generation: int) -> bool:
+        """Whether newer input has arrived since the given keystroke."""
+        return generation != self._generation
+
+    def _refresh_index(self) -> None:
+        """Rebuild the prefix index if the cached songs changed."""
         try:
-            search_song.search_from_youtube()
-            self.song_recommendation = search_song.song_name_searched
-        except Exception:
+            if self._cache_provider is None:
+                from aurras.services.youtube.search import DatabaseCacheProvider
+
+                self._cache_provider = DatabaseCacheProvider()
+
+            with self._index_lock:
+                songs = self._cache_provider.get_indexed_songs()
+                version = song_search_index.version
+                if version == self._index_version:
+                    return
+
+                self._index.build(
+                    [
+                        (song.get("track_name", ""), song.get("artist_name") or "")
+                        for song in songs
+                    ]
+                )
+                self._index_version = version
+                logger.debug(f"Built song suggestion index with {len(self._index)}")
+        except Exception as e:
+            logger.warning(f"Failed to build song suggestion index: {e}")
+
+    def _local_suggestions(self, query: str) -> List[Suggestion]:
+        """Get prefix matches from cached and downloaded songs."""
+        if self._index_version != song_search_index.version:
+            self._refresh_index()
+
+        return self._index.search(query, self.max_suggestions)
+
+    def _online_suggestions(self, query: str, generation: int) -> List[Suggestion]:
+        """
+        Look the query up on YouTube once typing pauses.
+
+        Returns an empty list if newer input arrives while waiting.
+        """
+        with self._online_lock:
+            if query in self._online_cache:
+                self._online_cache.move_to_end(query)
+                return self._online_cache[query]
+
+        time.sleep(self.debounce)
+        if self._is_stale(generation):
+            return []
+
+        future = self._executor.submit(self._fetch_online, query, generation)
+        while True:
+            try:
+                return future.result(timeout=POLL_INTERVAL)
+            except TimeoutError:
+                if self._is_stale(generation):
+                    return []
+            except Exception as e:
+                logger.debug(f"Online suggestions failed for '{query}': {e}")
+                return []
+
+    def _fetch_online(self, query: str, generation: int) -> List[Suggestion]:
+        """Search YouTube for the query unless it went stale while queued."""
+        if self._is_stale(generation):
             return []
 
-        if self.song_recommendation:
-            return [(song, "") for song in self.song_recommendation]
-        return []
+        if self._client is None:
+            from ytmusicapi import YTMusic
+
+            self._client = YTMusic()
+
+        results = self._client.search(query, filter="songs", limit=self.max_suggestions)
+        suggestions = [
+            (
+                result.get("title", ""),
+                ", ".join(artist["name"] for artist in result.get("artists") or []),
+            )
+            for result in results[: self.max_suggestions]
+            if result.get("title")
+        ]
+
+        # Results are kept even if the input moved on, for when it comes back
+        with self._online_lock:
+            self._online_cache[query] = suggestions
+            self._online_cache.move_to_end(query)
+            while len(self._online_cache) > ONLINE_CACHE_SIZE:
+                self._online_cache.popitem(last=False)
+
+        return suggestions
@@ -67,8 +67,8 @@ class HistoryProcessor:
         """
         with logger.operation_context(operation="history_display"):
             limit = int(limit)
-            recent_songs = self.history_manager.get_recent_songs(limit=limit)
-            history_count = self.history_manager.get_history_count()
+            recent_songs = self.history_manager.get_recently_played(limit=limit)
+            history_count = self.history_manager.get_played_song_count()
 
             logger.info(
                 "Retrieved playback history",
@@ -87,9 +87,9 @@ class HistoryProcessor:
             formatted_items: List[Tuple[str, str]] = []
 
             for song in recent_songs:
-                timestamp = format_timestamp_from_settings(song["played_at"])
+                timestamp = format_timestamp_from_settings(song["last_played"])
 
-                source = song["source"]
+                source = song["last_source"]
                 if source == "search":
                     source_display = " search"
                 elif source == "playlist":
@@ -99,11 +99,11 @@ class HistoryProcessor:
                 else:
                     source_display = source
 
-                play_count = song.get("play_count", 1)
+                play_count = song["total_plays"]
                 count_display = f" (played {play_count}×)" if play_count > 1 else ""
 
                 description = f"{timestamp} · {source_display}{count_display}"
-                formatted_items.append((song["song_name"], description))
+                formatted_items.append((song["song_id"], description))
 
             title = f"Your Listening history (Showing {len(recent_songs)} of {history_count})"
 
@@ -79,7 +79,7 @@ class PlaylistProcessor:
                 from aurras.core.player.online import SongStreamHandler
 
                 with logger.profile_context("playlist_stream"):
-                    SongStreamHandler(list(playlist_songs)).listen_song_online(
+                    SongStreamHandler(list(playlist_songs)).stream_songs_online(
                         show_lyrics=show_lyrics, shuffle=shuffle
                     )
 
@@ -6,13 +6,13 @@ cache management, disk usage, and system information.
 """
 
 import time
-import sqlite3
 from typing import Optional
 
 from aurras.utils.console import console
 from aurras.utils.logger import get_logger
 from aurras.utils.path_manager import _path_manager
 from aurras.utils.decorators import with_error_handling
+from aurras.utils.db_connection import DatabaseConnectionManager
 
 logger = get_logger("aurras.command.processors.system")
 
@@ -34,7 +34,8 @@ class SystemProcessor:
         """
         with logger.operation_context(operation="system_show_cache_info"):
             if _path_manager.cache_db.exists():
-                with sqlite3.connect(_path_manager.cache_db) as conn:
+                cache_db = DatabaseConnectionManager(_path_manager.cache_db)
+                with cache_db.reader() as conn:
                     cursor = conn.cursor()
                     cursor.execute("""
                     SELECT 
@@ -59,7 +60,29 @@ class SystemProcessor:
                     size = _path_manager.cache_db.stat().st_size
                     size_str = f"{size / 1024:.1f} KB"
 
+                    # Queries run by this session across every database
+                    db_stats = DatabaseConnectionManager.all_stats().values()
+                    queries = sum(stats["queries"] for stats in db_stats)
+                    query_ms = sum(stats["query_time_ms"] for stats in db_stats)
+                    lock_waits = sum(stats["lock_waits"] for stats in db_stats)
+                    lock_wait_ms = sum(stats["lock_wait_ms"] for stats in db_stats)
+
                     from aurras.utils.console.renderer import ListDisplay
+                    from aurras.core.player.audio_cache import AudioCache
+
+                    audio = AudioCache().stats()
+                    if audio.max_size:
+                        audio_str = (
+                            f"{audio.songs} songs, {audio.size / 1024**2:.1f} of "
+                            f"{audio.max_size / 1024**2:.0f} MB"
+                        )
+                    else:
+                        audio_str = "Disabled"
+                    plays = audio.hits + audio.misses
+                    audio_hits_str = (
+                        f"{audio.hits} of {plays} plays ({audio.hit_rate:.0%}), "
+                        f"{audio.evictions} evicted"
+                    )
 
                     info = ListDisplay(
                         items=[
@@ -67,6 +90,10 @@ class SystemProcessor:
                             ("Lyrics", str(lyrics_count)),
                             ("Size", size_str),
                             ("Oldest Entry", oldest_date),
+                            ("Queries", f"{queries} ({query_ms:.1f} ms)"),
+                            ("Lock Waits", f"{lock_waits} ({lock_wait_ms:.1f} ms)"),
+                            ("Audio Cache", audio_str),
+                            ("Audio Cache Hits", audio_hits_str),
                         ],
                         title="Cache Information",
                         description="Use 'cleanup_cache' to clean old cache entries",
@@ -80,6 +107,8 @@ class SystemProcessor:
                         lyrics_count=lyrics_count,
                         cache_size_kb=size / 1024,
                         oldest_date=oldest_date,
+                        queries=queries,
+                        lock_waits=lock_waits,
                     )
                     return 0
             else:
@@ -126,7 +155,8 @@ class SystemProcessor:
 
                 # Connect to the cache database
                 if _path_manager.cache_db.exists():
-                    with sqlite3.connect(_path_manager.cache_db) as conn:
+                    cache_db = DatabaseConnectionManager(_path_manager.cache_db)
+                    with cache_db as conn:
                         cursor = conn.cursor()
 
                         # Delete old searches
@@ -144,6 +174,11 @@ class SystemProcessor:
                         # Commit changes
                         conn.commit()
 
+                        # Rebuild the in-memory search index on next lookup
+                        from aurras.core.cache.index import song_search_index
+
+                        song_search_index.invalidate()
+
                         # Optimize database after deletions
                         cursor.execute("VACUUM")
                 else:
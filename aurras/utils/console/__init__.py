@@ -7,6 +7,7 @@ including components, formatters, and renderers.
 
 from aurras.utils.logger import get_logger
 from aurras.utils.console.manager import get_console, apply_gradient_to_text
+from aurras.utils.console.markup_cache import markup_cache
 
 logger = get_logger("aurras.utils.console", log_to_console=False)
 
@@ -16,4 +17,5 @@ logger.debug("Console initialized")
 __all__ = [
     "console",
     "apply_gradient_to_text",
+    "markup_cache",
 ]
@@ -12,6 +12,7 @@ from rich.table import Table
 from rich.console import Console
 
 from aurras.utils.logger import get_logger
+from aurras.utils.console.markup_cache import markup_cache
 from aurras.themes.adapters import theme_to_rich_theme
 from aurras.themes.manager import get_theme, get_current_theme, set_current_theme
 
@@ -191,19 +192,10 @@ class ThemedConsole(Console):
             Styled text string ready for Rich (always returned even if printed)
         """
         try:
-            # Special handling for 'dim' which is a string, not a ThemeColor
-            if style_key == "dim":
-                color = getattr(self.theme_obj, style_key)
-            else:
-                color = getattr(self.theme_obj, style_key).hex
-            style = f"{text_style} " if text_style else ""
-            styled_text = f"[{style}{color}]{text}[/]"
-
-            if print_it:
-                self.print(styled_text, **kwargs)
-
-            return styled_text
-
+            styled_text = markup_cache.get(
+                ("style", text, style_key, text_style, get_current_theme()),
+                lambda: self._style_markup(text, style_key, text_style),
+            )
         except AttributeError:
             logger.warning(f"Unknown style key '{style_key}', using default")
 
@@ -212,6 +204,21 @@ class ThemedConsole(Console):
 
             return text
 
+        if print_it:
+            self.print(styled_text, **kwargs)
+
+        return styled_text
+
+    def _style_markup(self, text: str, style_key: str, text_style: str) -> str:
+        """Build the markup of text in a theme color (see style_text)."""
+        # Special handling for 'dim' which is a string, not a ThemeColor
+        if style_key == "dim":
+            color = getattr(self.theme_obj, style_key)
+        else:
+            color = getattr(self.theme_obj, style_key).hex
+        style = f"{text_style} " if text_style else ""
+        return f"[{style}{color}]{text}[/]"
+
     # Rich component factory methods
     def create_table(
         self,
@@ -459,6 +466,8 @@ def change_theme(theme_name: str) -> bool:
     if success:
         # Update console with new theme
         _update_console_theme(theme_name)
+        # Markup styled with the old theme's colors is no longer shown
+        markup_cache.clear()
         return True
     return False
 
@@ -505,6 +514,14 @@ def apply_gradient_to_text(text: str, gradient: list, bold: bool = False) -> str
     if not text or not gradient:
         return text
 
+    return markup_cache.get(
+        ("gradient", text, tuple(gradient), bold, get_current_theme()),
+        lambda: _gradient_markup(text, gradient, bold),
+    )
+
+
+def _gradient_markup(text: str, gradient: list, bold: bool) -> str:
+    """Build the markup of a gradient (see apply_gradient_to_text)."""
     if len(text) <= 3:
         bold_prefix = "bold " if bold else ""
         return f"[{bold_prefix}{gradient[0]}]{text}[/{bold_prefix}{gradient[0]}]"
@@ -0,0 +1,102 @@
+"""
+Markup cache for themed console text.
+
+Styling text builds Rich markup from theme lookups, and gradients build one
+markup tag per character. The player display styles the same song names,
+labels and lyrics words over and over, so the results are memoized here,
+keyed by the current theme name and cleared when the theme changes.
+
+Example:
+    ```python
+    markup = markup_cache.get(("style", text, "primary", None, theme), build)
+    print(markup_cache.stats().hit_rate)
+    ```
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, NamedTuple
+
+DEFAULT_MAX_ENTRIES = 4096
+
+
+class MarkupCacheStats(NamedTuple):
+    """Size and hit counters of the markup cache."""
+
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class MarkupCache:
+    """
+    Bounded, least-recently-used cache of styled markup.
+
+    Attributes:
+        max_size: Maximum number of cached entries
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached entries
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        # The display, key bindings and mpv callbacks style text concurrently
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """
+        Get a cached value, building and caching it on a miss.
+
+        Args:
+            key: Hashable key that includes everything the value depends on
+            build: Function building the value
+
+        Returns:
+            The cached or newly built value
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return value
+
+        value = build()
+
+        with self._lock:
+            self._entries[key] = value
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry, e.g. after the theme changed."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> MarkupCacheStats:
+        """Get the size and hit counters of the cache."""
+        with self._lock:
+            return MarkupCacheStats(
+                len(self._entries), self.max_size, self._hits, self._misses
+            )
+
+
+markup_cache = MarkupCache()
@@ -24,6 +24,67 @@ class UIComponent(ABC):
         pass
 
 
+class RetainedComponent(UIComponent):
+    """
+    Base class for components that live across frames.
+
+    State is changed through update(), which only marks the component dirty
+    when a value actually changed. render() rebuilds the output of a dirty
+    component, parsing markup into a Text once, and otherwise returns the
+    output of the last build.
+    """
+
+    def __init__(self):
+        """Initialize the dirty flag and the memoized output."""
+        self._dirty = True
+        self._rendered: Any = None
+
+    @property
+    def dirty(self) -> bool:
+        """Whether the next render has to rebuild the output."""
+        return self._dirty
+
+    def update(self, **changes: Any) -> bool:
+        """
+        Apply a partial state update.
+
+        Args:
+            **changes: Attribute names and their new values
+
+        Returns:
+            True if any value changed
+        """
+        changed = False
+        for name, value in changes.items():
+            if getattr(self, name) != value:
+                setattr(self, name, value)
+                changed = True
+
+        if changed:
+            self._dirty = True
+        return changed
+
+    def invalidate(self) -> None:
+        """Force a rebuild on the next render (e.g. after a theme change)."""
+        self._dirty = True
+
+    def render(self) -> Any:
+        """Render the component, rebuilding it only if it's dirty."""
+        if self._dirty:
+            rendered = self.build()
+            # Parse markup once per build rather than on every redraw
+            if isinstance(rendered, str):
+                rendered = console.render_str(rendered)
+            self._rendered = rendered
+            self._dirty = False
+        return self._rendered
+
+    @abstractmethod
+    def build(self) -> Any:
+        """Build the Rich renderable for the current state."""
+        pass
+
+
 class UIRenderer:
     """Component-based UI renderer for the console."""
 
@@ -38,6 +99,7 @@ class UIRenderer:
         self._live = None
         self._running = False
         self._layout_func = None
+        self._auto_refresh = True
 
     def add_component(self, name: str, component: UIComponent) -> None:
         """
@@ -60,7 +122,10 @@ class UIRenderer:
             del self.components[name]
 
     def start_live_display(
-        self, refresh_per_second: float = 4.0, layout_func: Optional[Callable] = None
+        self,
+        refresh_per_second: float = 4.0,
+        layout_func: Optional[Callable] = None,
+        auto_refresh: bool = True,
     ) -> None:
         """
         Start a live-updating display.
@@ -68,6 +133,8 @@ class UIRenderer:
         Args:
             refresh_per_second: How many times per second to refresh the display
             layout_func: Optional function to create the layout
+            auto_refresh: Whether to redraw on a timer, rather than only when
+                refresh() is called
 
         Raises:
             DisplayError: If there's an issue with starting the live display
@@ -76,6 +143,7 @@ class UIRenderer:
             return
 
         self._layout_func = layout_func
+        self._auto_refresh = auto_refresh
 
         try:
             # Use the new console factory method
@@ -83,6 +151,7 @@ class UIRenderer:
                 self._generate_live_render(),
                 refresh_per_second=refresh_per_second,
                 transient=True,
+                auto_refresh=auto_refresh,
             )
 
             self._live.start()
@@ -187,7 +256,9 @@ class UIRenderer:
         """
         if self._live and self._running:
             try:
-                self._live.update(self._generate_live_render())
+                self._live.update(
+                    self._generate_live_render(), refresh=not self._auto_refresh
+                )
 
             except ThemeError as e:
                 logger.error(f"Theme error while refreshing display: {e}")
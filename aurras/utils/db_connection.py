@@ -3,22 +3,147 @@ Database Connection Module
 
 This module provides a generic database connection manager that can be used
 across the application to manage SQLite database connections.
+
+Every database runs in WAL mode with a single writer connection, guarded by a
+lock, and one read-only connection per thread (closed when the thread exits),
+so reads never wait on writes or on each other. Query counts, time spent and
+writer lock waits are recorded per database.
 """
 
+import time
+import weakref
 import sqlite3
 import threading
+import contextlib
 from pathlib import Path
+from typing import Any, Dict, Iterator
+
 from aurras.utils.logger import get_logger
 
 logger = get_logger("aurras.db_connection", log_to_console=False)
 
+# Applied to every connection when it is opened
+CONNECTION_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 64 * 1024 * 1024,
+    "cache_size": -8000,  # KiB
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,  # ms
+}
+
+# Number of prepared statements kept per connection
+STATEMENT_CACHE_SIZE = 256
+
+
+class QueryStats:
+    """
+    Thread-safe counters for the queries run against one database.
+    """
+
+    def __init__(self) -> None:
+        """Initialize all counters to zero."""
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all counters."""
+        with self._lock:
+            self.queries = 0
+            self.query_time = 0.0
+            self.lock_waits = 0
+            self.lock_wait_time = 0.0
+
+    def record_query(self, elapsed: float) -> None:
+        """Record a finished query and how long it took."""
+        with self._lock:
+            self.queries += 1
+            self.query_time += elapsed
+
+    def record_lock_wait(self, elapsed: float) -> None:
+        """Record a wait for the writer lock and how long it took."""
+        with self._lock:
+            self.lock_waits += 1
+            self.lock_wait_time += elapsed
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the current counters.
+
+        Returns:
+            Dictionary with queries, query_time_ms, lock_waits and lock_wait_ms
+        """
+        with self._lock:
+            return {
+                "queries": self.queries,
+                "query_time_ms": round(self.query_time * 1000, 2),
+                "lock_waits": self.lock_waits,
+                "lock_wait_ms": round(self.lock_wait_time * 1000, 2),
+            }
+
+
+class _TimedCursor(sqlite3.Cursor):
+    """Cursor that records each statement in its connection's QueryStats."""
+
+    def execute(self, sql, parameters=()):
+        started = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            self.connection.stats.record_query(time.perf_counter() - started)
+
+    def executemany(self, sql, seq_of_parameters):
+        started = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            self.connection.stats.record_query(time.perf_counter() - started)
+
+    def executescript(self, sql_script):
+        started = time.perf_counter()
+        try:
+            return super().executescript(sql_script)
+        finally:
+            self.connection.stats.record_query(time.perf_counter() - started)
+
+
+class _TimedConnection(sqlite3.Connection):
+    """Connection whose cursors record statements in a QueryStats."""
+
+    stats: QueryStats
+
+    def cursor(self, factory=_TimedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        return self.cursor().executescript(sql_script)
+
+
+class _ReadConnection:
+    """A thread's read-only connection, closed once the thread lets go of it."""
+
+    def __init__(self, connection: sqlite3.Connection, generation: int) -> None:
+        self.connection = connection
+        self.generation = generation
+        # Runs when the owning thread exits and its thread-local is cleared
+        weakref.finalize(self, connection.close)
+
 
 class DatabaseConnectionManager:
     """
     Generic database connection manager for SQLite databases.
 
-    This class implements a thread-safe singleton pattern with connection pooling
-    to ensure proper database access across different threads.
+    This class implements a thread-safe singleton pattern per database path.
+    Writes go through a single shared connection: entering the manager as a
+    context manager (or `writer()`) holds the writer lock until the block exits
+    and commits on success. Reads should use `reader()`, which hands each
+    thread its own read-only connection.
     """
 
     # Dictionary to store database path to instance mappings
@@ -43,34 +168,132 @@ class DatabaseConnectionManager:
             if path_str not in cls._instances:
                 instance = super(DatabaseConnectionManager, cls).__new__(cls)
                 instance.db_path = db_path
+                instance.stats = QueryStats()
                 instance._connection = None
                 instance._connection_lock = threading.RLock()
+                instance._local = threading.local()
+                # Read connections of live threads, so close() can reach them
+                instance._readers = weakref.WeakSet()
+                instance._readers_lock = threading.Lock()
+                instance._generation = 0
                 cls._instances[path_str] = instance
 
             return cls._instances[path_str]
 
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """
+        Open a tuned connection to the database.
+
+        Args:
+            read_only: Whether to reject writes on this connection
+
+        Returns:
+            sqlite3.Connection: SQLite database connection
+        """
+        # Use check_same_thread=False but manage thread safety with our locks
+        connection = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            factory=_TimedConnection,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        connection.stats = self.stats
+        connection.row_factory = sqlite3.Row
+
+        for pragma, value in CONNECTION_PRAGMAS.items():
+            connection.execute(f"PRAGMA {pragma} = {value}")
+        if read_only:
+            connection.execute("PRAGMA query_only = ON")
+
+        return connection
+
     def get_connection(self) -> sqlite3.Connection:
         """
-        Get or create a database connection in a thread-safe manner.
+        Get or create the shared writer connection in a thread-safe manner.
+
+        Prefer `with manager as conn` or `writer()`, which also hold the
+        writer lock while the connection is in use.
 
         Returns:
             sqlite3.Connection: SQLite database connection
         """
         with self._connection_lock:
             if self._connection is None:
-                # Use check_same_thread=False but manage thread safety with our locks
-                self._connection = sqlite3.connect(
-                    self.db_path, check_same_thread=False
-                )
-                self._connection.row_factory = sqlite3.Row
+                self._connection = self._connect()
                 logger.debug(f"Created new database connection to {self.db_path}")
             return self._connection
 
+    def _acquire_writer(self) -> None:
+        """Take the writer lock, recording the wait if another thread holds it."""
+        if self._connection_lock.acquire(blocking=False):
+            return
+
+        started = time.perf_counter()
+        self._connection_lock.acquire()
+        self.stats.record_lock_wait(time.perf_counter() - started)
+
+    @contextlib.contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """
+        Use the writer connection exclusively, committing when the block succeeds.
+
+        Yields:
+            sqlite3.Connection: The shared writer connection
+        """
+        with self as connection:
+            yield connection
+
+    @contextlib.contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """
+        Use this thread's read-only connection.
+
+        In WAL mode reads see the last committed state and never wait for the
+        writer, so no lock is taken.
+
+        Yields:
+            sqlite3.Connection: Read-only connection owned by the calling thread
+        """
+        reader = getattr(self._local, "reader", None)
+
+        if reader is None or reader.generation != self._generation:
+            reader = _ReadConnection(self._connect(read_only=True), self._generation)
+            self._local.reader = reader
+            with self._readers_lock:
+                self._readers.add(reader)
+            logger.debug(
+                f"Created read connection to {self.db_path} "
+                f"for {threading.current_thread().name}"
+            )
+        connection = reader.connection
+
+        try:
+            yield connection
+        finally:
+            # Don't hold a read snapshot open between uses
+            if connection.in_transaction:
+                connection.rollback()
+
+    def checkpoint(self) -> None:
+        """
+        Copy the write-ahead log into the main database file.
+
+        Call this before copying the database file, e.g. for backups.
+        """
+        with self as connection:
+            connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
     def close(self) -> None:
         """
-        Close the database connection.
+        Close the writer connection and every thread's read connection.
         """
         with self._connection_lock:
+            with self._readers_lock:
+                for reader in list(self._readers):
+                    reader.connection.close()
+                self._readers.clear()
+                self._generation += 1
+
             if self._connection:
                 self._connection.close()
                 logger.debug(f"Closed database connection to {self.db_path}")
@@ -88,12 +311,17 @@ class DatabaseConnectionManager:
 
     def __enter__(self) -> sqlite3.Connection:
         """
-        Context manager entry point.
+        Context manager entry point. Holds the writer lock until exit.
 
         Returns:
             sqlite3.Connection: SQLite database connection
         """
-        return self.get_connection()
+        self._acquire_writer()
+        try:
+            return self.get_connection()
+        except Exception:
+            self._connection_lock.release()
+            raise
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """
@@ -103,7 +331,70 @@ class DatabaseConnectionManager:
         be used elsewhere. Call close() explicitly when shutting down the application.
         """
         # We intentionally don't close the connection here to keep the singleton alive
-        # Just commit any pending transactions if no exception occurred
-        with self._connection_lock:
+        # Commit pending transactions on success, roll them back on error so
+        # the next writer doesn't commit them
+        try:
             if self._connection and not exc_type:
                 self._connection.commit()
+            elif self._connection:
+                self._connection.rollback()
+        finally:
+            self._connection_lock.release()
+
+    @classmethod
+    def all_stats(cls) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the query statistics of every open database.
+
+        Returns:
+            Dictionary with database file name as key and its stats as value
+        """
+        with cls._instance_lock:
+            instances = list(cls._instances.values())
+
+        return {Path(db.db_path).name: db.stats.snapshot() for db in instances}
+
+    @classmethod
+    def checkpoint_all(cls) -> None:
+        """Checkpoint every open database."""
+        with cls._instance_lock:
+            instances = list(cls._instances.values())
+
+        for db in instances:
+            try:
+                db.checkpoint()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to checkpoint {db.db_path}: {e}")
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close the connections of every database, e.g. before replacing files."""
+        with cls._instance_lock:
+            instances = list(cls._instances.values())
+
+        for db in instances:
+            db.close()
+
+
+def ensure_column(
+    connection: sqlite3.Connection, table: str, column: str, definition: str
+) -> bool:
+    """
+    Add a column to an existing table if it isn't there yet.
+
+    Args:
+        connection: SQLite database connection
+        table: Name of the table to alter
+        column: Name of the column to add
+        definition: Column type and constraints, e.g. "TEXT DEFAULT ''"
+
+    Returns:
+        True if the column was added, False if it already existed
+    """
+    existing = {row[1] for row in connection.execute(f"PRAGMA table_info({table})")}
+    if column in existing:
+        return False
+
+    connection.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+    logger.info(f"Added column {table}.{column}")
+    return True
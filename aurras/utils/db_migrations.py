@@ -0,0 +1,96 @@
+"""
+Database Migration Module
+
+This module provides a small versioned migration runner for the SQLite
+databases. Each database stores the version of the last migration applied in
+its `user_version` pragma; on startup only the migrations with a higher
+version are applied, in order, each in its own transaction. The transaction is
+opened explicitly, so schema changes are rolled back with the rest of a failed
+migration.
+
+Example:
+    ```python
+    MIGRATIONS = [
+        Migration(1, "Index play history by time", _add_history_indexes),
+    ]
+    run_migrations(DatabaseConnectionManager(path), MIGRATIONS)
+    ```
+"""
+
+import sqlite3
+from typing import Callable, List, NamedTuple
+
+from aurras.utils.logger import get_logger
+from aurras.utils.db_connection import DatabaseConnectionManager
+
+logger = get_logger("aurras.db_migrations", log_to_console=False)
+
+
+class Migration(NamedTuple):
+    """A single schema change, applied once per database."""
+
+    version: int
+    description: str
+    apply: Callable[[sqlite3.Connection], None]
+
+
+def get_schema_version(connection: sqlite3.Connection) -> int:
+    """
+    Get the schema version stored in the database header.
+
+    Args:
+        connection: SQLite database connection
+
+    Returns:
+        The version of the last migration applied, 0 for a new database
+    """
+    return connection.execute("PRAGMA user_version").fetchone()[0]
+
+
+def run_migrations(db: DatabaseConnectionManager, migrations: List[Migration]) -> int:
+    """
+    Apply every migration newer than the database's schema version.
+
+    Migrations run under the writer lock. A failing migration is rolled back
+    and stops the run, so it is retried on the next start. Migrations that
+    commit steps of their own (e.g. across database files) are only rolled
+    back after their last commit, so they must be safe to rerun.
+
+    Args:
+        db: Connection manager of the database to migrate
+        migrations: Migrations for this database
+
+    Returns:
+        The schema version of the database after the run
+    """
+    with db as connection:
+        # Don't let a migration's rollback undo writes made before the run
+        connection.commit()
+        version = get_schema_version(connection)
+
+        for migration in sorted(migrations, key=lambda m: m.version):
+            if migration.version <= version:
+                continue
+
+            logger.info(
+                f"Migrating {db.db_path} to version {migration.version}: "
+                f"{migration.description}"
+            )
+            try:
+                # The sqlite3 module doesn't open a transaction before DDL
+                connection.execute("BEGIN")
+                migration.apply(connection)
+                connection.execute(f"PRAGMA user_version = {migration.version}")
+                connection.commit()
+            except Exception as e:
+                # Migrations may also read files and other databases
+                connection.rollback()
+                logger.error(
+                    f"Migration {migration.version} of {db.db_path} failed: {e}",
+                    exc_info=True,
+                )
+                break
+
+            version = migration.version
+
+    return version
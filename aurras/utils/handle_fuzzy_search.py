@@ -1,6 +1,7 @@
 import re
 from functools import lru_cache
-from typing import List, Optional
+from collections import Counter
+from typing import Dict, List, Optional, Set
 from difflib import SequenceMatcher
 from aurras.utils.logger import get_logger
 
@@ -299,6 +300,205 @@ class FuzzySearcher:
         return cls(**kwargs)
 
 
+class TrigramIndex:
+    """
+    Inverted n-gram index for fast fuzzy lookups over a large set of names.
+
+    Names are normalized with the same rules as FuzzySearcher and split into
+    padded character n-grams. A query only touches the posting lists of its own
+    n-grams, and only the top-k candidates are rescored with
+    FuzzySearcher.similarity, so lookups no longer scale with the number of
+    indexed names.
+    """
+
+    def __init__(
+        self,
+        searcher: Optional[FuzzySearcher] = None,
+        n: int = 3,
+        candidate_limit: int = 32,
+    ):
+        """
+        Initialize an empty index.
+
+        Args:
+            searcher (FuzzySearcher): Searcher used for normalization and rescoring
+            n (int): Size of the character n-grams
+            candidate_limit (int): Number of candidates rescored per query
+        """
+        self.searcher = searcher or FuzzySearcher()
+        self.n = n
+        self.candidate_limit = candidate_limit
+
+        self._postings: Dict[str, Set[str]] = {}
+        self._key_grams: Dict[str, Set[str]] = {}
+        self._exact: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed names."""
+        return len(self._key_grams)
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a name is indexed."""
+        return key in self._key_grams
+
+    def _grams(self, normalized: str) -> Set[str]:
+        """
+        Split normalized text into padded n-grams.
+
+        Args:
+            normalized (str): Text already passed through the normalizer
+
+        Returns:
+            set: Unique n-grams of the text
+        """
+        if not normalized:
+            return set()
+
+        padded = f"{' ' * (self.n - 1)}{normalized} "
+        return {padded[i : i + self.n] for i in range(len(padded) - self.n + 1)}
+
+    def add(self, key: str) -> None:
+        """
+        Add a name to the index. Re-adding an indexed name is a no-op.
+
+        Args:
+            key (str): Name to index
+        """
+        if not key or key in self._key_grams:
+            return
+
+        normalized = self.searcher._normalize(key)
+        grams = self._grams(normalized)
+
+        self._key_grams[key] = grams
+        self._exact.setdefault(normalized, key)
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(key)
+
+    def update(self, keys) -> None:
+        """
+        Add several names to the index.
+
+        Args:
+            keys (iterable): Names to index
+        """
+        for key in keys:
+            self.add(key)
+
+    def remove(self, key: str) -> None:
+        """
+        Remove a name from the index.
+
+        Args:
+            key (str): Name to remove
+        """
+        grams = self._key_grams.pop(key, None)
+        if grams is None:
+            return
+
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del self._postings[gram]
+
+        normalized = self.searcher._normalize(key)
+        if self._exact.get(normalized) == key:
+            del self._exact[normalized]
+
+    def clear(self) -> None:
+        """Remove every name from the index."""
+        self._postings.clear()
+        self._key_grams.clear()
+        self._exact.clear()
+
+    def candidates(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Get the indexed names sharing the most n-grams with the query.
+
+        Candidates are ranked by the better of their Dice coefficient and their
+        coverage of the query's n-grams, so substring matches rank high too.
+
+        Args:
+            query (str): User search query
+            limit (int): Maximum number of candidates, defaults to candidate_limit
+
+        Returns:
+            list: Candidate names, best first
+        """
+        query_grams = self._grams(self.searcher._normalize(query))
+        if not query_grams:
+            return []
+
+        shared = Counter()
+        for gram in query_grams:
+            posting = self._postings.get(gram)
+            if posting:
+                shared.update(posting)
+
+        if not shared:
+            return []
+
+        query_size = len(query_grams)
+
+        def rank(key: str) -> float:
+            count = shared[key]
+            dice = 2 * count / (query_size + len(self._key_grams[key]))
+            return max(dice, count / query_size)
+
+        limit = limit or self.candidate_limit
+        return sorted(shared, key=rank, reverse=True)[:limit]
+
+    def find_best_match(
+        self, query: str, threshold: Optional[float] = None
+    ) -> Optional[str]:
+        """
+        Find the single best indexed match for a query.
+
+        Args:
+            query (str): User search query
+            threshold (float): Minimum similarity, defaults to the searcher's threshold
+
+        Returns:
+            str: The best matching name, or None if no match clears the threshold
+        """
+        match, _ = self.find_best_match_with_score(query, threshold)
+        return match
+
+    def find_best_match_with_score(self, query: str, threshold: Optional[float] = None):
+        """
+        Find the single best indexed match for a query and return it with its score.
+
+        Args:
+            query (str): User search query
+            threshold (float): Minimum similarity, defaults to the searcher's threshold
+
+        Returns:
+            tuple: (best_matching_name, score) or (None, 0) if no match found
+        """
+        if threshold is None:
+            threshold = self.searcher.threshold
+
+        exact = self._exact.get(self.searcher._normalize(query))
+        if exact is not None:
+            return exact, 1.0
+
+        best_match = None
+        best_score = 0
+
+        for key in self.candidates(query):
+            score = self.searcher.similarity(query, key)
+            if score > best_score:
+                best_score = score
+                best_match = key
+
+        if best_match is not None and best_score >= threshold:
+            return best_match, best_score
+
+        return None, 0
+
+
 class FuzzyDictMatcher:
     """
     A specialized dictionary matcher optimized for Aurras music database operations.
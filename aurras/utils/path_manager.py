@@ -27,6 +27,7 @@ class PathManager:
         self._downloaded_songs_dir = self.app_dir / "songs"
         self._playlists_dir = self.app_dir / "playlists"
         self._log_dir = self.app_dir / "logs"
+        self._audio_cache_dir = self.app_dir / "audio_cache"
         self._backups_storage_dir = Path("backups")
         self._backup_metadata_dir = Path("metadata")
         self._backup_logs_dir = self._backup_metadata_dir / "logs"
@@ -98,6 +99,11 @@ class PathManager:
         """Path to the log directory."""
         return self._log_dir
 
+    @property
+    def audio_cache_dir(self):
+        """Path to the cache of streamed songs (created when first written)."""
+        return self._audio_cache_dir
+
     @property
     def log_file(self):
         """Path to the current log file."""
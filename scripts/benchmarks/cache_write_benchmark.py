@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Measure search-cache write throughput in rows per second.
+
+Saves the same batch of songs to a throwaway cache database twice: once the
+way downloads and searches used to (one transaction per song, after a scan of
+the whole cache for duplicates) and once with the bulk upsert of
+UpdateSearchHistoryDatabase.save_many_to_cache.
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+from typing import Dict, List
+
+# The databases live under ~/.aurras, so point HOME at a scratch directory
+# before anything from aurras is imported
+SCRATCH_HOME = tempfile.mkdtemp(prefix="aurras-cache-bench-")
+os.environ["HOME"] = SCRATCH_HOME
+
+from aurras.core.cache import cache_db_connection  # noqa: E402
+from aurras.core.cache.search_db import SearchFromSongDataBase  # noqa: E402
+from aurras.core.cache.updater import UpdateSearchHistoryDatabase  # noqa: E402
+
+
+def make_songs(count: int, offset: int) -> List[Dict]:
+    """Build synthetic search results with distinct YouTube URLs."""
+    return [
+        {
+            "song_user_searched": f"query {i}",
+            "track_name": f"song {i}",
+            "url": f"https://www.youtube.com/watch?v={i:011d}",
+            "artist_name": f"artist {i % 100}",
+            "album_name": f"album {i % 300}",
+            "thumbnail_url": "",
+            "duration": 200,
+        }
+        for i in range(offset, offset + count)
+    ]
+
+
+def save_per_row(updater: UpdateSearchHistoryDatabase, songs: List[Dict]) -> None:
+    """The old path: dedup scan in Python, then one commit per song."""
+    existing = SearchFromSongDataBase().initialize_full_song_dict()
+    urls = {song.get("url") for song in existing.values()}
+
+    for song in songs:
+        if song["url"] in urls:
+            continue
+
+        with cache_db_connection as conn:
+            cursor = conn.cursor()
+            track_id = updater.track_registry.register(
+                song["url"], song["track_name"], song["artist_name"], cursor=cursor
+            )
+            cursor.execute(
+                """
+                INSERT INTO cache
+                (song_user_searched, track_name, url, artist_name, album_name,
+                 thumbnail_url, duration, fetch_time, track_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (*song.values(), int(time.time()), track_id),
+            )
+
+
+def rows_per_second(func, songs: List[Dict]) -> float:
+    """Run a save function and return its throughput."""
+    start = time.perf_counter()
+    func(songs)
+    return len(songs) / (time.perf_counter() - start)
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--existing", type=int, default=5000)
+    args = parser.parse_args()
+
+    try:
+        updater = UpdateSearchHistoryDatabase()
+        updater.save_many_to_cache(make_songs(args.existing, 0))
+
+        offset = args.existing
+        before = rows_per_second(
+            lambda songs: save_per_row(updater, songs), make_songs(args.rows, offset)
+        )
+        offset += args.rows
+        after = rows_per_second(
+            lambda songs: updater.save_many_to_cache(songs, update_existing=False),
+            make_songs(args.rows, offset),
+        )
+
+        print(f"{args.rows} new songs into a cache of {args.existing}")
+        print(f"per-row commits: {before:,.0f} rows/s")
+        print(f"bulk upsert:     {after:,.0f} rows/s ({after / before:.1f}x)")
+        return 0
+    finally:
+        shutil.rmtree(SCRATCH_HOME, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
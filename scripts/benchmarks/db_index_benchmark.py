@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Check that the hot database queries are served by indexes.
+
+Builds throwaway databases with the real schema and migrations, fills them
+with synthetic rows, prints the query plan of each hot query and compares its
+timing against a copy of the same databases with the migration indexes
+dropped. Exits non-zero if any query plan falls back to a full table scan.
+"""
+
+import os
+import sys
+import time
+import shutil
+import sqlite3
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# The databases live under ~/.aurras, so point HOME at a scratch directory
+# before anything from aurras is imported
+SCRATCH_HOME = tempfile.mkdtemp(prefix="aurras-db-bench-")
+os.environ["HOME"] = SCRATCH_HOME
+
+from aurras.utils.path_manager import _path_manager  # noqa: E402
+from aurras.core.cache import cache_db_connection  # noqa: E402
+from aurras.core.downloader import DownloadsDatabase  # noqa: E402
+from aurras.core.player.history import (  # noqa: E402
+    RecentlyPlayedManager,
+    _add_play_stats,
+)
+from aurras.utils.db_connection import DatabaseConnectionManager  # noqa: E402
+
+# (name, database, indexed query, query the code used before, parameters)
+HOT_QUERIES: List[Tuple[str, str, str, str, tuple]] = [
+    (
+        "recent history",
+        "history",
+        "SELECT id, song_name FROM play_history ORDER BY played_at DESC LIMIT 30",
+        "SELECT id, song_name FROM play_history ORDER BY played_at DESC LIMIT 30",
+        (),
+    ),
+    (
+        "previous song",
+        "history",
+        "SELECT song_name FROM play_history ORDER BY played_at DESC LIMIT 1 OFFSET 5",
+        "SELECT song_name FROM play_history ORDER BY played_at DESC LIMIT 1 OFFSET 5",
+        (),
+    ),
+    (
+        "plays of a song",
+        "history",
+        "SELECT total_plays FROM play_stats WHERE song_id = ?",
+        "SELECT SUM(play_count) FROM play_history WHERE song_name = ?",
+        ("song 4242",),
+    ),
+    (
+        "lyrics exact",
+        "cache",
+        """SELECT l.synced_lyrics FROM cache c JOIN lyrics l ON c.id = l.cache_id
+        WHERE c.track_name = ? AND c.artist_name = ?
+        ORDER BY l.fetch_time DESC LIMIT 1""",
+        """SELECT l.synced_lyrics FROM cache c JOIN lyrics l ON c.id = l.cache_id
+        WHERE c.track_name = ? AND c.artist_name = ?
+        ORDER BY l.fetch_time DESC LIMIT 1""",
+        ("song 4242", "artist 42"),
+    ),
+    (
+        "lyrics substring",
+        "cache",
+        """SELECT l.synced_lyrics FROM cache_fts f JOIN lyrics l ON l.cache_id = f.rowid
+        WHERE cache_fts MATCH 'track_name : "ng 424"'
+        ORDER BY l.fetch_time DESC LIMIT 1""",
+        """SELECT l.synced_lyrics FROM cache c JOIN lyrics l ON c.id = l.cache_id
+        WHERE c.track_name LIKE '%ng 424%'
+        ORDER BY l.fetch_time DESC LIMIT 1""",
+        (),
+    ),
+    (
+        "newest downloads",
+        "downloads",
+        "SELECT id, track_name FROM downloaded_songs "
+        "ORDER BY download_date DESC, id DESC LIMIT 50",
+        "SELECT id, track_name FROM downloaded_songs "
+        "ORDER BY download_date DESC, id DESC LIMIT 50",
+        (),
+    ),
+]
+
+
+def populate(rows: int) -> Dict[str, Path]:
+    """Create the schema through the real initializers and fill it."""
+    RecentlyPlayedManager()
+    DownloadsDatabase()
+
+    now = int(time.time())
+    with cache_db_connection as conn:
+        conn.executemany(
+            "INSERT INTO cache (song_user_searched, track_name, url, artist_name, "
+            "fetch_time) VALUES (?, ?, ?, ?, ?)",
+            [
+                (f"song {i}", f"song {i}", f"url {i}", f"artist {i % 100}", now - i)
+                for i in range(rows)
+            ],
+        )
+        conn.executemany(
+            "INSERT INTO lyrics (cache_id, synced_lyrics, fetch_time) VALUES (?, ?, ?)",
+            [(i + 1, f"lyrics {i}", now - i) for i in range(rows)],
+        )
+
+    with DatabaseConnectionManager(_path_manager.history_db) as conn:
+        conn.executemany(
+            "INSERT INTO play_history (song_name, played_at) VALUES (?, ?)",
+            [(f"song {i % (rows // 4)}", now - i) for i in range(rows)],
+        )
+        _add_play_stats(conn)
+
+    with DatabaseConnectionManager(_path_manager.downloads_db) as conn:
+        conn.executemany(
+            "INSERT INTO downloaded_songs (track_name, artist_name, album_name, "
+            "download_date) VALUES (?, ?, ?, ?)",
+            [(f"song {i}", "artist", f"album {i}", now - i % 500) for i in range(rows)],
+        )
+
+    DatabaseConnectionManager.close_all()
+    return {
+        "cache": _path_manager.cache_db,
+        "history": _path_manager.history_db,
+        "downloads": _path_manager.downloads_db,
+    }
+
+
+def make_baseline(paths: Dict[str, Path], target: Path) -> Dict[str, Path]:
+    """Copy the databases and drop every migration-added index from the copies."""
+    baseline = {}
+    target.mkdir(parents=True, exist_ok=True)
+
+    for name, path in paths.items():
+        copy = target / path.name
+        shutil.copy(path, copy)
+        conn = sqlite3.connect(copy)
+        indexes = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+        ).fetchall()
+        for (index,) in indexes:
+            conn.execute(f"DROP INDEX {index}")
+        conn.commit()
+        conn.close()
+        baseline[name] = copy
+
+    return baseline
+
+
+def time_query(path: Path, sql: str, params: tuple, repeat: int) -> float:
+    """Average time of a query in milliseconds."""
+    conn = sqlite3.connect(path)
+    conn.execute(sql, params).fetchall()  # warm the page cache
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        conn.execute(sql, params).fetchall()
+    elapsed = (time.perf_counter() - start) / repeat
+    conn.close()
+    return elapsed * 1000
+
+
+def query_plan(path: Path, sql: str, params: tuple) -> List[str]:
+    """Get the EXPLAIN QUERY PLAN lines of a query."""
+    conn = sqlite3.connect(path)
+    plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+    conn.close()
+    return plan
+
+
+def uses_index(plan: List[str]) -> bool:
+    """Whether every table access in a plan goes through an index."""
+    for step in plan:
+        if step.startswith("SCAN") and "INDEX" not in step and "VIRTUAL" not in step:
+            return False
+    return True
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    try:
+        paths = populate(args.rows)
+        baseline = make_baseline(paths, Path(SCRATCH_HOME) / "baseline")
+
+        print(f"{args.rows} rows per table, {args.repeat} runs per query\n")
+        failures = 0
+
+        for name, database, sql, old_sql, params in HOT_QUERIES:
+            plan = query_plan(paths[database], sql, params)
+            indexed = time_query(paths[database], sql, params, args.repeat)
+            scanned = time_query(baseline[database], old_sql, params, args.repeat)
+            ok = uses_index(plan)
+            failures += not ok
+
+            print(f"{name}: {indexed:.3f} ms indexed, {scanned:.3f} ms without")
+            for step in plan:
+                print(f"    {step}")
+            if not ok:
+                print("    !! full table scan")
+
+        return 1 if failures else 0
+    finally:
+        shutil.rmtree(SCRATCH_HOME, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
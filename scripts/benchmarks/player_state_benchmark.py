@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Measure player-state frames per second of CPU time.
+
+Plays a generated tone in a headless mpv and builds the state the display
+reads every frame in two ways: by reading time-pos, duration, pause and volume
+from libmpv, as the display loop used to, and from the snapshot of the
+PropertyMirror, which is fed by property observers.
+"""
+
+import sys
+import time
+import argparse
+from typing import Callable, Dict
+
+from aurras.core.player.python_mpv import MPV
+from aurras.core.player.mpv.snapshot import PropertyMirror
+
+
+def frame_from_properties(player: MPV) -> Dict:
+    """Build one frame's state with synchronous property reads."""
+    return {
+        "elapsed": player.time_pos or 0,
+        "duration": player.duration or 0,
+        "paused": player.pause,
+        "volume": player.volume,
+    }
+
+
+def frame_from_snapshot(mirror: PropertyMirror) -> Dict:
+    """Build one frame's state from the observed-property snapshot."""
+    snapshot = mirror.snapshot
+    return {
+        "elapsed": snapshot.time_pos,
+        "duration": snapshot.duration,
+        "paused": snapshot.pause,
+        "volume": snapshot.volume,
+    }
+
+
+def measure(frame: Callable[[], Dict], frames: int) -> Dict[str, float]:
+    """Build frames and time them in process CPU time and wall time."""
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    for _ in range(frames):
+        frame()
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    return {"cpu": cpu, "wall": wall, "fps": frames / cpu if cpu else float("inf")}
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=20000)
+    parser.add_argument(
+        "--source",
+        default="av://lavfi:sine=frequency=440:duration=3600",
+        help="File or URL to play while measuring",
+    )
+    args = parser.parse_args()
+
+    player = MPV(video=False, ao="null")
+    mirror = PropertyMirror()
+    observers = mirror.observe(player)
+
+    try:
+        player.play(args.source)
+        player.wait_until_playing(timeout=10)
+        # Let the observers deliver the initial values
+        deadline = time.monotonic() + 5
+        while not mirror.snapshot.duration and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        direct = measure(lambda: frame_from_properties(player), args.frames)
+        mirrored = measure(lambda: frame_from_snapshot(mirror), args.frames)
+    finally:
+        for observer in observers:
+            observer.unregister()
+        player.terminate()
+
+    print(f"{args.frames} frames, snapshot version {mirror.version}")
+    for label, result in (("properties", direct), ("snapshot", mirrored)):
+        print(
+            f"{label + ':':<12} {result['fps']:>12,.0f} frames per CPU second "
+            f"({result['cpu']:.3f}s CPU, {result['wall']:.3f}s wall)"
+        )
+    print(f"speedup: {mirrored['fps'] / direct['fps']:.1f}x")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Measure queue rendering cost for very large playlists.
+
+Walks the playing position through a synthetic queue and times what the queue
+views do per frame and per refresh: the old way (slicing the rest of the queue
+to show the next songs, and building a TUI option for every song) against the
+QueueWindow view model (a window after the position, and one page of options
+built when the panel refreshes).
+"""
+
+import sys
+import time
+import argparse
+import tracemalloc
+from typing import Callable, Dict, List
+
+from aurras.core.player.queue_window import QueueWindow
+
+PAGE_SIZE = 100  # As in the TUI queue panel
+
+
+def old_upcoming(songs: List[str], position: int) -> tuple:
+    """Upcoming songs the way QueueDisplay used to get them."""
+    return tuple(songs[position + 1 :][:2])
+
+
+def old_options(songs: List[str]) -> list:
+    """Queue panel options the way QueuePanel used to build them."""
+    return [(song, f"queue_{i}") for i, song in enumerate(songs)]
+
+
+def new_options(window: QueueWindow, songs: List[str]) -> list:
+    """Queue panel options of the first page."""
+    window.reset(songs)
+    return [(song, f"queue_{i}") for i, song in window.page(0, PAGE_SIZE)]
+
+
+def measure(run: Callable[[], object], repeat: int) -> Dict[str, float]:
+    """Time a function and measure the memory it allocates at its peak."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        run()
+    elapsed = (time.perf_counter() - start) / repeat
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"time": elapsed, "peak": peak}
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--songs", type=int, default=10000)
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--refreshes", type=int, default=50)
+    args = parser.parse_args()
+
+    songs = [f"Artist {i % 500} - Song number {i}" for i in range(args.songs)]
+    step = max(1, len(songs) // args.frames)
+    positions = range(0, len(songs), step)
+
+    def old_frames():
+        for position in positions:
+            old_upcoming(songs, position)
+
+    window = QueueWindow(songs, after=2)
+
+    def new_frames():
+        for position in positions:
+            if window.move(position):
+                window.upcoming()
+
+    results = {
+        "display, old": measure(old_frames, 1),
+        "display, window": measure(new_frames, 1),
+        "panel, old": measure(lambda: old_options(songs), args.refreshes),
+        "panel, window": measure(
+            lambda: new_options(QueueWindow(), songs), args.refreshes
+        ),
+    }
+
+    print(f"{args.songs} songs, {len(positions)} display frames")
+    for label, result in results.items():
+        per = result["time"]
+        if label.startswith("display"):
+            per /= len(positions)
+        print(
+            f"{label + ':':<17} {per * 1e6:>10.2f} µs per "
+            f"{'frame' if label.startswith('display') else 'refresh'}, "
+            f"peak {result['peak'] / 1024:>8.1f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Measure time-to-first-track for playlist resolution.
+
+Runs the TrackResolver against a fake search provider with a fixed per-lookup
+latency, so the numbers can be reproduced offline, and compares it with
+resolving every track serially before playback starts.
+"""
+
+import sys
+import time
+import argparse
+from typing import Dict, List
+
+from aurras.services.youtube.search import SongResult
+from aurras.services.youtube.resolver import TrackResolver
+
+
+class FakeSearchProvider:
+    """Search provider that sleeps instead of calling YouTube."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def search(self, queries: List[str]) -> List[SongResult]:
+        time.sleep(self.latency * len(queries))
+        return [
+            SongResult(query, f"https://www.youtube.com/watch?v={abs(hash(query))}")
+            for query in queries
+        ]
+
+
+class NullCacheProvider:
+    """Cache provider that never hits and never stores anything."""
+
+    def get_songs(self, queries: List[str]) -> Dict[str, SongResult]:
+        return {}
+
+    def save_songs(self, query_to_song: Dict[str, SongResult]) -> None:
+        pass
+
+    def get_recent_songs(self, limit: int = 30) -> List[SongResult]:
+        return []
+
+
+def measure_serial(tracks: List[str], latency: float) -> Dict[str, float]:
+    """Resolve every track one by one, as the old playback path did."""
+    provider = FakeSearchProvider(latency)
+    start = time.perf_counter()
+    for track in tracks:
+        provider.search([track])
+    total = time.perf_counter() - start
+    return {"first": total, "total": total}
+
+
+def measure_resolver(
+    tracks: List[str], latency: float, workers: int
+) -> Dict[str, float]:
+    """Resolve tracks with the TrackResolver and time the first and last result."""
+    resolver = TrackResolver(
+        search_provider=FakeSearchProvider(latency),
+        cache_provider=NullCacheProvider(),
+        max_workers=workers,
+    )
+    start = time.perf_counter()
+    first = None
+    for _ in resolver.resolve(tracks):
+        if first is None:
+            first = time.perf_counter() - start
+    total = time.perf_counter() - start
+    return {"first": first or total, "total": total}
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tracks", type=int, default=300)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    tracks = [f"track {i}" for i in range(args.tracks)]
+
+    serial = measure_serial(tracks, args.latency)
+    pooled = measure_resolver(tracks, args.latency, args.workers)
+
+    print(f"{args.tracks} tracks, {args.latency * 1000:.0f} ms per lookup")
+    print(f"serial:   first track {serial['first']:.3f}s, all {serial['total']:.3f}s")
+    print(
+        f"resolver: first track {pooled['first']:.3f}s, all {pooled['total']:.3f}s "
+        f"({args.workers} workers)"
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+Tests for relinking moved downloads during a library scan.
+
+The application directory is redirected to a temporary home, and the aurras
+modules are imported afresh so their databases are created there.
+"""
+
+import sys
+import importlib
+
+import pytest
+
+AUDIO = b"ID3" + bytes(range(256)) * 64
+
+
+@pytest.fixture
+def aurras_home(tmp_path, monkeypatch):
+    """A temporary home holding the application's databases."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    for name in list(sys.modules):
+        if name == "aurras" or name.startswith("aurras."):
+            monkeypatch.delitem(sys.modules, name)
+    return tmp_path
+
+
+@pytest.fixture
+def library(aurras_home):
+    """A download library over empty songs and playlists directories."""
+    module = importlib.import_module("aurras.core.library")
+    songs_dir = aurras_home / "songs"
+    playlists_dir = aurras_home / "playlists"
+    songs_dir.mkdir()
+    playlists_dir.mkdir()
+    return module.DownloadLibrary(songs_dir, playlists_dir)
+
+
+def save_download(path, album):
+    """Save a download of the file, and cache it for search under its path."""
+    from aurras.core.downloader import DownloadsDatabase
+    from aurras.core.cache.updater import UpdateSearchHistoryDatabase
+
+    downloads = DownloadsDatabase()
+    song = {"name": "Song", "artists": "Artist", "album_name": album}
+    rows = downloads._flush_data_in_batch([{**song, "file_path": str(path)}])
+    assert downloads.save_downloaded_song(rows) == 1
+    UpdateSearchHistoryDatabase().save_to_cache("song", "Song", str(path), "Artist")
+
+
+def cached_urls():
+    from aurras.core.cache import cache_db_connection
+
+    with cache_db_connection.reader() as conn:
+        return sorted(row[0] for row in conn.execute("SELECT url FROM cache"))
+
+
+def download_paths(library):
+    with library.db_conn.reader() as conn:
+        rows = conn.execute("SELECT album_name, file_path FROM downloaded_songs")
+        return dict(rows.fetchall())
+
+
+def test_deleted_single_isnt_relinked_to_its_playlist_copy(library):
+    single = library.songs_dir / "Song.mp3"
+    copy = library.playlists_dir / "Mix" / "Song.mp3"
+    copy.parent.mkdir()
+    single.write_bytes(AUDIO)
+    copy.write_bytes(AUDIO)
+    save_download(single, "")
+    save_download(copy, "Mix")
+    library.scan()
+
+    single.unlink()
+    result = library.scan()
+
+    assert result.moved == 0
+    assert download_paths(library) == {"": str(single), "Mix": str(copy)}
+    assert cached_urls() == sorted([str(single), str(copy)])
+    assert [song["local_path"] for song in library.get_missing_downloads()] == [
+        str(single)
+    ]
+
+    # Nothing is left uncommitted on the writer for the next scan
+    assert not library.db_conn.connection.in_transaction
+
+
+def test_moved_download_replaces_the_cached_song_at_its_new_path(library):
+    old = library.songs_dir / "Song.mp3"
+    new = library.songs_dir / "Renamed.mp3"
+    old.write_bytes(AUDIO)
+    save_download(old, "")
+    library.scan()
+
+    old.rename(new)
+    # The new path was cached already, e.g. by a search of the library
+    from aurras.core.cache.updater import UpdateSearchHistoryDatabase
+
+    UpdateSearchHistoryDatabase().save_to_cache("renamed", "Song", str(new))
+    result = library.scan()
+
+    assert result.moved == 1
+    assert download_paths(library) == {"": str(new)}
+    assert cached_urls() == [str(new)]
@@ -0,0 +1,124 @@
+"""
+Tests for starting playback in the MPV player.
+
+libmpv is replaced by a stub that records what the player queues, so these
+tests run without mpv installed.
+"""
+
+import sys
+import types
+import importlib
+
+import pytest
+
+YOUTUBE_URL = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+RECORDING = "/cache/dQw4w9WgXcQ.part"
+LOCAL_FILE = "/music/Local Song.mp3"
+
+
+class ShutdownError(SystemError):
+    """Stand-in for the error python-mpv raises once mpv has terminated."""
+
+
+class StubMPV:
+    """Stand-in for the python-mpv MPV class that records queued entries."""
+
+    def __init__(self, *args, **kwargs):
+        self.appended = []
+        self.played_index = None
+        self.properties = {}
+
+    def property_observer(self, name):
+        return lambda callback: callback
+
+    def event_callback(self, *event_types):
+        return lambda callback: callback
+
+    def on_key_press(self, key):
+        return lambda callback: callback
+
+    def register_key_binding(self, *args, **kwargs):
+        pass
+
+    def observe_property(self, name, callback):
+        pass
+
+    def unobserve_property(self, name, callback):
+        pass
+
+    def _set_property(self, name, value):
+        self.properties[name] = value
+
+    def playlist_append(self, filename, **options):
+        self.appended.append((filename, options))
+
+    @property
+    def playlist_count(self):
+        return len(self.appended)
+
+    def playlist_play_index(self, index):
+        self.played_index = index
+
+    def wait_for_playback(self):
+        # Playback ends the way it does when the user quits
+        raise ShutdownError("Core shutdown")
+
+    def terminate(self):
+        pass
+
+
+class StubAudioCache:
+    """Audio cache that has nothing cached and records YouTube streams."""
+
+    def lookup(self, url):
+        return None
+
+    def recording_path(self, url):
+        return RECORDING if "youtube" in url else None
+
+
+class StubHistory:
+    """History manager that discards listening time."""
+
+    def record_listen(self, *args):
+        pass
+
+
+@pytest.fixture
+def core(monkeypatch):
+    """The player module, imported against the stubbed mpv bindings."""
+    python_mpv = types.ModuleType("aurras.core.player.python_mpv")
+    python_mpv.MPV = StubMPV
+    python_mpv.MpvEventEndFile = object
+    python_mpv.MpvEventID = types.SimpleNamespace(FILE_LOADED=8, SEEK=20, END_FILE=7)
+    python_mpv.ShutdownError = ShutdownError
+    monkeypatch.setitem(sys.modules, "aurras.core.player.python_mpv", python_mpv)
+    for name in ("aurras.core.player.mpv", "aurras.core.player.mpv.core"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    module = importlib.import_module("aurras.core.player.mpv.core")
+    monkeypatch.setattr(module, "AudioCache", StubAudioCache)
+    monkeypatch.setattr(module, "RecentlyPlayedManager", StubHistory)
+    monkeypatch.setattr(module, "LyricsManager", lambda: None)
+    # The display runs until playback stops; it isn't what's tested here
+    monkeypatch.setattr(module.MPVPlayer, "_start_display", lambda self, name: None)
+    return module
+
+
+def test_player_queues_entries_with_their_options(core):
+    player = core.MPVPlayer()
+
+    result = player.player(
+        [YOUTUBE_URL, LOCAL_FILE, ""],
+        ["Streamed Song", "Local Song", "Missing Song"],
+        show_lyrics=False,
+        start_index=1,
+    )
+
+    assert result == 0
+    assert player.appended == [
+        (YOUTUBE_URL, {"stream-record": core.quote_option(RECORDING)}),
+        (LOCAL_FILE, {}),
+        ("null://", {}),
+    ]
+    assert player.played_index == 1